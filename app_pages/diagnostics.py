@@ -0,0 +1,340 @@
+"""
+Render instrumentation for the dashboard
+
+MultiPage.run dispatches every page through RenderMonitor.measure, which
+records the rerun's wall time, CPU time (of the script thread), time
+spent loading model artifacts, the number of figures rendered and, for a
+sampled fraction of reruns, peak traced memory growth (tracemalloc
+roughly triples the cost of a rerun it traces). Records go to an
+in-process ring buffer, shown on the hidden diagnostics page (open the
+app with ?diagnostics=1), and are appended to a JSON-lines log.
+
+A configurable fraction of reruns is also run under cProfile and the
+stats saved next to the log. Configuration comes from the environment:
+
+    TRADECARE_RENDER_LOG     JSON-lines log path ('' disables the log)
+    TRADECARE_MEMORY_RATE    Fraction of reruns memory-traced (default 0.1)
+    TRADECARE_PROFILE_RATE   Fraction of reruns profiled (default 0)
+
+Memory and model-load figures are process-wide counters read before
+and after the page, so concurrent sessions can inflate each other's
+numbers; wall and CPU time are per rerun.
+"""
+
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from collections import deque
+from dataclasses import dataclass, asdict
+from datetime import datetime
+
+import streamlit as st
+
+from app_pages import figure_cache
+
+# Renders kept in memory for the diagnostics page
+RING_SIZE = 500
+
+# Defaults of the environment settings
+RENDER_LOG = 'outputs/logs/page_renders.jsonl'
+MEMORY_RATE = 0.1
+PROFILE_DIR = 'outputs/logs/profiles'
+
+# Sidebar title of the hidden page and the query parameter showing it
+DIAGNOSTICS_TITLE = "🩺 Diagnostics"
+DIAGNOSTICS_PARAM = "diagnostics"
+
+
+@dataclass
+class RenderRecord:
+    """
+    Cost of one page rerun.
+
+    Attributes:
+        page (str): Page title
+        started_at (str): ISO timestamp of the rerun
+        wall_seconds (float): Wall-clock time of the page body
+        cpu_seconds (float): CPU time of the script thread
+        peak_memory_mb (float): Peak traced heap growth, or None if
+            this rerun was not memory-traced
+        model_load_seconds (float): Time spent loading model artifacts
+        figures_rendered (int): Figures drawn (cache misses)
+        error (str): Exception raised by the page, or None
+        profile_path (str): cProfile stats file if this rerun was
+            sampled, or None
+    """
+    page: str
+    started_at: str
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    peak_memory_mb: float = None
+    model_load_seconds: float = 0.0
+    figures_rendered: int = 0
+    error: str = None
+    profile_path: str = None
+
+
+class RenderMonitor:
+    """
+    Measures page dispatches and keeps the most recent records.
+
+    Attributes:
+        records (deque): Latest RenderRecords, oldest first
+        log_path (str): JSON-lines log, or None
+        memory_rate (float): Fraction of reruns traced with tracemalloc
+        profile_rate (float): Fraction of reruns run under cProfile
+        profile_dir (str): Where sampled profiles are saved
+    """
+
+    def __init__(self, ring_size=RING_SIZE, log_path=RENDER_LOG,
+                 memory_rate=MEMORY_RATE, profile_rate=0.0,
+                 profile_dir=PROFILE_DIR):
+        self.records = deque(maxlen=ring_size)
+        self.log_path = log_path or None
+        self.memory_rate = memory_rate
+        self.profile_rate = profile_rate
+        self.profile_dir = profile_dir
+        self._lock = threading.Lock()
+        self._tracing = 0
+        # cProfile allows one active profiler per process
+        self._profile_lock = threading.Lock()
+
+    @classmethod
+    def from_environment(cls):
+        """
+        Monitor configured from TRADECARE_RENDER_LOG,
+        TRADECARE_MEMORY_RATE and TRADECARE_PROFILE_RATE.
+        """
+        return cls(
+            log_path=os.environ.get('TRADECARE_RENDER_LOG', RENDER_LOG),
+            memory_rate=float(os.environ.get('TRADECARE_MEMORY_RATE',
+                                             MEMORY_RATE)),
+            profile_rate=float(os.environ.get('TRADECARE_PROFILE_RATE', 0)),
+        )
+
+    def measure(self, title, func):
+        """
+        Run a page body and record its cost.
+
+        Exceptions (including Streamlit's st.stop/rerun control flow)
+        propagate after the record is stored.
+
+        Args:
+            title (str): Page title
+            func (callable): Page body function
+
+        Returns:
+            RenderRecord: The stored record
+        """
+        record = RenderRecord(page=title,
+                              started_at=datetime.now().isoformat())
+        profiler = self._start_profiler()
+        traced = random.random() < self.memory_rate
+        if traced:
+            self._start_tracing()
+            tracemalloc.reset_peak()
+            memory_start = tracemalloc.get_traced_memory()[0]
+        load_start = _model_load_seconds()
+        figures_start = figure_cache.render_count
+        cpu_start = time.thread_time()
+        wall_start = time.perf_counter()
+        try:
+            func()
+        except Exception as e:
+            record.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            record.wall_seconds = time.perf_counter() - wall_start
+            record.cpu_seconds = time.thread_time() - cpu_start
+            record.figures_rendered = figure_cache.render_count - figures_start
+            record.model_load_seconds = _model_load_seconds() - load_start
+            if traced:
+                record.peak_memory_mb = max(
+                    tracemalloc.get_traced_memory()[1] - memory_start, 0
+                ) / 1024**2
+                self._stop_tracing()
+            if profiler is not None:
+                record.profile_path = self._save_profile(profiler, record)
+            self._store(record)
+        return record
+
+    def recent(self):
+        """
+        Snapshot of the ring buffer, oldest first.
+        """
+        with self._lock:
+            return list(self.records)
+
+    def _start_profiler(self):
+        """
+        Internal function: Start cProfile for a sampled rerun, or None.
+        """
+        if self.profile_rate <= 0 or random.random() >= self.profile_rate:
+            return None
+        if not self._profile_lock.acquire(blocking=False):
+            return None
+        import cProfile
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiler (e.g. a developer's) is active
+            self._profile_lock.release()
+            return None
+        return profiler
+
+    def _save_profile(self, profiler, record):
+        """
+        Internal function: Stop the profiler and write its stats.
+        """
+        profiler.disable()
+        self._profile_lock.release()
+        os.makedirs(self.profile_dir, exist_ok=True)
+        slug = re.sub(r'[^a-z0-9]+', '_', record.page.lower()).strip('_')
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+        path = os.path.join(self.profile_dir, f"{stamp}_{slug}.prof")
+        profiler.dump_stats(path)
+        return path
+
+    def _start_tracing(self):
+        """
+        Internal function: Start tracemalloc for the first active rerun.
+        """
+        with self._lock:
+            if self._tracing == 0 and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._tracing = 1
+            elif self._tracing > 0:
+                self._tracing += 1
+
+    def _stop_tracing(self):
+        """
+        Internal function: Stop tracemalloc after the last active rerun.
+        """
+        with self._lock:
+            if self._tracing > 0:
+                self._tracing -= 1
+                if self._tracing == 0:
+                    tracemalloc.stop()
+
+    def _store(self, record):
+        """
+        Internal function: Add to the ring buffer and the log.
+        """
+        with self._lock:
+            self.records.append(record)
+            if self.log_path is None:
+                return
+            try:
+                log_dir = os.path.dirname(self.log_path)
+                if log_dir:
+                    os.makedirs(log_dir, exist_ok=True)
+                with open(self.log_path, 'a') as f:
+                    f.write(json.dumps(asdict(record), ensure_ascii=False) + '\n')
+            except OSError:
+                # A read-only filesystem must not break the page
+                self.log_path = None
+
+
+@st.cache_resource
+def get_render_monitor():
+    """
+    Shared render monitor (one per server process)
+    """
+    return RenderMonitor.from_environment()
+
+
+def diagnostics_enabled():
+    """
+    True if the app was opened with ?diagnostics=1
+    """
+    return st.query_params.get(DIAGNOSTICS_PARAM, '') not in ('', '0', 'false')
+
+
+def diagnostics_page_body():
+    """
+    Hidden page: recent render costs, model and prediction cache state
+    """
+    import io
+    import pstats
+
+    import pandas as pd
+
+    monitor = get_render_monitor()
+    recent = monitor.recent()
+    st.markdown("## 🩺 Render Diagnostics")
+    st.caption(
+        f"Last {len(recent)} of at most {monitor.records.maxlen} "
+        f"page reruns in this process · log: {monitor.log_path or 'off'} · "
+        f"memory-traced fraction: {monitor.memory_rate:g} · "
+        f"profiled fraction: {monitor.profile_rate:g}"
+    )
+
+    records = pd.DataFrame([asdict(record) for record in recent])
+    if records.empty:
+        st.info("No page reruns recorded yet. Open a page from the sidebar.")
+    else:
+        st.markdown("### ⏱️ Per-Page Summary")
+        summary = records.groupby('page').agg(
+            reruns=('wall_seconds', 'size'),
+            wall_p50_ms=('wall_seconds', lambda s: s.median() * 1000),
+            wall_p95_ms=('wall_seconds', lambda s: s.quantile(0.95) * 1000),
+            cpu_mean_ms=('cpu_seconds', lambda s: s.mean() * 1000),
+            peak_memory_max_mb=('peak_memory_mb', 'max'),
+            model_load_ms=('model_load_seconds', lambda s: s.sum() * 1000),
+            figures=('figures_rendered', 'sum'),
+            errors=('error', 'count'),
+        )
+        st.dataframe(summary.round(2), use_container_width=True)
+
+        st.markdown("### 🧾 Recent Reruns")
+        st.dataframe(records.iloc[::-1].head(50), use_container_width=True,
+                     hide_index=True)
+
+    st.markdown("### 🤖 Models & Prediction Cache")
+    from src.data_management import get_model_store, get_prediction_cache
+    store = get_model_store()
+    model_version = store.loaded
+    col1, col2 = st.columns(2)
+    with col1:
+        if model_version is None:
+            st.info("Models not loaded yet")
+        else:
+            st.json({
+                'version': model_version.version,
+                'loaded_at': datetime.fromtimestamp(
+                    model_version.loaded_at).isoformat(timespec='seconds'),
+                'reloads': store.reloads,
+                'last_error': repr(store.last_error) if store.last_error else None,
+                'load_seconds': model_version.registry.load_times,
+            })
+    with col2:
+        st.json(get_prediction_cache().stats())
+
+    profiled = [record for record in recent if record.profile_path]
+    if profiled:
+        st.markdown("### 🔬 Sampled Profiles")
+        choice = st.selectbox(
+            "Profile", profiled[::-1],
+            format_func=lambda r: f"{r.started_at} · {r.page} · "
+                                  f"{r.wall_seconds * 1000:.0f} ms"
+        )
+        output = io.StringIO()
+        pstats.Stats(choice.profile_path, stream=output) \
+            .sort_stats('cumulative').print_stats(25)
+        st.code(output.getvalue())
+
+
+def _model_load_seconds():
+    """
+    Internal function: Total model artifact load time of the process
+    (0 until the model registry module is imported, to keep it out of
+    app startup).
+    """
+    module = sys.modules.get('src.model_registry')
+    return 0.0 if module is None else module.ModelRegistry.total_load_seconds
@@ -0,0 +1,91 @@
+"""
+Render-once helpers for the static pages
+
+The figures and styled tables on the Data Study and Technical Overview
+pages depend only on literals, so they are rendered once per process
+(inside st.cache_data functions) and every rerun serves the cached
+bytes instead of running matplotlib again.
+"""
+
+import io
+
+# Same output as st.pyplot: PNG at 200 dpi, cropped to the drawn area
+FIGURE_DPI = 200
+
+# Widest image Streamlit sends (2 x its 730 px content width); wider
+# images are downscaled by st.image on every call, so do it once here
+MAX_IMAGE_WIDTH = 1460
+
+# Figures actually rendered by this process (cache misses)
+render_count = 0
+
+
+def figure_png(fig):
+    """
+    Render a matplotlib figure to PNG bytes and close it
+
+    Args:
+        fig (Figure): Figure to render
+
+    Returns:
+        bytes: PNG image, shown with st.image(png, width='stretch')
+    """
+    global render_count
+    import matplotlib.pyplot as plt
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=FIGURE_DPI, bbox_inches='tight')
+    plt.close(fig)
+    render_count += 1
+
+    image = Image.open(buffer)
+    if image.width <= MAX_IMAGE_WIDTH:
+        return buffer.getvalue()
+    height = int(1.0 * image.height * MAX_IMAGE_WIDTH / image.width)
+    image = image.resize((MAX_IMAGE_WIDTH, height), resample=Image.BILINEAR)
+    resized = io.BytesIO()
+    image.save(resized, format='PNG')
+    return resized.getvalue()
+
+
+def gradient_css(df, subset, cmap, vmin, vmax):
+    """
+    CSS of Styler.background_gradient, computed once
+
+    Streamlit recomputes every Styler it displays, so caching the
+    Styler itself would still run the colormap each rerun; caching the
+    resulting CSS and applying it with static_styler() does not.
+
+    Args:
+        df (pd.DataFrame): Table to style
+        subset (list): Columns with the gradient
+        cmap (str): Matplotlib colormap name
+        vmin, vmax (float): Colormap range
+
+    Returns:
+        pd.DataFrame: CSS string per cell (empty where unstyled)
+    """
+    styler = df.style.background_gradient(subset=subset, cmap=cmap,
+                                          vmin=vmin, vmax=vmax)
+    styler._compute()
+    css = df.astype(str).copy()
+    css.loc[:, :] = ''
+    for (row, col), styles in styler.ctx.items():
+        css.iat[row, col] = '; '.join(f"{prop}: {value}" for prop, value in styles)
+    return css
+
+
+def static_styler(df, css):
+    """
+    Styler applying precomputed CSS (see gradient_css)
+
+    Args:
+        df (pd.DataFrame): Table to display
+        css (pd.DataFrame): CSS string per cell
+
+    Returns:
+        Styler: Cheap to compute on every rerun
+    """
+    return df.style.apply(lambda _: css, axis=None)
+
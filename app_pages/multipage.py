@@ -1,8 +1,23 @@
+import importlib
+
 import streamlit as st
 
+from app_pages.diagnostics import (
+    DIAGNOSTICS_TITLE, diagnostics_enabled, diagnostics_page_body,
+    get_render_monitor
+)
+
 class MultiPage:
     """
     Class to manage multiple Streamlit pages
+    
+    Pages can be given as "module:function" paths; a page's module is
+    only imported when the page is first shown, so app startup does not
+    pay for the plotting and ML libraries of pages nobody opened
+    
+    Every page rerun is measured by the shared RenderMonitor (see
+    app_pages/diagnostics.py); opening the app with ?diagnostics=1 adds
+    a Diagnostics page showing the results
     """
     
     def __init__(self, app_name):
@@ -18,7 +33,16 @@ class MultiPage:
     def add_page(self, title, func):
         """
         Add a page to the app
+        
+        Args:
+            title (str): Title shown in the sidebar
+            func (callable or str): Page body function, or its
+                "module:function" path (imported on first navigation)
         """
+        if isinstance(func, str) and ':' not in func:
+            raise ValueError(
+                f"Page path must look like 'module:function', got '{func}'"
+            )
         self.pages.append({
             "title": title,
             "function": func
@@ -34,6 +58,9 @@ class MultiPage:
         # Sidebar navigation
         st.sidebar.title("🧭 Navigation")
         page_titles = [page["title"] for page in self.pages]
+        show_diagnostics = diagnostics_enabled()
+        if show_diagnostics:
+            page_titles.append(DIAGNOSTICS_TITLE)
         page = st.sidebar.radio("Go to:", page_titles)
         
         # Warning banner
@@ -57,8 +84,23 @@ class MultiPage:
         [GitHub Dataset](https://github.com/mouadja02/bitcoin-hourly-ohclv-dataset)
         """)
         
-        # Run selected page
+        # Run selected page (measured: time, memory, model loads, figures)
+        if show_diagnostics and page == DIAGNOSTICS_TITLE:
+            diagnostics_page_body()
+            return
         for page_dict in self.pages:
             if page_dict["title"] == page:
-                page_dict["function"]()
-                break
\ No newline at end of file
+                get_render_monitor().measure(page, self._resolve(page_dict))
+                break
+    
+    def _resolve(self, page_dict):
+        """
+        Internal function: Page body function, importing its module if
+        the page was added as a "module:function" path
+        """
+        func = page_dict["function"]
+        if isinstance(func, str):
+            module_name, _, function_name = func.partition(':')
+            func = getattr(importlib.import_module(module_name), function_name)
+            page_dict["function"] = func
+        return func
\ No newline at end of file
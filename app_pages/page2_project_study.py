@@ -1,7 +1,6 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+from app_pages.figure_cache import figure_png, gradient_css, static_styler
 
 def page2_project_study_body():
     """
@@ -73,23 +72,15 @@ def page2_project_study_body():
     
     corr_df = pd.DataFrame(correlation_data)
     
-    # Bar chart
-    fig, ax = plt.subplots(figsize=(10, 8))
-    colors = ['green' if x > 0 else 'red' for x in corr_df['Correlation']]
-    ax.barh(corr_df['Feature'], corr_df['Correlation'], color=colors, alpha=0.7)
-    ax.axvline(x=0, color='black', linestyle='--', linewidth=1)
-    ax.set_xlabel('Correlation with Profitability', fontsize=12)
-    ax.set_title('Feature Correlation Analysis', fontsize=14, fontweight='bold')
-    ax.grid(axis='x', alpha=0.3)
-    plt.tight_layout()
-    st.pyplot(fig)
+    # Bar chart (rendered once per process)
+    st.image(correlation_chart_png(corr_df), width='stretch')
     
     st.markdown("---")
     
     # Correlation table
     st.markdown("### 📋 Detailed Correlation Table")
     st.dataframe(
-        corr_df.style.background_gradient(subset=['Correlation'], cmap='RdYlGn', vmin=-0.4, vmax=0.4),
+        static_styler(corr_df, correlation_table_css(corr_df)),
         use_container_width=True
     )
     
@@ -246,4 +237,31 @@ def page2_project_study_body():
     
     **Conclusion:** Weak correlations are NOT due to data quality issues.
     The challenge is inherent to short-term prediction.
-    """)
\ No newline at end of file
+    """)
+
+
+@st.cache_data(show_spinner=False)
+def correlation_chart_png(corr_df):
+    """
+    Feature correlation bar chart as PNG bytes (cached per process)
+    """
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(10, 8))
+    colors = ['green' if x > 0 else 'red' for x in corr_df['Correlation']]
+    ax.barh(corr_df['Feature'], corr_df['Correlation'], color=colors, alpha=0.7)
+    ax.axvline(x=0, color='black', linestyle='--', linewidth=1)
+    ax.set_xlabel('Correlation with Profitability', fontsize=12)
+    ax.set_title('Feature Correlation Analysis', fontsize=14, fontweight='bold')
+    ax.grid(axis='x', alpha=0.3)
+    plt.tight_layout()
+    return figure_png(fig)
+
+
+@st.cache_data(show_spinner=False)
+def correlation_table_css(corr_df):
+    """
+    Correlation gradient of the detailed table (cached per process)
+    """
+    return gradient_css(corr_df, subset=['Correlation'], cmap='RdYlGn',
+                        vmin=-0.4, vmax=0.4)
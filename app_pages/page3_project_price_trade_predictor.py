@@ -1,7 +1,22 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-from src.data_management import load_models
+from src.data_management import get_model_version, get_prediction_cache
+from src.prediction_cache import quantize_inputs
+
+# Quantization steps of the inputs, in the order they form the cache key:
+# the slider steps (sliders snap to them); the price inputs take any typed
+# integer, so they are keyed on the exact dollar value
+INPUT_STEPS = (
+    0.1, 0.1, 0.1, 0.1,     # returns (%)
+    0.5,                    # RSI
+    1, 1, 1, 1,             # current price, MA10, MA20, MA50 ($)
+    1.0, 0.1,               # volume change (%), volume ratio
+    0.001, 0.001,           # volatility, price range
+)
+
+# Hours ahead shown (the output used from multi-horizon models)
+PREDICTION_HORIZON = 4
 
 def page3_project_price_trade_predictor_body():
     """
@@ -26,13 +41,25 @@ def page3_project_price_trade_predictor_body():
     
     st.markdown("---")
     
-    # Load models
-    reg_model, clf_model, scaler, feature_names = load_models()
+    # Load models (scaler and both models folded into one linear bundle);
+    # this run keeps using this version even if a new one is published
+    model_version = get_model_version()
     
-    if reg_model is None:
+    if model_version is None:
         st.error("❌ Models not loaded. Please ensure model files exist in outputs/models/")
         st.stop()
     
+    # Multi-output versions: serve the 4-hour output the page describes
+    try:
+        bundle = model_version.bundle.select(PREDICTION_HORIZON)
+    except ValueError:
+        st.error(
+            f"❌ Model version {model_version.version} has no "
+            f"{PREDICTION_HORIZON}-hour output. Available horizons: "
+            f"{', '.join(f'{h}h' for h in model_version.horizons)}"
+        )
+        st.stop()
+    
     # Instructions
     st.markdown("### 📊 How to Use This Tool")
     st.info("""
@@ -108,7 +135,7 @@ def page3_project_price_trade_predictor_body():
     if st.button("🔮 Get Predictions", type="primary", use_container_width=True):
         
         # Prepare features (convert to decimals)
-        features = np.array([[
+        features = np.array([
             return_1h / 100,
             return_4h / 100,
             return_12h / 100,
@@ -123,15 +150,21 @@ def page3_project_price_trade_predictor_body():
             volume_ratio,
             volatility_24h,
             price_range
-        ]])
-        
-        # Scale features
-        features_scaled = scaler.transform(features)
+        ])
         
-        # Make predictions
-        reg_prediction = reg_model.predict(features_scaled)[0]
-        clf_prediction = clf_model.predict(features_scaled)[0]
-        clf_probability = clf_model.predict_proba(features_scaled)[0][1]
+        # Make predictions (scaling is folded into the bundle), memoized
+        # across sessions on the quantized inputs and the model version
+        cache_key = quantize_inputs(
+            (return_1h, return_4h, return_12h, return_24h, rsi,
+             current_price, ma_10, ma_20, ma_50,
+             volume_change, volume_ratio, volatility_24h, price_range),
+            INPUT_STEPS
+        )
+        reg_prediction, clf_prediction, clf_probability = \
+            get_prediction_cache().get_or_compute(
+                cache_key, model_version.version,
+                lambda: bundle.predict(features)
+            )
         
         st.markdown("---")
         st.markdown("## 🎯 Prediction Results")
@@ -1,8 +1,6 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import numpy as np
+from app_pages.figure_cache import figure_png
 
 def page5_technical_overview_body():
     """
@@ -118,25 +116,7 @@ def page5_technical_overview_body():
     # Visualization placeholder
     st.markdown("#### Predicted vs Actual (Conceptual)")
     
-    fig, ax = plt.subplots(figsize=(8, 6))
-    
-    # Generate sample data to show pattern
-    np.random.seed(42)
-    actual = np.random.normal(0, 0.02, 1000)
-    predicted = np.random.normal(0, 0.005, 1000)  # Tighter distribution
-    
-    ax.scatter(actual, predicted, alpha=0.3, s=10)
-    ax.plot([actual.min(), actual.max()], [actual.min(), actual.max()], 
-            'r--', lw=2, label='Perfect Prediction')
-    ax.axhline(y=0, color='gray', linestyle=':', alpha=0.5)
-    ax.axvline(x=0, color='gray', linestyle=':', alpha=0.5)
-    ax.set_xlabel('Actual Return')
-    ax.set_ylabel('Predicted Return')
-    ax.set_title('Regression: Predicted vs Actual (Test Set)\nR² = -0.037')
-    ax.legend()
-    ax.grid(True, alpha=0.3)
-    plt.tight_layout()
-    st.pyplot(fig)
+    st.image(regression_scatter_png(), width='stretch')
     
     st.caption("Note: Predictions cluster near zero, showing model defaults to 'no change' guess")
     
@@ -213,18 +193,8 @@ def page5_technical_overview_body():
     col1, col2 = st.columns([1, 1])
     
     with col1:
-        # Create sample confusion matrix
-        fig, ax = plt.subplots(figsize=(6, 5))
-        cm = np.array([[4800, 4700], [4900, 4800]])
-        sns.heatmap(cm, annot=True, fmt='d', cmap='Blues', ax=ax,
-                    xticklabels=['Not Profitable', 'Profitable'],
-                    yticklabels=['Not Profitable', 'Profitable'],
-                    cbar_kws={'label': 'Count'})
-        ax.set_ylabel('Actual Class')
-        ax.set_xlabel('Predicted Class')
-        ax.set_title('Confusion Matrix\nAccuracy: 51.04%')
-        plt.tight_layout()
-        st.pyplot(fig)
+        # Sample confusion matrix (rendered once per process)
+        st.image(confusion_matrix_png(), width='stretch')
     
     with col2:
         st.markdown("""
@@ -418,4 +388,55 @@ def page5_technical_overview_body():
     
     Assessment focuses on demonstrating ML workflow and honest evaluation,
     not on achieving high accuracy.
-    """)
\ No newline at end of file
+    """)
+
+
+@st.cache_data(show_spinner=False)
+def regression_scatter_png():
+    """
+    Conceptual predicted vs actual scatter as PNG bytes (cached per process)
+    """
+    import matplotlib.pyplot as plt
+    import numpy as np
+
+    fig, ax = plt.subplots(figsize=(8, 6))
+
+    # Generate sample data to show pattern
+    np.random.seed(42)
+    actual = np.random.normal(0, 0.02, 1000)
+    predicted = np.random.normal(0, 0.005, 1000)  # Tighter distribution
+
+    ax.scatter(actual, predicted, alpha=0.3, s=10)
+    ax.plot([actual.min(), actual.max()], [actual.min(), actual.max()],
+            'r--', lw=2, label='Perfect Prediction')
+    ax.axhline(y=0, color='gray', linestyle=':', alpha=0.5)
+    ax.axvline(x=0, color='gray', linestyle=':', alpha=0.5)
+    ax.set_xlabel('Actual Return')
+    ax.set_ylabel('Predicted Return')
+    ax.set_title('Regression: Predicted vs Actual (Test Set)\nR² = -0.037')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    plt.tight_layout()
+    return figure_png(fig)
+
+
+@st.cache_data(show_spinner=False)
+def confusion_matrix_png():
+    """
+    Sample confusion matrix heatmap as PNG bytes (cached per process)
+    """
+    import matplotlib.pyplot as plt
+    import numpy as np
+    import seaborn as sns
+
+    fig, ax = plt.subplots(figsize=(6, 5))
+    cm = np.array([[4800, 4700], [4900, 4800]])
+    sns.heatmap(cm, annot=True, fmt='d', cmap='Blues', ax=ax,
+                xticklabels=['Not Profitable', 'Profitable'],
+                yticklabels=['Not Profitable', 'Profitable'],
+                cbar_kws={'label': 'Count'})
+    ax.set_ylabel('Actual Class')
+    ax.set_xlabel('Predicted Class')
+    ax.set_title('Confusion Matrix\nAccuracy: 51.04%')
+    plt.tight_layout()
+    return figure_png(fig)
@@ -0,0 +1,106 @@
+"""
+Benchmark: single-pass NumPy feature matrix vs the notebook's pandas cells.
+
+Compares the feature cells of 3_FeatureEngineering.ipynb (one
+pct_change / rolling pass per feature on a DataFrame) with
+src.features.feature_matrix, and reports the largest difference
+between the two results in units of each feature's standard deviation.
+
+Usage (from the project root):
+    python -m benchmarks.bench_features [n_rows ...]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from benchmarks.synthetic_data import make_raw_ohlcv
+from src.data_schema import FEATURE_COLUMNS
+from src.features import feature_matrix
+
+
+DEFAULT_SIZES = [100_000, 1_000_000, 10_000_000]
+
+
+def legacy_features(df):
+    """
+    The notebook's feature cells, verbatim.
+    """
+    df['return_1h'] = df['CLOSE_PRICE'].pct_change(1)
+    df['return_4h'] = df['CLOSE_PRICE'].pct_change(4)
+    df['return_12h'] = df['CLOSE_PRICE'].pct_change(12)
+    df['return_24h'] = df['CLOSE_PRICE'].pct_change(24)
+
+    delta = df['CLOSE_PRICE'].diff()
+    gain = delta.where(delta > 0, 0)
+    loss = -delta.where(delta < 0, 0)
+    avg_gain = gain.rolling(window=14).mean()
+    avg_loss = loss.rolling(window=14).mean()
+    rs = avg_gain / avg_loss
+    df['rsi'] = 100 - (100 / (1 + rs))
+
+    df['ma_10'] = df['CLOSE_PRICE'].rolling(window=10).mean()
+    df['ma_20'] = df['CLOSE_PRICE'].rolling(window=20).mean()
+    df['ma_50'] = df['CLOSE_PRICE'].rolling(window=50).mean()
+    df['dist_from_ma10'] = (df['CLOSE_PRICE'] - df['ma_10']) / df['ma_10']
+    df['dist_from_ma20'] = (df['CLOSE_PRICE'] - df['ma_20']) / df['ma_20']
+
+    df['volume_change'] = df['VOLUME_FROM'].pct_change(1)
+    df['volume_ma_10'] = df['VOLUME_FROM'].rolling(window=10).mean()
+    df['volume_ratio'] = df['VOLUME_FROM'] / df['volume_ma_10']
+
+    df['volatility_24h'] = df['return_1h'].rolling(window=24).std()
+    df['price_range'] = (df['HIGH_PRICE'] - df['LOW_PRICE']) / df['CLOSE_PRICE']
+    return df
+
+
+def max_scaled_error(expected, actual):
+    """
+    Largest |actual - expected| over all columns, in units of each
+    column's standard deviation (the scale the models see after
+    StandardScaler). NaN/inf positions must match exactly, else inf.
+    """
+    worst = 0.0
+    for col in range(expected.shape[1]):
+        exp, act = expected[:, col], actual[:, col]
+        finite = np.isfinite(exp)
+        if not np.array_equal(exp[~finite], act[~finite], equal_nan=True):
+            return float('inf')
+        scale = max(np.std(exp[finite]), 1e-300)
+        worst = max(worst, np.max(np.abs(act[finite] - exp[finite])) / scale)
+    return float(worst)
+
+
+def _time(func, *args, repeat=3):
+    """
+    Best wall time of func(*args) over repeat runs, and its last result.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main(sizes):
+    print(f"{'rows':>12} {'pandas (s)':>12} {'numpy (s)':>12} "
+          f"{'speedup':>9} {'max err/std':>12}")
+    for n_rows in sizes:
+        columns = ['CLOSE_PRICE', 'HIGH_PRICE', 'LOW_PRICE', 'VOLUME_FROM']
+        df = make_raw_ohlcv(n_rows)[columns].astype('float64')
+        repeat = 1 if n_rows >= 10_000_000 else 3
+        legacy, expected = _time(lambda: legacy_features(df.copy()),
+                                 repeat=repeat)
+        engine, actual = _time(feature_matrix, df, repeat=repeat)
+        error = max_scaled_error(
+            expected[FEATURE_COLUMNS].to_numpy(), actual
+        )
+        print(f"{n_rows:>12,} {legacy:>12.3f} {engine:>12.3f} "
+              f"{legacy / engine:>8.1f}x {error:>12.1e}")
+        del df, expected, actual
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
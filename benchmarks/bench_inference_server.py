@@ -0,0 +1,139 @@
+"""
+Benchmark: latency of the inference server endpoints under load.
+
+Starts src.inference_server under uvicorn in a subprocess on a local
+port (or targets --url), then sends requests from concurrent httpx
+clients and reports throughput and p50/p99 latency per endpoint:
+single-row JSON, a JSON batch and an Arrow IPC batch.
+
+Usage (from the project root):
+    python -m benchmarks.bench_inference_server [n_requests]
+        [--concurrency N] [--batch-rows N] [--url http://host:port]
+"""
+
+import argparse
+import asyncio
+import socket
+import subprocess
+import sys
+import time
+
+import httpx
+import numpy as np
+import pyarrow as pa
+
+from src.inference_server import ARROW_TYPE
+
+
+DEFAULT_REQUESTS = 2_000
+DEFAULT_CONCURRENCY = 16
+DEFAULT_BATCH_ROWS = 1_000
+
+
+def make_payloads(feature_names, batch_rows, seed=0):
+    """
+    Request bodies for each endpoint, from random feature rows.
+    """
+    rng = np.random.default_rng(seed)
+    rows = rng.normal(size=(batch_rows, len(feature_names)))
+    table = pa.table({name: rows[:, i] for i, name in enumerate(feature_names)})
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return {
+        '/predict': {'json': {'features': dict(zip(feature_names,
+                                                   rows[0].tolist()))}},
+        '/predict/batch': {'json': {'features': rows.tolist()}},
+        '/predict/arrow': {'content': sink.getvalue().to_pybytes(),
+                           'headers': {'content-type': ARROW_TYPE.decode()}},
+    }
+
+
+async def load_test(url, path, request, n_requests, concurrency):
+    """
+    Send n_requests POSTs from concurrency clients.
+
+    Returns:
+        tuple: (latencies in seconds, total wall seconds)
+    """
+    latencies = []
+    remaining = iter(range(n_requests))
+
+    async def worker(client):
+        for _ in remaining:
+            start = time.perf_counter()
+            response = await client.post(path, **request)
+            latencies.append(time.perf_counter() - start)
+            response.raise_for_status()
+
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits) as client:
+        await client.post(path, **request)  # warm-up
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+        return np.array(latencies), time.perf_counter() - start
+
+
+def start_server(timeout=30.0):
+    """
+    Run the inference app under uvicorn in a subprocess (so client and
+    server do not share a GIL).
+
+    Returns:
+        tuple: (base URL, subprocess.Popen)
+    """
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    process = subprocess.Popen([
+        sys.executable, '-m', 'uvicorn', 'src.inference_server:app',
+        '--host', '127.0.0.1', '--port', str(port), '--log-level', 'warning',
+    ])
+    url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            httpx.get(f"{url}/health").raise_for_status()
+            return url, process
+        except httpx.TransportError:
+            if process.poll() is not None or time.monotonic() > deadline:
+                process.kill()
+                raise RuntimeError("Inference server did not start")
+            time.sleep(0.1)
+
+
+def main(n_requests, concurrency, batch_rows, url=None):
+    process = None
+    if url is None:
+        url, process = start_server()
+    feature_names = httpx.get(f"{url}/health").json()['feature_names']
+    payloads = make_payloads(feature_names, batch_rows)
+
+    print(f"{n_requests:,} requests per endpoint, concurrency {concurrency}, "
+          f"batches of {batch_rows:,} rows")
+    print(f"{'endpoint':<16} {'req/s':>9} {'rows/s':>12} "
+          f"{'p50 (ms)':>9} {'p99 (ms)':>9}")
+    for path, request in payloads.items():
+        latencies, seconds = asyncio.run(
+            load_test(url, path, request, n_requests, concurrency)
+        )
+        rows = 1 if path == '/predict' else batch_rows
+        p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+        print(f"{path:<16} {n_requests / seconds:>9,.0f} "
+              f"{n_requests * rows / seconds:>12,.0f} "
+              f"{p50:>9.2f} {p99:>9.2f}")
+
+    if process is not None:
+        process.terminate()
+        process.wait()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('n_requests', nargs='?', type=int,
+                        default=DEFAULT_REQUESTS)
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument('--batch-rows', type=int, default=DEFAULT_BATCH_ROWS)
+    parser.add_argument('--url', help="Running server (default: start one)")
+    args = parser.parse_args()
+    main(args.n_requests, args.concurrency, args.batch_rows, args.url)
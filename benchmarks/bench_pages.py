@@ -0,0 +1,71 @@
+"""
+Benchmark: full rerun time of each dashboard page.
+
+Runs every page body under streamlit's AppTest (a real script run,
+without a browser) and reports the first run, which renders the cached
+figures and tables, and the best and median of the following reruns,
+which are what every sidebar click or widget change costs.
+
+Usage (from the project root):
+    python -m benchmarks.bench_pages [n_reruns]
+"""
+
+import sys
+import time
+
+from streamlit.testing.v1 import AppTest
+
+
+DEFAULT_RERUNS = 10
+
+PAGES = {
+    'page1_project_summary': 'page1_project_summary_body',
+    'page2_project_study': 'page2_project_study_body',
+    'page3_project_price_trade_predictor':
+        'page3_project_price_trade_predictor_body',
+    'page4_project_hypothesis': 'page4_project_hypothesis_body',
+    'page5_technical_overview': 'page5_technical_overview_body',
+}
+
+
+def page_script(module, function):
+    """
+    Script text that runs one page body.
+    """
+    return (
+        f"from app_pages.{module} import {function}\n"
+        f"{function}()\n"
+    )
+
+
+def time_page(module, function, n_reruns):
+    """
+    First-run seconds and the list of rerun seconds of one page.
+    """
+    app = AppTest.from_string(page_script(module, function),
+                              default_timeout=120)
+    start = time.perf_counter()
+    app.run()
+    first = time.perf_counter() - start
+    if app.exception:
+        raise RuntimeError(f"{module} failed: {app.exception[0].message}")
+
+    reruns = []
+    for _ in range(n_reruns):
+        start = time.perf_counter()
+        app.run()
+        reruns.append(time.perf_counter() - start)
+    return first, sorted(reruns)
+
+
+def main(n_reruns):
+    print(f"{'page':<38} {'first (ms)':>11} {'best (ms)':>10} "
+          f"{'median (ms)':>12}")
+    for module, function in PAGES.items():
+        first, reruns = time_page(module, function, n_reruns)
+        print(f"{module:<38} {first * 1000:>11.1f} {reruns[0] * 1000:>10.1f} "
+              f"{reruns[len(reruns) // 2] * 1000:>12.1f}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RERUNS)
@@ -0,0 +1,69 @@
+"""
+Benchmark: multi-asset pipeline throughput by worker count.
+
+Writes one synthetic raw CSV per symbol (different seeds and price
+levels) to a temporary directory and runs src.pipeline.run_pipeline
+over the basket with 1, 2, 4, ... workers up to the CPU count. Every
+run must produce the same dataset as the single-process one.
+
+    speedup  seconds with 1 worker / seconds with n workers
+             (near n while there are at least n symbols per core)
+
+Usage (from the project root):
+    python -m benchmarks.bench_pipeline [n_symbols] [n_rows]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+from benchmarks.synthetic_data import write_raw_csv
+from src.pipeline import SymbolSource, load_dataset, run_pipeline
+
+
+DEFAULT_SYMBOLS = 8
+DEFAULT_ROWS = 100_000
+
+
+def main(n_symbols, n_rows):
+    cpus = os.cpu_count() or 1
+    counts = sorted({1, cpus} | {2 ** i for i in range(1, 8) if 2 ** i < cpus})
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sources = []
+        for i in range(n_symbols):
+            path = os.path.join(tmp, f"sym{i}.csv")
+            write_raw_csv(path, n_rows, seed=i, base_price=100.0 * 3 ** i)
+            sources.append(SymbolSource(f"SYM{i}", path,
+                                        {'min_rows': n_rows,
+                                         'max_price': float('inf')}))
+
+        print(f"{n_symbols} symbols x {n_rows:,} rows, {cpus} CPUs")
+        print(f"{'workers':>7} {'seconds':>9} {'rows/s':>12} {'speedup':>8}")
+        reference = baseline = None
+        for workers in counts:
+            output_dir = os.path.join(tmp, f"out_{workers}")
+            start = time.perf_counter()
+            table = run_pipeline(sources, output_dir, workers=workers,
+                                 verbose=False)
+            seconds = time.perf_counter() - start
+            failed = table[table['error'].notna()]
+            assert failed.empty, \
+                f"{len(failed)} symbols failed: {failed['error'].iloc[0]}"
+
+            dataset = load_dataset(output_dir)
+            if reference is None:
+                reference, baseline = dataset, seconds
+            else:
+                pd.testing.assert_frame_equal(dataset, reference)
+            print(f"{workers:>7} {seconds:>9.2f} "
+                  f"{n_symbols * n_rows / seconds:>12,.0f} "
+                  f"{baseline / seconds:>8.2f}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SYMBOLS,
+         int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_ROWS)
@@ -0,0 +1,106 @@
+"""
+Benchmark: dashboard startup, eager vs lazy page imports.
+
+Each variant runs in a fresh Python process, so nothing is already
+imported or cached. It measures the time to the first render of the
+default page (Project Summary) under streamlit's AppTest, the number of
+modules the run imported, and which heavy libraries were loaded.
+
+    eager  app.py, app_pages/ and src/ of the baseline commit (all five
+           page modules imported up front, with their module-level
+           matplotlib/seaborn/sklearn imports), extracted with
+           git archive into a temporary directory
+    lazy   app.py: pages added as "module:function", imported on first
+           navigation
+
+Usage (from the project root, in the git checkout):
+    python -m benchmarks.bench_startup [n_runs]
+"""
+
+import io
+import json
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+
+
+DEFAULT_RUNS = 3
+
+HEAVY_MODULES = ['numpy', 'pandas', 'pyarrow', 'matplotlib', 'seaborn',
+                 'sklearn', 'joblib', 'PIL']
+
+# Commit holding the eager app, and the paths the app runs from
+BASELINE_COMMIT = '2ca6186'
+BASELINE_PATHS = ['app.py', 'app_pages', 'src']
+
+# Data directories shared with the baseline checkout (linked, not copied)
+DATA_DIRS = ['inputs', 'outputs']
+
+# Runs in the child process; prints one JSON line
+CHILD = '''
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+
+preloaded = set(sys.modules)
+app = AppTest.from_file('app.py', default_timeout=120)
+start = time.perf_counter()
+app.run()
+seconds = time.perf_counter() - start
+if app.exception:
+    raise RuntimeError(app.exception[0].message)
+print(json.dumps({
+    'seconds': seconds,
+    'modules': len(set(sys.modules) - preloaded),
+    'heavy': [name for name in %r if name in sys.modules],
+}))
+''' % (HEAVY_MODULES,)
+
+
+def measure(app_dir):
+    """
+    First-render seconds, new module count and heavy modules of one
+    cold start of app_dir/app.py.
+    """
+    output = subprocess.run(
+        [sys.executable, '-c', CHILD],
+        cwd=app_dir, capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def extract_baseline(target, commit=BASELINE_COMMIT):
+    """
+    Write the app files of a commit into target.
+
+    Raises:
+        subprocess.CalledProcessError: If git cannot read the commit
+            (not run from the git checkout)
+    """
+    archive = subprocess.run(
+        ['git', 'archive', '--format=tar', commit, *BASELINE_PATHS],
+        capture_output=True, check=True,
+    ).stdout
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        tar.extractall(target, filter='data')
+    for name in DATA_DIRS:
+        if os.path.isdir(name):
+            os.symlink(os.path.abspath(name), os.path.join(target, name))
+
+
+def main(n_runs):
+    with tempfile.TemporaryDirectory() as baseline_dir:
+        extract_baseline(baseline_dir)
+        print(f"{'variant':<8} {'first render (ms)':>18} {'modules':>8}  "
+              f"heavy libraries loaded")
+        for variant, app_dir in [('eager', baseline_dir), ('lazy', '.')]:
+            runs = [measure(app_dir) for _ in range(n_runs)]
+            best = min(run['seconds'] for run in runs)
+            print(f"{variant:<8} {best * 1000:>18.0f} "
+                  f"{runs[0]['modules']:>8}  "
+                  f"{', '.join(runs[0]['heavy']) or '-'}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RUNS)
@@ -0,0 +1,95 @@
+"""
+Benchmark: threshold strategy simulation, per-pair loop vs batched grid.
+
+Synthetic probabilities and 4-hour returns over the length of the
+2020+ decision grid (about 5.9 years of 4-hour periods).
+
+    loop     one Python pass over the periods per threshold pair
+             (position state, costs, equity and trades tracked per step)
+    batched  src.strategy.evaluate_grid over all pairs at once
+
+The loop is timed on a sample of pairs and scaled to the full grid.
+
+Usage (from the project root):
+    python -m benchmarks.bench_strategy [grid_step]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from src.strategy import (
+    FEE_RATE, SLIPPAGE_RATE, evaluate_grid, threshold_grid
+)
+
+
+DEFAULT_STEP = 0.01
+N_PERIODS = 13_000
+LOOP_SAMPLE = 20
+
+
+def loop_pair(probability, period_return, entry, exit, cost):
+    """
+    Total return, max drawdown and hit rate of one pair, step by step.
+    """
+    position = 0
+    equity = peak = 1.0
+    max_drawdown = 0.0
+    trade_start = None
+    trades = wins = 0
+    n = len(probability)
+    for t in range(n):
+        if probability[t] > entry:
+            position = 1
+        elif probability[t] < exit:
+            position = 0
+        if not position:
+            if trade_start is not None:
+                trades += 1
+                wins += equity > trade_start
+                trade_start = None
+            continue
+        if trade_start is None:
+            trade_start = equity
+            equity *= 1 - cost
+        equity *= 1 + period_return[t]
+        if t == n - 1 or (probability[t + 1] < exit
+                          and not probability[t + 1] > entry):
+            equity *= 1 - cost
+        peak = max(peak, equity)
+        max_drawdown = min(max_drawdown, equity / peak - 1)
+    if trade_start is not None:
+        trades += 1
+        wins += equity > trade_start
+    return equity - 1, max_drawdown, wins / trades if trades else np.nan
+
+
+def main(step):
+    rng = np.random.default_rng(0)
+    probability = rng.uniform(0.3, 0.7, N_PERIODS)
+    period_return = rng.normal(0.0003, 0.01, N_PERIODS)
+    values = np.round(np.arange(0.0, 1.0 + step / 2, step), 6)
+    entry, exit = threshold_grid(values, values)
+    cost = FEE_RATE + SLIPPAGE_RATE
+
+    sample = rng.choice(len(entry), size=min(LOOP_SAMPLE, len(entry)),
+                        replace=False)
+    start = time.perf_counter()
+    for i in sample:
+        loop_pair(probability, period_return, entry[i], exit[i], cost)
+    loop_seconds = (time.perf_counter() - start) / len(sample) * len(entry)
+
+    start = time.perf_counter()
+    evaluate_grid(probability, period_return, entry, exit)
+    batched_seconds = time.perf_counter() - start
+
+    print(f"{len(entry):,} threshold pairs x {N_PERIODS:,} periods")
+    print(f"{'variant':<8} {'seconds':>9} {'pairs/s':>10}")
+    for variant, seconds in [('loop', loop_seconds),
+                             ('batched', batched_seconds)]:
+        print(f"{variant:<8} {seconds:>9.2f} {len(entry) / seconds:>10,.0f}")
+
+
+if __name__ == '__main__':
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_STEP)
@@ -0,0 +1,89 @@
+"""
+Benchmark: single-pass string validation vs the per-character scan.
+
+Compares the previous _validate_string_data (astype(str) + one
+str.contains per dangerous character + str.match for dates) with the
+byte-level engine in src.raw_data_validation, including the cost of
+building the shared parsed view.
+
+Usage (from the project root):
+    python -m benchmarks.bench_validation [n_rows ...]
+"""
+
+import contextlib
+import io
+import re
+import sys
+import time
+
+import pandas as pd
+
+from benchmarks.synthetic_data import make_raw_ohlcv
+from src.raw_data_validation import (
+    _parse_frame, _validate_string_data, _validate_price_ranges,
+    _validate_structure, _validate_timestamps, DANGEROUS_CHARS
+)
+
+
+DEFAULT_SIZES = [1_000_000, 10_000_000]
+
+
+def legacy_validate_string_data(df):
+    """
+    The per-character implementation this engine replaced.
+    """
+    date_pattern = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+    invalid_dates = df[~df['DATE_STR'].astype(str).str.match(date_pattern)]
+    if len(invalid_dates) > 0:
+        raise ValueError("Invalid DATE_STR format detected")
+
+    hour_values = pd.to_numeric(df['HOUR_STR'], errors='coerce')
+    if hour_values.isna().any():
+        raise ValueError("Non-numeric values in HOUR_STR")
+    if (hour_values < 0).any() or (hour_values > 23).any():
+        raise ValueError("Hour values outside 0-23 range")
+
+    for col in ['DATE_STR', 'HOUR_STR']:
+        col_str = df[col].astype(str)
+        for char in DANGEROUS_CHARS:
+            if col_str.str.contains(re.escape(char), regex=True).any():
+                raise ValueError(f"Dangerous character '{char}' in {col}")
+
+
+def _time(func, *args):
+    """
+    Best-of-3 wall time of func(*args) with its console output muted.
+    """
+    best = float('inf')
+    for _ in range(3):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            func(*args)
+            best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _engine(df):
+    """
+    Parse once, then run every per-row check on the shared view.
+    """
+    view = _parse_frame(df)
+    _validate_structure(view)
+    _validate_string_data(view)
+    _validate_price_ranges(view)
+    _validate_timestamps(view)
+
+
+def main(sizes):
+    print(f"{'rows':>12} {'legacy (s)':>12} {'engine (s)':>12} {'speedup':>9}")
+    for n_rows in sizes:
+        df = make_raw_ohlcv(n_rows)
+        legacy = _time(legacy_validate_string_data, df)
+        engine = _time(_engine, df)
+        print(f"{n_rows:>12,} {legacy:>12.3f} {engine:>12.3f} "
+              f"{legacy / engine:>8.1f}x")
+        del df
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
@@ -0,0 +1,74 @@
+"""
+TradeCare Synthetic Data
+
+Generates raw hourly OHLCV frames in the exact layout of the GitHub
+source (see src.raw_data_validation.EXPECTED_COLUMNS), at any size.
+
+Used by the benchmarks and for running the pipeline against local
+files without network access.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def make_raw_ohlcv(n_rows, seed=0, start=1416031200, base_price=30000.0):
+    """
+    Build a synthetic raw hourly OHLCV frame.
+
+    Prices follow a log random walk reflected into a band around
+    base_price, so they stay inside the validation bounds for any
+    number of rows.
+    High/low always bracket open/close (valid OHLC logic).
+
+    Args:
+        n_rows (int): Number of hourly rows
+        seed (int): Random seed
+        start (int): TIME_UNIX of the first row
+        base_price (float): Price level the walk reverts to
+
+    Returns:
+        pd.DataFrame: Raw data with the source column layout
+    """
+    rng = np.random.default_rng(seed)
+
+    time_unix = start + 3600 * np.arange(n_rows, dtype=np.int64)
+    stamps = time_unix.astype('datetime64[s]')
+
+    # Log random walk reflected into [-1.5, 1.5] around base_price
+    walk = np.cumsum(rng.normal(0.0, 0.006, n_rows)) + 1.5
+    log_dev = np.abs((walk % 6.0) - 3.0) - 1.5
+    close = base_price * np.exp(log_dev)
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    high = np.maximum(open_, close) * (1 + rng.uniform(0, 0.004, n_rows))
+    low = np.minimum(open_, close) * (1 - rng.uniform(0, 0.004, n_rows))
+    volume_from = rng.gamma(2.0, 300.0, n_rows)
+
+    return pd.DataFrame({
+        'TIME_UNIX': time_unix,
+        'DATE_STR': np.datetime_as_string(stamps, unit='D').astype(object),
+        'HOUR_STR': (time_unix // 3600 % 24).astype(np.int64),
+        'OPEN_PRICE': open_.round(2),
+        'HIGH_PRICE': high.round(2),
+        'CLOSE_PRICE': close.round(2),
+        'LOW_PRICE': low.round(2),
+        'VOLUME_FROM': volume_from.round(4),
+        'VOLUME_TO': (volume_from * close).round(2)
+    })
+
+
+def write_raw_csv(path, n_rows, seed=0, **kwargs):
+    """
+    Write a synthetic raw CSV file in the source layout.
+
+    Args:
+        path (str): Output CSV path
+        n_rows (int): Number of hourly rows
+        seed (int): Random seed
+        **kwargs: Passed to make_raw_ohlcv
+
+    Returns:
+        str: The path written
+    """
+    make_raw_ohlcv(n_rows, seed=seed, **kwargs).to_csv(path, index=False)
+    return path
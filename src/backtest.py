@@ -0,0 +1,235 @@
+"""
+TradeCare Walk-Forward Backtest Module
+
+Rolling out-of-sample evaluation of the BR1/BR2 models, instead of the
+single 80/20 split of 4_ModelTraining.ipynb.
+
+The dataset is cut into folds: train on a sliding window of train_rows
+consecutive hours, skip gap_rows (the target looks TARGET_HORIZON hours
+ahead, so without the gap the last training targets would overlap the
+first test hours), score the next test_rows hours, then slide forward
+by step_rows and repeat. Each fold fits its own scaler and both models
+with the notebook's setup (src.modeling).
+
+Folds are independent and run in a process pool. The feature and
+target arrays are handed to each worker once, through the pool
+initializer, and a task is only a (train_start, test_start, test_end)
+triple, so nothing large is pickled per fold. Workers limit BLAS to one
+thread so the pool does not oversubscribe the cores.
+
+Example:
+    python -m src.backtest --train-days 365 --test-days 30
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from threadpoolctl import threadpool_limits
+
+from src.modeling import (
+    CLASSIFICATION_METRICS, FEATURES_FILE, REGRESSION_METRICS, START_DATE,
+    TARGET_HORIZON, evaluate, fit_classification, fit_regression,
+    fit_scaler, load_design_matrix, scale
+)
+
+# Default fold sizes (hours)
+TRAIN_ROWS = 365 * 24
+TEST_ROWS = 30 * 24
+
+# Results table columns
+RESULT_COLUMNS = (['fold', 'train_start', 'test_start', 'test_end',
+                   'n_train', 'n_test']
+                  + REGRESSION_METRICS + CLASSIFICATION_METRICS + ['seconds'])
+
+# Arrays shared with the worker processes (set by _init_worker)
+_DATA = {}
+
+
+def walk_forward_folds(n_rows, train_rows=TRAIN_ROWS, test_rows=TEST_ROWS,
+                       step_rows=None, gap_rows=TARGET_HORIZON):
+    """
+    Row ranges of the walk-forward folds.
+
+    Args:
+        n_rows (int): Rows in the dataset
+        train_rows (int): Training window length
+        test_rows (int): Test block length (the last block may be
+            shorter)
+        step_rows (int): Rows the window slides per fold (default:
+            test_rows, so test blocks tile the data)
+        gap_rows (int): Rows skipped between training and test
+
+    Returns:
+        np.ndarray: (n_folds, 3) int64 rows of (train_start, test_start,
+        test_end); training is [train_start, test_start - gap_rows)
+
+    Raises:
+        ValueError: If the data is too short for one fold
+    """
+    step_rows = step_rows or test_rows
+    first_test = train_rows + gap_rows
+    if n_rows <= first_test:
+        raise ValueError(
+            f"Need more than {first_test} rows for one fold "
+            f"(train {train_rows} + gap {gap_rows}), got {n_rows}"
+        )
+    test_start = np.arange(first_test, n_rows, step_rows, dtype=np.int64)
+    return np.column_stack([
+        test_start - first_test,
+        test_start,
+        np.minimum(test_start + test_rows, n_rows),
+    ])
+
+
+def run_backtest(data=FEATURES_FILE, train_rows=TRAIN_ROWS,
+                 test_rows=TEST_ROWS, step_rows=None,
+                 gap_rows=TARGET_HORIZON, workers=None, start=START_DATE,
+                 verbose=True):
+    """
+    Walk-forward evaluation of both models.
+
+    Args:
+        data (str, pd.DataFrame or dict): Features CSV, features frame,
+            or arrays from load_design_matrix
+        train_rows, test_rows, step_rows, gap_rows (int): Fold layout
+            (see walk_forward_folds)
+        workers (int): Worker processes (default: CPU count; 1 runs the
+            folds in this process)
+        start (str): First timestamp used (when loading data)
+        verbose (bool): Print a summary
+
+    Returns:
+        pd.DataFrame: One row per fold with RESULT_COLUMNS (fold bounds
+        as timestamps, metrics on the test block, fit+score seconds)
+    """
+    if not isinstance(data, dict):
+        data = load_design_matrix(data, start=start)
+    folds = walk_forward_folds(len(data['X']), train_rows, test_rows,
+                               step_rows, gap_rows)
+    workers = min(workers or os.cpu_count() or 1, len(folds))
+
+    started = time.perf_counter()
+    arrays = (data['X'], data['y_return'], data['y_class'], gap_rows)
+    if workers == 1:
+        _init_worker(*arrays, limit_threads=False)
+        results = [_run_fold(fold) for fold in folds]
+    else:
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_init_worker,
+                                 initargs=arrays) as pool:
+            results = list(pool.map(_run_fold, folds))
+    elapsed = time.perf_counter() - started
+
+    timestamps = data['timestamp']
+    table = pd.DataFrame(results)
+    table.insert(0, 'fold', np.arange(len(folds)))
+    table.insert(1, 'train_start', timestamps[folds[:, 0]])
+    table.insert(2, 'test_start', timestamps[folds[:, 1]])
+    table.insert(3, 'test_end', timestamps[folds[:, 2] - 1])
+    table = table[RESULT_COLUMNS]
+
+    if verbose:
+        _print_summary(table, workers, elapsed)
+    return table
+
+
+def _init_worker(X, y_return, y_class, gap_rows, limit_threads=True):
+    """
+    Internal function: Keep the dataset in the worker for every fold.
+    """
+    _DATA.update(X=X, y_return=y_return, y_class=y_class, gap_rows=gap_rows)
+    if limit_threads:
+        # One BLAS thread per worker; the pool provides the parallelism
+        _DATA['thread_limits'] = threadpool_limits(limits=1)
+
+
+def _run_fold(fold):
+    """
+    Internal function: Fit on one training window, score its test block.
+    """
+    train_start, test_start, test_end = (int(value) for value in fold)
+    train_end = test_start - _DATA['gap_rows']
+    started = time.perf_counter()
+
+    X_train = _DATA['X'][train_start:train_end]
+    scaler = fit_scaler(X_train)
+    X_train_scaled = scale(scaler, X_train)
+    regression_model = fit_regression(
+        X_train_scaled, _DATA['y_return'][train_start:train_end]
+    )
+    classification_model = fit_classification(
+        X_train_scaled, _DATA['y_class'][train_start:train_end]
+    )
+
+    metrics = evaluate(
+        regression_model, classification_model,
+        scale(scaler, _DATA['X'][test_start:test_end]),
+        _DATA['y_return'][test_start:test_end],
+        _DATA['y_class'][test_start:test_end],
+    )
+    return {
+        'n_train': train_end - train_start,
+        'n_test': test_end - test_start,
+        **metrics,
+        'seconds': time.perf_counter() - started,
+    }
+
+
+def _print_summary(table, workers, elapsed):
+    """
+    Internal function: Print fold count and metric distribution.
+    """
+    print("=" * 60)
+    print("WALK-FORWARD BACKTEST")
+    print("=" * 60)
+    print(f"✓ {len(table)} folds in {elapsed:.2f}s ({workers} workers)")
+    print(f"  Test period: {table['test_start'].iloc[0]} to "
+          f"{table['test_end'].iloc[-1]}")
+    print(f"  Training rows per fold: {table['n_train'].iloc[0]:,}")
+    print("-" * 60)
+    print(f"  {'metric':<10} {'mean':>9} {'std':>9} {'min':>9} {'max':>9}")
+    for name in REGRESSION_METRICS + CLASSIFICATION_METRICS:
+        values = table[name]
+        print(f"  {name:<10} {values.mean():>9.4f} {values.std():>9.4f} "
+              f"{values.min():>9.4f} {values.max():>9.4f}")
+    print("=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Walk-forward backtest of the BR1/BR2 models"
+    )
+    parser.add_argument('--data', default=FEATURES_FILE,
+                        help="Features CSV (default: %(default)s)")
+    parser.add_argument('--start', default=START_DATE,
+                        help="First timestamp used (default: %(default)s)")
+    parser.add_argument('--train-days', type=float, default=TRAIN_ROWS / 24)
+    parser.add_argument('--test-days', type=float, default=TEST_ROWS / 24)
+    parser.add_argument('--step-days', type=float, default=None)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--output', help="Write the fold table (.csv or "
+                                         ".parquet)")
+    args = parser.parse_args()
+
+    table = run_backtest(
+        args.data,
+        train_rows=int(args.train_days * 24),
+        test_rows=int(args.test_days * 24),
+        step_rows=int(args.step_days * 24) if args.step_days else None,
+        workers=args.workers,
+        start=args.start,
+    )
+    if args.output:
+        if args.output.endswith('.parquet'):
+            table.to_parquet(args.output, index=False)
+        else:
+            table.to_csv(args.output, index=False)
+        print(f"✓ Fold results saved: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
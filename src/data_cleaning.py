@@ -0,0 +1,347 @@
+"""
+TradeCare Data Cleaning Module
+
+Headless OHLC-consistency and temporal-integrity checks for the hourly
+Bitcoin data, extracted from the cleaning notebook so the pipeline can
+clean data without running it.
+
+Every check is a single vectorized pass over NumPy arrays and returns
+row positions instead of filtered DataFrame copies:
+- OHLC logic: one combined violation bitmask over the four price arrays
+- Temporal integrity: gaps and duplicates from integer TIME_UNIX diffs
+- Historical events: each event day sliced from the sorted TIME_UNIX
+  index with searchsorted, in O(log n) per event
+"""
+
+import os
+import numpy as np
+import pandas as pd
+import yaml
+
+
+# Expected spacing of consecutive rows (hourly candles)
+HOURLY_INTERVAL = 3600
+
+# Reference price events (CSV or YAML: date, event, metric, expected,
+# tolerance)
+EVENTS_FILE = 'inputs/reference/btc_events.csv'
+EVENT_COLUMNS = ['date', 'event', 'metric', 'expected', 'tolerance']
+SECONDS_PER_DAY = 86400
+
+# OHLC violation bits (a row may set several)
+HIGH_NOT_MAX = 1  # HIGH below OPEN, CLOSE or LOW
+LOW_NOT_MIN = 2  # LOW above OPEN, CLOSE or HIGH
+OPEN_CLOSE_OUT_OF_RANGE = 4  # OPEN or CLOSE outside [LOW, HIGH]
+MISSING_PRICE = 8  # Any of the four prices is NaN
+
+OHLC_VIOLATIONS = [
+    (HIGH_NOT_MAX, 'HIGH not maximum'),
+    (LOW_NOT_MIN, 'LOW not minimum'),
+    (OPEN_CLOSE_OUT_OF_RANGE, 'OPEN/CLOSE out of range'),
+    (MISSING_PRICE, 'Missing price'),
+]
+
+
+def ohlc_violation_mask(df):
+    """
+    Combined OHLC violation bitmask, one uint8 per row.
+
+    Each row's value is the OR of the violation bits it breaks
+    (HIGH_NOT_MAX, LOW_NOT_MIN, OPEN_CLOSE_OUT_OF_RANGE, MISSING_PRICE);
+    0 means the candle is consistent.
+
+    Args:
+        df (pd.DataFrame): Data with OPEN/HIGH/LOW/CLOSE_PRICE columns
+
+    Returns:
+        np.ndarray: uint8 bitmask of length len(df)
+    """
+    open_ = df['OPEN_PRICE'].to_numpy()
+    high = df['HIGH_PRICE'].to_numpy()
+    low = df['LOW_PRICE'].to_numpy()
+    close = df['CLOSE_PRICE'].to_numpy()
+
+    # NaN compares False, so missing prices only set their own bit
+    mask = np.zeros(len(df), dtype=np.uint8)
+    mask |= ((high < open_) | (high < close) | (high < low)).view(np.uint8)
+    mask |= (((low > open_) | (low > close) | (low > high))
+             .view(np.uint8) << 1)
+    mask |= (((open_ > high) | (open_ < low) | (close > high) | (close < low))
+             .view(np.uint8) << 2)
+    mask |= ((np.isnan(open_) | np.isnan(high) | np.isnan(low)
+              | np.isnan(close)).view(np.uint8) << 3)
+    return mask
+
+
+def find_ohlc_violations(df):
+    """
+    Find rows with impossible OHLC relationships.
+
+    Args:
+        df (pd.DataFrame): Data with OPEN/HIGH/LOW/CLOSE_PRICE columns
+
+    Returns:
+        dict: Violation details
+            - rows: positions of violating rows (unique, ascending)
+            - mask: the full violation bitmask (see ohlc_violation_mask)
+            - counts: rows per violation label (a row can count in
+              several)
+
+    Example:
+        >>> result = find_ohlc_violations(df)
+        >>> df.iloc[result['rows']]
+    """
+    mask = ohlc_violation_mask(df)
+    return {
+        'rows': np.flatnonzero(mask),
+        'mask': mask,
+        'counts': {label: int(np.count_nonzero(mask & bit))
+                   for bit, label in OHLC_VIOLATIONS},
+    }
+
+
+def find_time_gaps(time_unix, interval=HOURLY_INTERVAL):
+    """
+    Find gaps and duplicate timestamps from integer TIME_UNIX diffs.
+
+    Rows are examined in time order; positions returned always refer to
+    the input order, so they can be passed straight to df.iloc.
+
+    Args:
+        time_unix (array-like): TIME_UNIX seconds, in any order
+        interval (int): Expected seconds between consecutive rows
+
+    Returns:
+        dict: Temporal integrity details
+            - order: positions that sort the rows by time (None if the
+              input was already sorted)
+            - gap_rows: positions of rows whose distance to the previous
+              row is not interval (duplicates included)
+            - gap_seconds: that distance for each gap row
+            - duplicate_rows: positions of every row sharing its
+              timestamp with another row
+            - gap_sizes: {seconds: count} for gaps larger than interval
+    """
+    times = np.asarray(time_unix, dtype=np.int64)
+    diffs = np.diff(times)
+    order = None
+    if np.any(diffs < 0):
+        order = np.argsort(times, kind='stable')
+        diffs = np.diff(times[order])
+    positions = order if order is not None else np.arange(len(times))
+
+    gap = np.flatnonzero(diffs != interval)
+    duplicate = diffs == 0
+    # Both rows of a zero diff are duplicates
+    duplicate_at = np.zeros(len(times), dtype=bool)
+    duplicate_at[1:] |= duplicate
+    duplicate_at[:-1] |= duplicate
+
+    larger = diffs[diffs > interval]
+    sizes, counts = np.unique(larger, return_counts=True)
+    return {
+        'order': order,
+        'gap_rows': positions[gap + 1],
+        'gap_seconds': diffs[gap],
+        'duplicate_rows': np.sort(positions[duplicate_at]),
+        'gap_sizes': dict(zip(sizes.tolist(), counts.tolist())),
+    }
+
+
+def clean_data(df, interval=HOURLY_INTERVAL, verbose=True):
+    """
+    Remove OHLC-inconsistent rows and check temporal integrity.
+
+    Headless version of the cleaning notebook: drops every row that
+    fails the OHLC logic, sorts by TIME_UNIX and adds the 'timestamp'
+    column. Gaps and duplicates are reported but kept, as in the
+    notebook (gaps are mostly left behind by removed rows).
+
+    Args:
+        df (pd.DataFrame): Validated raw data
+        interval (int): Expected seconds between consecutive rows
+        verbose (bool): Print a summary of the results
+
+    Returns:
+        tuple: (df_clean, summary)
+            - df_clean: cleaned data with a fresh RangeIndex
+            - summary: dict with rows_in, rows_removed, violation
+              counts, gaps, duplicates, largest_gap_seconds and
+              gap_sizes
+
+    Example:
+        >>> df_clean, summary = clean_data(df)
+        >>> df_clean.to_csv('inputs/datasets/processed/bitcoin_clean.csv',
+        ...                 index=False)
+    """
+    violations = find_ohlc_violations(df)
+    keep = np.flatnonzero(violations['mask'] == 0)
+    df_clean = df.take(keep)
+
+    temporal = find_time_gaps(df_clean['TIME_UNIX'].to_numpy(), interval)
+    if temporal['order'] is not None:
+        df_clean = df_clean.take(temporal['order'])
+        temporal = find_time_gaps(df_clean['TIME_UNIX'].to_numpy(), interval)
+    df_clean = df_clean.reset_index(drop=True)
+    if 'timestamp' not in df_clean.columns:
+        df_clean['timestamp'] = pd.to_datetime(df_clean['TIME_UNIX'], unit='s')
+
+    gap_seconds = temporal['gap_seconds']
+    summary = {
+        'rows_in': len(df),
+        'rows_removed': len(violations['rows']),
+        'violation_counts': violations['counts'],
+        'gaps': len(temporal['gap_rows']),
+        'duplicates': len(temporal['duplicate_rows']),
+        'largest_gap_seconds': int(gap_seconds.max()) if len(gap_seconds) else 0,
+        'gap_sizes': temporal['gap_sizes'],
+    }
+
+    if verbose:
+        _print_summary(summary, len(df_clean))
+
+    return df_clean, summary
+
+
+def load_events(path=EVENTS_FILE):
+    """
+    Load reference price events from a CSV or YAML file.
+
+    Each event has a date (YYYY-MM-DD, UTC day), a name, the metric to
+    compare ('high': highest HIGH_PRICE of the day, 'low': lowest
+    LOW_PRICE), the expected price and a relative tolerance. YAML files
+    hold a list of mappings with the same keys.
+
+    Args:
+        path (str): Path of a .csv, .yaml or .yml file
+
+    Returns:
+        pd.DataFrame: One row per event with EVENT_COLUMNS
+
+    Raises:
+        ValueError: If the file type is unsupported, a column is missing
+            or a metric is not 'high'/'low'
+
+    Example:
+        >>> events = load_events('inputs/reference/btc_events.csv')
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        events = pd.read_csv(path, dtype={'date': str, 'event': str,
+                                          'metric': str})
+    elif extension in ('.yaml', '.yml'):
+        with open(path) as f:
+            events = pd.DataFrame(yaml.safe_load(f) or [])
+    else:
+        raise ValueError(
+            f"Unsupported events file: {path}\n"
+            f"Expected .csv, .yaml or .yml"
+        )
+    return _check_events(events)
+
+
+def verify_events(df, events=EVENTS_FILE):
+    """
+    Compare the data against known historical price events.
+
+    TIME_UNIX is sorted once (skipped if already sorted); each event day
+    is then located with searchsorted and its HIGH max / LOW min taken
+    with one reduceat over all events, so the cost is
+    O(n + events * log n) instead of one full scan per event.
+
+    Args:
+        df (pd.DataFrame): Data with TIME_UNIX, HIGH_PRICE and LOW_PRICE
+        events (str, pd.DataFrame or list): Events file path (see
+            load_events), or the events themselves
+
+    Returns:
+        pd.DataFrame: One row per event with date, event, metric,
+        expected, actual, diff_pct, tolerance_pct, rows (candles found
+        that day) and passed (False if no data)
+
+    Example:
+        >>> results = verify_events(df_clean)
+        >>> results['passed'].all()
+    """
+    if isinstance(events, str):
+        events = load_events(events)
+    else:
+        events = _check_events(pd.DataFrame(events))
+
+    times = df['TIME_UNIX'].to_numpy()
+    high = df['HIGH_PRICE'].to_numpy(dtype=np.float64)
+    low = df['LOW_PRICE'].to_numpy(dtype=np.float64)
+    if np.any(times[1:] < times[:-1]):
+        order = np.argsort(times, kind='stable')
+        times, high, low = times[order], high[order], low[order]
+
+    day_start = (pd.to_datetime(events['date'], format='%Y-%m-%d')
+                 .to_numpy().astype('datetime64[s]').astype(np.int64))
+    start = np.searchsorted(times, day_start, side='left')
+    end = np.searchsorted(times, day_start + SECONDS_PER_DAY, side='left')
+    rows = end - start
+
+    # reduceat over interleaved [start, end) bounds; the NaN sentinel
+    # keeps end == len(df) a valid index
+    bounds = np.column_stack([start, end]).ravel()
+    day_high = np.maximum.reduceat(np.append(high, np.nan), bounds)[::2]
+    day_low = np.minimum.reduceat(np.append(low, np.nan), bounds)[::2]
+
+    expected = events['expected'].to_numpy(dtype=np.float64)
+    tolerance = events['tolerance'].to_numpy(dtype=np.float64)
+    actual = np.where(events['metric'].to_numpy() == 'high',
+                      day_high, day_low)
+    actual = np.where(rows > 0, actual, np.nan)
+    diff_pct = np.abs(actual - expected) / expected * 100
+
+    results = events[['date', 'event', 'metric']].copy()
+    results['expected'] = expected
+    results['actual'] = actual
+    results['diff_pct'] = diff_pct
+    results['tolerance_pct'] = tolerance * 100
+    results['rows'] = rows
+    results['passed'] = (rows > 0) & (diff_pct <= tolerance * 100)
+    return results
+
+
+def _check_events(events):
+    """
+    Internal function: Validate and normalize an events table.
+    """
+    missing = [col for col in EVENT_COLUMNS if col not in events.columns]
+    if missing:
+        raise ValueError(
+            f"Events missing columns: {missing}\n"
+            f"Expected: {EVENT_COLUMNS}"
+        )
+    events = events[EVENT_COLUMNS].reset_index(drop=True)
+    events['date'] = events['date'].astype(str)
+    events['metric'] = events['metric'].str.lower()
+    invalid = sorted(set(events['metric']) - {'high', 'low'})
+    if invalid:
+        raise ValueError(
+            f"Invalid event metrics: {invalid}\n"
+            f"Expected 'high' or 'low'"
+        )
+    return events
+
+
+def _print_summary(summary, rows_out):
+    """
+    Internal function: Print the cleaning results.
+    """
+    print("=" * 60)
+    print("DATA CLEANING RESULTS")
+    print("=" * 60)
+    for label, count in summary['violation_counts'].items():
+        status = "✗ FAIL" if count > 0 else "✓ PASS"
+        print(f"  {label}: {count:,} {status}")
+    print(f"Removed {summary['rows_removed']:,} invalid rows")
+    print(f"Retained {rows_out:,} valid rows "
+          f"({rows_out / max(summary['rows_in'], 1) * 100:.1f}%)")
+    print("-" * 60)
+    print(f"Time gaps found: {summary['gaps']:,}")
+    print(f"Duplicate timestamps: {summary['duplicates']:,}")
+    if summary['gaps']:
+        print(f"Largest gap: {summary['largest_gap_seconds'] / 3600:g} hours")
+    print("=" * 60)
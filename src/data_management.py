@@ -1,42 +1,90 @@
 import streamlit as st
-import joblib
-import os
+
+from src.model_store import ModelStore
+from src.prediction_cache import PredictionCache
 
 @st.cache_resource
-def load_models():
+def get_model_store():
     """
-    Load trained models, scaler, and feature names
+    Shared hot-reloading model store (one per server process)
+    
+    Polls outputs/models/manifest.json and swaps in a newly published
+    model version without a restart
     
     Returns:
-        tuple: (regression_model, classification_model, scaler, feature_names)
+        ModelStore: Store over outputs/models
+    """
+    return ModelStore('outputs/models')
+
+def get_model_version():
+    """
+    Current model version; hold it for the whole page run so a run in
+    progress during a reload finishes on the version it started with
+    
+    Returns:
+        ModelVersion: Loaded models and bundle, or None if the models
+        could not be loaded
     """
     try:
-        # Define paths
-        models_dir = 'outputs/models'
-        
-        regression_path = os.path.join(models_dir, 'regression_model.pkl')
-        classification_path = os.path.join(models_dir, 'classification_model.pkl')
-        scaler_path = os.path.join(models_dir, 'scaler.pkl')
-        features_path = os.path.join(models_dir, 'feature_names.pkl')
-        
-        # Check if files exist
-        if not all([
-            os.path.exists(regression_path),
-            os.path.exists(classification_path),
-            os.path.exists(scaler_path),
-            os.path.exists(features_path)
-        ]):
-            st.error("❌ Model files not found in outputs/models/")
-            return None, None, None, None
-        
-        # Load models
-        regression_model = joblib.load(regression_path)
-        classification_model = joblib.load(classification_path)
-        scaler = joblib.load(scaler_path)
-        feature_names = joblib.load(features_path)
-        
-        return regression_model, classification_model, scaler, feature_names
-        
+        return get_model_store().current()
+    except FileNotFoundError:
+        st.error("❌ Model files not found in outputs/models/")
+        return None
     except Exception as e:
         st.error(f"❌ Error loading models: {str(e)}")
-        return None, None, None, None
\ No newline at end of file
+        return None
+
+def get_model_registry():
+    """
+    Lazy model registry of the current model version
+    
+    Each artifact is loaded on first access, with its arrays
+    memory-mapped; load times are in registry.load_times
+    
+    Returns:
+        ModelRegistry: Registry over the current version's files, or
+        None if the models could not be loaded
+    """
+    model_version = get_model_version()
+    return None if model_version is None else model_version.registry
+
+def load_models():
+    """
+    Load trained models, scaler, and feature names (current version)
+    
+    Returns:
+        tuple: (regression_model, classification_model, scaler, feature_names)
+    """
+    model_version = get_model_version()
+    if model_version is None:
+        return None, None, None, None
+    
+    return model_version.models()
+
+
+def load_linear_bundle():
+    """
+    Load the current models folded into a LinearBundle for fast
+    single-row predictions (one x @ W + b instead of three sklearn calls)
+    
+    Returns:
+        LinearBundle: Folded scaler and models, or None if the models
+        could not be loaded
+    """
+    model_version = get_model_version()
+    return None if model_version is None else model_version.bundle
+
+
+@st.cache_resource
+def get_prediction_cache():
+    """
+    Shared LRU cache of page 3 predictions (one per server process,
+    shared by all sessions)
+    
+    Entries are keyed on the quantized inputs and cleared when the
+    model version changes; hit/miss counters are in cache.stats()
+    
+    Returns:
+        PredictionCache: Cache of (return, class, probability) results
+    """
+    return PredictionCache()
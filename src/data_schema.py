@@ -0,0 +1,206 @@
+"""
+TradeCare Data Schema Module
+
+Explicit, compact dtypes for every CSV the pipeline reads.
+
+pandas' defaults (object strings, int64, float64) make the hourly
+dataset several times larger in memory than it needs to be. The
+readers below apply a schema while parsing instead:
+- TIME_UNIX as int32 (valid until 2038-01-19), HOUR_STR as int8
+- Prices, volumes and features as float32
+- DATE_STR as an Arrow-backed string (no Python objects, no categorical)
+- DATE_STR + HOUR_STR parsed into one datetime64 'timestamp' column for
+  the processed datasets
+
+Pass float64=True for precision-sensitive work (e.g. model training);
+it keeps 64-bit integers and floats.
+"""
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+
+
+PRICE_COLUMNS = ['OPEN_PRICE', 'HIGH_PRICE', 'CLOSE_PRICE', 'LOW_PRICE']
+VOLUME_COLUMNS = ['VOLUME_FROM', 'VOLUME_TO']
+
+FEATURE_COLUMNS = [
+    'return_1h', 'return_4h', 'return_12h', 'return_24h',
+    'rsi',
+    'ma_10', 'ma_20', 'ma_50',
+    'dist_from_ma10', 'dist_from_ma20',
+    'volume_change', 'volume_ratio',
+    'volatility_24h', 'price_range'
+]
+
+
+def raw_dtypes(float64=False):
+    """
+    pandas dtypes of the raw source columns.
+
+    Args:
+        float64 (bool): Keep 64-bit integers and floats
+
+    Returns:
+        dict: Column name -> dtype, for pd.read_csv(dtype=...)
+    """
+    float_type = 'float64' if float64 else 'float32'
+    dtypes = {
+        'TIME_UNIX': 'int64' if float64 else 'int32',
+        'DATE_STR': 'string[pyarrow]',
+        'HOUR_STR': 'int64' if float64 else 'int8',
+    }
+    for col in PRICE_COLUMNS + VOLUME_COLUMNS:
+        dtypes[col] = float_type
+    return dtypes
+
+
+def raw_arrow_schema(float64=False):
+    """
+    Arrow schema matching raw_dtypes(), for Parquet sinks.
+
+    Args:
+        float64 (bool): Keep 64-bit integers and floats
+
+    Returns:
+        pa.Schema: Raw column layout in source order
+    """
+    float_type = pa.float64() if float64 else pa.float32()
+    return pa.schema(
+        [
+            ('TIME_UNIX', pa.int64() if float64 else pa.int32()),
+            ('DATE_STR', pa.string()),
+            ('HOUR_STR', pa.int64() if float64 else pa.int8()),
+        ]
+        + [(col, float_type) for col in PRICE_COLUMNS + VOLUME_COLUMNS]
+    )
+
+
+def read_raw_csv(source, float64=False):
+    """
+    Read a raw OHLCV CSV with the compact schema applied while parsing.
+
+    Values are converted by the Arrow CSV reader straight into the
+    target types, so no intermediate int64/float64/object columns are
+    ever materialized.
+
+    Args:
+        source (str or file-like): Local path or buffer of the CSV
+        float64 (bool): Keep 64-bit integers and floats
+
+    Returns:
+        pd.DataFrame: Raw data with explicit dtypes
+
+    Raises:
+        ValueError: If a value does not fit its column type (callers that
+            validate the data should fall back to an untyped read so the
+            validators can report the problem)
+    """
+    return _read_csv_typed(source, raw_arrow_schema(float64))
+
+
+def read_clean_csv(path, float64=False):
+    """
+    Read the cleaned dataset with DATE_STR/HOUR_STR as one timestamp.
+
+    The string date and hour columns are parsed straight into a single
+    datetime64 'timestamp' column and dropped; the redundant timestamp
+    text column written by the cleaning notebook is not parsed at all.
+
+    Args:
+        path (str): Path of bitcoin_clean.csv
+        float64 (bool): Keep 64-bit integers and floats
+
+    Returns:
+        pd.DataFrame: TIME_UNIX, prices, volumes and 'timestamp'
+    """
+    df = _read_csv_typed(path, raw_arrow_schema(float64), include_all=False)
+    return add_timestamp(df, drop=True)
+
+
+def read_features_csv(path, float64=False):
+    """
+    Read the feature dataset with compact dtypes.
+
+    Args:
+        path (str): Path of bitcoin_features.csv
+        float64 (bool): Keep float64 features (recommended for training)
+
+    Returns:
+        pd.DataFrame: timestamp, CLOSE_PRICE, features and targets
+    """
+    float_type = pa.float64() if float64 else pa.float32()
+    schema = pa.schema(
+        [('timestamp', pa.timestamp('ns'))]
+        + [(col, float_type) for col in
+           ['CLOSE_PRICE'] + FEATURE_COLUMNS + ['target_return_simple']]
+        + [('target_profitable', pa.int8())]
+    )
+    return _read_csv_typed(path, schema)
+
+
+def add_timestamp(df, drop=False):
+    """
+    Parse DATE_STR and HOUR_STR into one datetime64 'timestamp' column.
+
+    Vectorized: the date strings are parsed with a fixed format and the
+    hour is added as a timedelta, without going through Python objects.
+
+    Args:
+        df (pd.DataFrame): Frame with DATE_STR and HOUR_STR columns
+        drop (bool): Remove DATE_STR and HOUR_STR afterwards
+
+    Returns:
+        pd.DataFrame: Same frame with a 'timestamp' column
+    """
+    days = pd.to_datetime(df['DATE_STR'], format='%Y-%m-%d').to_numpy()
+    hours = df['HOUR_STR'].to_numpy().astype('timedelta64[h]')
+    df['timestamp'] = (days + hours).astype('datetime64[ns]')
+    if drop:
+        df = df.drop(columns=['DATE_STR', 'HOUR_STR'])
+    return df
+
+
+def table_to_frame(table):
+    """
+    Convert an Arrow table to pandas without losing the compact types.
+
+    Strings stay Arrow-backed (StringDtype('pyarrow')) instead of being
+    turned into Python objects.
+
+    Args:
+        table (pa.Table): Table read from CSV or Parquet
+
+    Returns:
+        pd.DataFrame: Frame with the table's column types
+    """
+    return table.to_pandas(
+        types_mapper={pa.string(): pd.StringDtype('pyarrow'),
+                      pa.large_string(): pd.StringDtype('pyarrow')}.get
+    )
+
+
+def _read_csv_typed(source, schema, include_all=True):
+    """
+    Internal function: Parse a CSV with the Arrow reader into a schema.
+
+    Args:
+        source (str or file-like): Local path or buffer of the CSV
+        schema (pa.Schema): Column types to convert to while parsing
+        include_all (bool): Keep columns not in the schema (with
+            inferred types); False reads only the schema's columns
+
+    Returns:
+        pd.DataFrame: Parsed frame, strings as Arrow-backed StringDtype
+    """
+    convert = pa_csv.ConvertOptions(
+        column_types=schema,
+        include_columns=None if include_all else schema.names
+    )
+    # Single-threaded: a failed threaded read after an earlier threaded
+    # to_pandas() aborts the interpreter at exit (pyarrow 21)
+    read = pa_csv.ReadOptions(use_threads=False)
+    table = pa_csv.read_csv(source, read_options=read,
+                            convert_options=convert)
+    return table_to_frame(table)
+
@@ -0,0 +1,521 @@
+"""
+TradeCare Feature Engineering Module
+
+The 14 model features from 3_FeatureEngineering.ipynb as one importable
+computation over contiguous NumPy arrays.
+
+Instead of one pandas pass per feature (pct_change, rolling().mean(),
+rolling().std()), the features are written straight into a single
+preallocated (n, 14) float64 matrix whose columns follow FEATURE_COLUMNS
+(= outputs/models/feature_names.pkl):
+- One prefix sum of CLOSE_PRICE serves ma_10, ma_20, ma_50 and both
+  dist_from_ma features
+- One prefix sum each of gains and losses gives the 14-period RSI
+- One prefix sum of VOLUME_FROM gives the volume MA for volume_ratio
+- Prefix sums of return_1h and its square give volatility_24h (ddof=1)
+
+StreamingFeatures keeps the same 14 features up to date one bar at a
+time for live inference, in O(1) per bar: ring buffers hold the last
+HISTORY_ROWS bars, running sums back the MAs, RSI and volume MA, and a
+sliding Welford mean/M2 gives volatility_24h.
+
+Windows count rows, not hours, so the same code runs on bars of any
+timeframe (src.resample): on 4-hour bars return_4h is the 4-bar return.
+
+Results reproduce the notebook cells, including their edge cases:
+NaN during each window's warm-up, RSI defined from row 13 (the first
+delta counts as no gain and no loss), inf from pct_change over a zero
+volume. Rolling windows differ from pandas' online sums only by float
+rounding: the prefix sums restart every PREFIX_BLOCK rows so they never
+grow large enough to cancel digits (max error ~1e-11 of each feature's
+standard deviation).
+"""
+
+import math
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from src.data_schema import FEATURE_COLUMNS
+
+
+# Column positions in the feature matrix
+FEATURE_INDEX = {name: i for i, name in enumerate(FEATURE_COLUMNS)}
+
+# Window lengths (bars: hours on the hourly data; see src.resample for
+# higher timeframes)
+RETURN_PERIODS = [1, 4, 12, 24]
+RSI_PERIOD = 14
+MA_WINDOWS = [10, 20, 50]
+VOLUME_MA_WINDOW = 10
+VOLATILITY_WINDOW = 24
+
+# Bars kept by StreamingFeatures (longest window plus the bar leaving it)
+HISTORY_ROWS = max(MA_WINDOWS) + 1
+
+# Bars between exact recomputations of the streaming running sums
+RESYNC_INTERVAL = 1024
+
+# Rows per prefix-sum block (must be >= the longest window)
+PREFIX_BLOCK = 2048
+
+
+def compute_features(close, high, low, volume, out=None):
+    """
+    Compute the full feature matrix from price and volume arrays.
+
+    Args:
+        close (array-like): CLOSE_PRICE, in time order
+        high (array-like): HIGH_PRICE
+        low (array-like): LOW_PRICE
+        volume (array-like): VOLUME_FROM
+        out (np.ndarray): Optional preallocated (n, 14) float64 array to
+            write into (column-major is fastest)
+
+    Returns:
+        np.ndarray: (n, 14) matrix in FEATURE_COLUMNS order; rows inside
+        a window's warm-up hold NaN
+
+    Raises:
+        ValueError: If the inputs differ in length or out has the wrong
+            shape
+
+    Example:
+        >>> X = compute_features(df['CLOSE_PRICE'], df['HIGH_PRICE'],
+        ...                      df['LOW_PRICE'], df['VOLUME_FROM'])
+        >>> X[-1]  # features of the latest candle
+    """
+    close, high, low, volume = (
+        np.ascontiguousarray(values, dtype=np.float64)
+        for values in (close, high, low, volume)
+    )
+    n = len(close)
+    if not len(high) == len(low) == len(volume) == n:
+        raise ValueError(
+            "Price and volume arrays must have the same length\n"
+            f"Got close={n}, high={len(high)}, low={len(low)}, "
+            f"volume={len(volume)}"
+        )
+    if out is None:
+        out = np.empty((n, len(FEATURE_COLUMNS)), dtype=np.float64, order='F')
+    elif out.shape != (n, len(FEATURE_COLUMNS)):
+        raise ValueError(
+            f"out must have shape {(n, len(FEATURE_COLUMNS))}, "
+            f"got {out.shape}"
+        )
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Returns
+        for period in RETURN_PERIODS:
+            _pct_change(close, period, out[:, FEATURE_INDEX[f'return_{period}h']])
+
+        # RSI from gain/loss prefix sums (first delta counts as 0)
+        delta = np.zeros(n)
+        np.subtract(close[1:], close[:-1], out=delta[1:])
+        avg_gain = _rolling_mean(_prefix_sum(np.maximum(delta, 0)), RSI_PERIOD)
+        avg_loss = _rolling_mean(_prefix_sum(np.maximum(-delta, 0)), RSI_PERIOD)
+        rsi = out[:, FEATURE_INDEX['rsi']]
+        np.divide(avg_gain, avg_loss, out=rsi)
+        rsi += 1
+        np.divide(100, rsi, out=rsi)
+        np.subtract(100, rsi, out=rsi)
+
+        # Moving averages and distances, one shared prefix sum
+        close_sum = _prefix_sum(close)
+        for window in MA_WINDOWS:
+            _rolling_mean(close_sum, window, out[:, FEATURE_INDEX[f'ma_{window}']])
+        for window in (10, 20):
+            ma = out[:, FEATURE_INDEX[f'ma_{window}']]
+            dist = out[:, FEATURE_INDEX[f'dist_from_ma{window}']]
+            np.subtract(close, ma, out=dist)
+            dist /= ma
+
+        # Volume
+        _pct_change(volume, 1, out[:, FEATURE_INDEX['volume_change']])
+        ratio = out[:, FEATURE_INDEX['volume_ratio']]
+        _rolling_mean(_prefix_sum(volume), VOLUME_MA_WINDOW, ratio)
+        np.divide(volume, ratio, out=ratio)
+
+        # Volatility of return_1h (valid from row 1) and price range
+        _rolling_std(out[1:, FEATURE_INDEX['return_1h']], VOLATILITY_WINDOW,
+                     out[:, FEATURE_INDEX['volatility_24h']], offset=1)
+        price_range = out[:, FEATURE_INDEX['price_range']]
+        np.subtract(high, low, out=price_range)
+        price_range /= close
+
+    return out
+
+
+def feature_matrix(df, out=None):
+    """
+    Compute the feature matrix of a cleaned OHLCV frame.
+
+    Args:
+        df (pd.DataFrame): Data sorted by time with CLOSE_PRICE,
+            HIGH_PRICE, LOW_PRICE and VOLUME_FROM
+        out (np.ndarray): Optional preallocated (len(df), 14) array
+
+    Returns:
+        np.ndarray: (len(df), 14) matrix in FEATURE_COLUMNS order
+    """
+    return compute_features(df['CLOSE_PRICE'].to_numpy(),
+                            df['HIGH_PRICE'].to_numpy(),
+                            df['LOW_PRICE'].to_numpy(),
+                            df['VOLUME_FROM'].to_numpy(),
+                            out=out)
+
+
+def add_features(df):
+    """
+    Return a copy of df with the 14 feature columns added.
+
+    Same columns and values as the feature cells of the notebook.
+
+    Args:
+        df (pd.DataFrame): Data sorted by time (see feature_matrix)
+
+    Returns:
+        pd.DataFrame: df plus one column per feature
+    """
+    features = pd.DataFrame(feature_matrix(df), columns=FEATURE_COLUMNS,
+                            index=df.index)
+    return pd.concat([df.drop(columns=FEATURE_COLUMNS, errors='ignore'),
+                      features], axis=1)
+
+
+class StreamingFeatures:
+    """
+    Incremental feature engine for a live hourly candle feed.
+
+    Each update() adds one bar and returns the 14 features of that bar
+    without touching earlier history: every window is a ring buffer
+    (deque) with a running sum, and volatility_24h uses a sliding
+    Welford mean/M2. Values equal compute_features() on the same series
+    (warm-up NaN, RSI's first delta as 0, inf on zero volume); running
+    sums are recomputed exactly every resync_interval bars so rounding
+    cannot drift, which keeps the difference within 1e-9 of each
+    feature's standard deviation. One update costs a few microseconds.
+
+    Attributes:
+        count (int): Bars seen since the start (or reset)
+
+    Example:
+        >>> engine = StreamingFeatures.from_frame(df_history)
+        >>> features = engine.update({'CLOSE_PRICE': 91250.0,
+        ...                           'HIGH_PRICE': 91400.0,
+        ...                           'LOW_PRICE': 90980.0,
+        ...                           'VOLUME_FROM': 812.4})
+        >>> scaler.transform(features.reshape(1, -1))
+    """
+
+    def __init__(self, resync_interval=RESYNC_INTERVAL):
+        """
+        Args:
+            resync_interval (int): Bars between exact recomputations of
+                the running sums
+        """
+        self.resync_interval = resync_interval
+        self.reset()
+
+    @classmethod
+    def from_frame(cls, df, **kwargs):
+        """
+        Build an engine warmed up on the tail of a cleaned frame.
+
+        Only the last HISTORY_ROWS bars are replayed; with at least that
+        many rows the next update() gives exactly the batch features.
+
+        Args:
+            df (pd.DataFrame): History sorted by time (see feature_matrix)
+            **kwargs: Passed to StreamingFeatures()
+
+        Returns:
+            StreamingFeatures: Engine ready for the next bar
+        """
+        engine = cls(**kwargs)
+        tail = df.iloc[-HISTORY_ROWS:]
+        for row in zip(tail['CLOSE_PRICE'].tolist(),
+                       tail['HIGH_PRICE'].tolist(),
+                       tail['LOW_PRICE'].tolist(),
+                       tail['VOLUME_FROM'].tolist()):
+            engine.update_values(*row)
+        engine.count = len(df)
+        return engine
+
+    def reset(self):
+        """
+        Forget all history.
+        """
+        self.count = 0
+        self._closes = deque(maxlen=HISTORY_ROWS)
+        self._close_sums = {window: 0.0 for window in MA_WINDOWS}
+        self._gains = deque(maxlen=RSI_PERIOD)
+        self._losses = deque(maxlen=RSI_PERIOD)
+        self._gain_sum = 0.0
+        self._loss_sum = 0.0
+        self._volumes = deque(maxlen=VOLUME_MA_WINDOW)
+        self._volume_sum = 0.0
+        self._zero_runs = {'_gain_sum': 0, '_loss_sum': 0, '_volume_sum': 0}
+        self._returns = deque(maxlen=VOLATILITY_WINDOW)
+        self._return_mean = 0.0
+        self._return_m2 = 0.0
+        self._since_resync = 0
+
+    @property
+    def ready(self):
+        """
+        True once every feature is past its warm-up.
+        """
+        return self.count >= HISTORY_ROWS - 1
+
+    def update(self, bar):
+        """
+        Add one bar and return its features.
+
+        Args:
+            bar (Mapping): CLOSE_PRICE, HIGH_PRICE, LOW_PRICE and
+                VOLUME_FROM of the new bar (dict, pd.Series, ...)
+
+        Returns:
+            np.ndarray: 14 float64 values in FEATURE_COLUMNS order
+        """
+        return self.update_values(bar['CLOSE_PRICE'], bar['HIGH_PRICE'],
+                                  bar['LOW_PRICE'], bar['VOLUME_FROM'])
+
+    def update_values(self, close, high, low, volume):
+        """
+        Add one bar given as plain numbers and return its features.
+
+        Args:
+            close (float): CLOSE_PRICE
+            high (float): HIGH_PRICE
+            low (float): LOW_PRICE
+            volume (float): VOLUME_FROM
+
+        Returns:
+            np.ndarray: 14 float64 values in FEATURE_COLUMNS order
+        """
+        close, high, low, volume = (float(close), float(high), float(low),
+                                    float(volume))
+        closes = self._closes
+        nan = math.nan
+        self.count += 1
+        self._since_resync += 1
+
+        # Closes and MA sums (closes[-w - 1] leaves the w-window)
+        previous_volume = self._volumes[-1] if self._volumes else nan
+        previous_close = closes[-1] if closes else nan
+        closes.append(close)
+        for window in MA_WINDOWS:
+            self._close_sums[window] += close
+            if len(closes) > window:
+                self._close_sums[window] -= closes[-window - 1]
+
+        # Gains/losses (the first bar counts as neither)
+        delta = close - previous_close if self.count > 1 else 0.0
+        self._slide_sum('_gains', '_gain_sum', delta if delta > 0 else 0.0)
+        self._slide_sum('_losses', '_loss_sum', -delta if delta < 0 else 0.0)
+
+        self._slide_sum('_volumes', '_volume_sum', volume)
+
+        return_1h = nan
+        if self.count > 1:
+            return_1h = _divide(close, previous_close) - 1
+            self._add_return(return_1h)
+
+        if self._since_resync >= self.resync_interval:
+            self._resync()
+
+        # Features
+        values = [nan] * len(FEATURE_COLUMNS)
+        count = self.count
+        values[0] = return_1h
+        for i, period in enumerate(RETURN_PERIODS[1:], start=1):
+            if count > period:
+                values[i] = _divide(close, closes[-period - 1]) - 1
+
+        if count >= RSI_PERIOD:
+            rs = _divide(self._gain_sum / RSI_PERIOD,
+                         self._loss_sum / RSI_PERIOD)
+            values[4] = 100 - _divide(100, 1 + rs)
+
+        for i, window in enumerate(MA_WINDOWS, start=5):
+            if count >= window:
+                values[i] = self._close_sums[window] / window
+        values[8] = _divide(close - values[5], values[5])
+        values[9] = _divide(close - values[6], values[6])
+
+        if count > 1:
+            values[10] = _divide(volume, previous_volume) - 1
+        if count >= VOLUME_MA_WINDOW:
+            values[11] = _divide(volume, self._volume_sum / VOLUME_MA_WINDOW)
+
+        if count > VOLATILITY_WINDOW:
+            variance = self._return_m2 / (VOLATILITY_WINDOW - 1)
+            values[12] = math.sqrt(variance) if variance > 0 else 0.0
+        values[13] = _divide(high - low, close)
+
+        return np.array(values)
+
+    def _slide_sum(self, buffer_name, sum_name, value):
+        """
+        Internal function: Append to a full-window ring and its sum.
+
+        A window of only zeros sums to exactly 0 (as in the batch prefix
+        sums) instead of the rounding residue of the values that left it.
+        """
+        buffer = getattr(self, buffer_name)
+        total = getattr(self, sum_name) + value
+        if len(buffer) == buffer.maxlen:
+            total -= buffer[0]
+        buffer.append(value)
+        run = self._zero_runs[sum_name] + 1 if value == 0 else 0
+        self._zero_runs[sum_name] = run
+        if run >= buffer.maxlen:
+            total = 0.0
+        setattr(self, sum_name, total)
+
+    def _add_return(self, value):
+        """
+        Internal function: Sliding Welford update of the return window.
+        """
+        returns = self._returns
+        if len(returns) < returns.maxlen:
+            returns.append(value)
+            old_mean = self._return_mean
+            self._return_mean += (value - old_mean) / len(returns)
+            self._return_m2 += (value - old_mean) * (value - self._return_mean)
+        else:
+            leaving = returns[0]
+            returns.append(value)
+            old_mean = self._return_mean
+            self._return_mean += (value - leaving) / len(returns)
+            self._return_m2 += ((value - leaving)
+                                * (value - self._return_mean
+                                   + leaving - old_mean))
+
+    def _resync(self):
+        """
+        Internal function: Recompute every running sum from its buffer.
+        """
+        closes = list(self._closes)
+        for window in MA_WINDOWS:
+            self._close_sums[window] = math.fsum(closes[-window:])
+        self._gain_sum = math.fsum(self._gains)
+        self._loss_sum = math.fsum(self._losses)
+        self._volume_sum = math.fsum(self._volumes)
+        if self._returns:
+            mean = math.fsum(self._returns) / len(self._returns)
+            self._return_mean = mean
+            self._return_m2 = math.fsum((r - mean) ** 2 for r in self._returns)
+        self._since_resync = 0
+
+
+def _prefix_sum(values):
+    """
+    Internal function: Prefix sums restarted every PREFIX_BLOCK rows.
+
+    A single cumulative sum grows to n * price, and differencing it for
+    a window sum cancels most significant digits. Restarting the sum per
+    block keeps every partial sum small.
+
+    Returns:
+        tuple: (local, totals) where local[k] = sum(values[b*B:k]) with
+        b = (k - 1) // B (local[0] = 0), and totals[b] is the sum of
+        block b
+    """
+    n = len(values)
+    n_blocks = max(-(-n // PREFIX_BLOCK), 1)
+    # One buffer: a leading zero, then the blocks summed in place
+    local = np.empty(n_blocks * PREFIX_BLOCK + 1)
+    local[0] = 0.0
+    local[1:n + 1] = values
+    local[n + 1:] = 0.0
+    blocks = local[1:].reshape(n_blocks, PREFIX_BLOCK)
+    np.cumsum(blocks, axis=1, out=blocks)
+    return local[:n + 1], blocks[:, -1]
+
+
+def _window_sum(prefix, window, out):
+    """
+    Internal function: Trailing window sums from a blocked prefix sum.
+
+    out[r] receives sum(values[r:r + window]), for r = 0 .. n - window.
+    """
+    local, totals = prefix
+    n = len(local) - 1
+    np.subtract(local[window:], local[:-window], out=out)
+    # Windows that cross a block boundary m (start <= m < end) are
+    # missing the full sum of the block ending at m
+    boundaries = np.arange(PREFIX_BLOCK, n, PREFIX_BLOCK)
+    rows = (boundaries - window + 1)[:, None] + np.arange(window)
+    block_sums = np.broadcast_to(
+        totals[boundaries // PREFIX_BLOCK - 1][:, None], rows.shape
+    )
+    inside = rows < len(out)
+    out[rows[inside]] += block_sums[inside]
+    return out
+
+
+def _rolling_mean(prefix, window, out=None):
+    """
+    Internal function: Trailing mean over window rows from a prefix sum.
+
+    Rows before the window is full are NaN (pandas min_periods=window).
+    """
+    n = len(prefix[0]) - 1
+    if out is None:
+        out = np.empty(n)
+    out[:window - 1] = np.nan
+    if n >= window:
+        _window_sum(prefix, window, out[window - 1:])
+        out[window - 1:] /= window
+    return out
+
+
+def _rolling_std(values, window, out, offset=0):
+    """
+    Internal function: Trailing sample std (ddof=1) over window rows.
+
+    values[i] is written to out[i + offset]; the first offset rows of
+    out are NaN as well as the warm-up.
+    """
+    n = len(values)
+    out[:offset + window - 1] = np.nan
+    if n < window:
+        return out
+    result = out[offset + window - 1:]
+    window_sum = _window_sum(_prefix_sum(values), window,
+                             np.empty(len(result)))
+    _window_sum(_prefix_sum(values * values), window, result)
+    result -= window_sum * window_sum / window
+    result /= window - 1
+    # Rounding can leave tiny negative variances on flat windows
+    np.maximum(result, 0, out=result)
+    np.sqrt(result, out=result)
+    return out
+
+
+def _pct_change(values, period, out):
+    """
+    Internal function: values[t] / values[t - period] - 1 into out.
+    """
+    period = min(period, len(values))
+    out[:period] = np.nan
+    np.divide(values[period:], values[:len(values) - period], out=out[period:])
+    out[period:] -= 1
+    return out
+
+
+def _divide(numerator, denominator):
+    """
+    Internal function: Float division with NumPy semantics (x/0 = ±inf,
+    0/0 = NaN) instead of ZeroDivisionError.
+    """
+    try:
+        return numerator / denominator
+    except ZeroDivisionError:
+        if numerator == 0 or numerator != numerator:
+            return math.nan
+        return math.copysign(math.inf, numerator) * math.copysign(1.0, denominator)
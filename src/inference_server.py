@@ -0,0 +1,323 @@
+"""
+TradeCare Inference Server Module
+
+Standalone HTTP prediction endpoint for other services, next to the
+Streamlit app (Procfile process 'api').
+
+A plain ASGI application with no web framework: routing is one dict
+lookup and each request does JSON (or Arrow) decoding plus one
+LinearBundle product, so single predictions cost tens of microseconds
+of Python. Models come from the same ModelStore as the dashboard's
+load_models(), in the feature order of the version's feature_names.pkl,
+and are hot-reloaded when a new version is published; every request
+scores with the version it started on.
+
+Endpoints:
+    GET  /health          Model version, feature order, horizons and
+                          metrics
+    POST /predict         One row: {"features": {name: value, ...}} or
+                          {"features": [14 values]}
+    POST /predict/batch   Many rows: {"features": [[14 values], ...]}
+                          or {"features": [{name: value, ...}, ...]}
+    POST /predict/arrow   Arrow IPC stream with one column per feature
+                          in, Arrow IPC stream of the predictions out
+
+Run (from the project root):
+    uvicorn src.inference_server:app --port 8000
+"""
+
+import asyncio
+import json
+import logging
+import math
+import os
+
+import numpy as np
+import pyarrow as pa
+
+from src.model_registry import MODELS_DIR
+from src.model_store import ModelStore
+from src.prediction import PREDICTION_COLUMNS, prediction_columns
+
+# Largest accepted request body
+MAX_BODY_BYTES = 64 * 1024 * 1024
+
+# Batches with more rows are scored in a worker thread, off the event loop
+THREAD_ROWS = 10_000
+
+# Errors not raised as HTTPError are logged here and answered with a 500
+logger = logging.getLogger(__name__)
+
+# Media types
+JSON_TYPE = b'application/json'
+ARROW_TYPE = b'application/vnd.apache.arrow.stream'
+
+
+class HTTPError(Exception):
+    """
+    Request error returned to the client as {"error": message}.
+    """
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class InferenceApp:
+    """
+    ASGI prediction application.
+
+    Attributes:
+        store (ModelStore): Source of the current model version
+
+    Example:
+        >>> app = InferenceApp(ModelStore('outputs/models'))
+        >>> # uvicorn.run(app, port=8000)
+    """
+
+    def __init__(self, store=None, models_dir=MODELS_DIR):
+        """
+        Args:
+            store (ModelStore): Model store (default: a new store over
+                models_dir)
+            models_dir (str): Models directory if no store is given
+        """
+        self.store = store if store is not None else ModelStore(models_dir)
+        self.routes = {
+            ('GET', '/health'): self.health,
+            ('POST', '/predict'): self.predict,
+            ('POST', '/predict/batch'): self.predict_batch,
+            ('POST', '/predict/arrow'): self.predict_arrow,
+        }
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+            return
+        if scope['type'] != 'http':
+            return
+
+        try:
+            handler = self.routes.get((scope['method'], scope['path']))
+            if handler is None:
+                if any(path == scope['path'] for _, path in self.routes):
+                    raise HTTPError(405, f"Method {scope['method']} not allowed")
+                raise HTTPError(404, f"Not found: {scope['path']}")
+            body = await _read_body(receive)
+            try:
+                model_version = self.store.current()
+            except (OSError, ValueError) as e:
+                raise HTTPError(503, f"Models not available: {e}")
+            status, content_type, payload = await handler(model_version, body)
+        except HTTPError as e:
+            status, content_type = e.status, JSON_TYPE
+            payload = _dump_json({'error': e.message})
+        except Exception:
+            logger.exception("Unhandled error in %s %s",
+                             scope['method'], scope['path'])
+            status, content_type = 500, JSON_TYPE
+            payload = _dump_json({'error': "Internal server error"})
+
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': [(b'content-type', content_type),
+                        (b'content-length', str(len(payload)).encode())],
+        })
+        await send({'type': 'http.response.body', 'body': payload})
+
+    async def health(self, model_version, body):
+        """
+        GET /health: the serving model version.
+        """
+        return 200, JSON_TYPE, _dump_json({
+            'status': 'ok',
+            'version': model_version.version,
+            'feature_names': model_version.feature_names,
+            'horizons': model_version.horizons,
+            'metrics': model_version.metrics,
+        })
+
+    async def predict(self, model_version, body):
+        """
+        POST /predict: one row.
+        """
+        features = _row_values(_load_json(body).get('features'),
+                               model_version.feature_names)
+        if not all(map(math.isfinite, features)):
+            raise HTTPError(400, "Feature values must be finite")
+        outputs = model_version.bundle.predict(features)
+        horizons = model_version.horizons
+        if horizons is None:
+            payload = dict(zip(PREDICTION_COLUMNS, outputs))
+        else:
+            # Multi-output models: one key per output and horizon
+            values = [value for output in outputs for value in output.tolist()]
+            payload = dict(zip(prediction_columns(horizons), values))
+        payload['version'] = model_version.version
+        return 200, JSON_TYPE, _dump_json(payload)
+
+    async def predict_batch(self, model_version, body):
+        """
+        POST /predict/batch: many rows as JSON.
+        """
+        rows = _load_json(body).get('features')
+        if not isinstance(rows, list):
+            raise HTTPError(400, "'features' must be a list of rows")
+        names = model_version.feature_names
+        try:
+            # Fast path: a list of equal-length number lists
+            features = np.array(rows)
+        except (TypeError, ValueError):
+            features = None
+        if (features is None or features.dtype.kind not in 'iuf'
+                or features.shape[1:] != (len(names),)
+                or _has_bools(rows)):
+            features = np.array([_row_values(row, names) for row in rows],
+                                dtype=np.float64).reshape(-1, len(names))
+        features = features.astype(np.float64, copy=False)
+        results = await _score(model_version.service.predict, features)
+        payload = {
+            name: (results[name].tolist() if name.startswith('predicted_class')
+                   else _json_floats(results[name]))
+            for name in results.columns
+        }
+        payload['version'] = model_version.version
+        return 200, JSON_TYPE, _dump_json(payload)
+
+    async def predict_arrow(self, model_version, body):
+        """
+        POST /predict/arrow: Arrow IPC stream in and out.
+        """
+        try:
+            table = pa.ipc.open_stream(body).read_all()
+        except (pa.ArrowInvalid, OSError) as e:
+            raise HTTPError(400, f"Invalid Arrow IPC stream: {e}")
+        try:
+            results = await _score(model_version.service.predict_table, table)
+        except KeyError as e:
+            raise HTTPError(400, str(e.args[0]))
+        except (ValueError, TypeError, pa.ArrowInvalid) as e:
+            # e.g. a feature column of strings
+            raise HTTPError(400, f"Feature columns must be numeric: {e}")
+
+        sink = pa.BufferOutputStream()
+        result_table = pa.Table.from_pandas(results, preserve_index=False)
+        metadata = {b'model_version': str(model_version.version).encode()}
+        result_table = result_table.replace_schema_metadata(metadata)
+        with pa.ipc.new_stream(sink, result_table.schema) as writer:
+            writer.write_table(result_table)
+        return 200, ARROW_TYPE, sink.getvalue().to_pybytes()
+
+    async def _lifespan(self, receive, send):
+        """
+        Internal function: Load the models at startup, not on the first
+        request.
+        """
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                try:
+                    self.store.current()
+                except (OSError, ValueError) as e:
+                    await send({'type': 'lifespan.startup.failed',
+                                'message': str(e)})
+                    return
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+
+# Application served by 'uvicorn src.inference_server:app'
+app = InferenceApp(models_dir=os.environ.get('TRADECARE_MODELS_DIR', MODELS_DIR))
+
+
+async def _read_body(receive):
+    """
+    Internal function: Whole request body, at most MAX_BODY_BYTES.
+    """
+    chunks = []
+    size = 0
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            raise HTTPError(400, "Client disconnected")
+        chunk = message.get('body', b'')
+        size += len(chunk)
+        if size > MAX_BODY_BYTES:
+            raise HTTPError(413, f"Body larger than {MAX_BODY_BYTES} bytes")
+        chunks.append(chunk)
+        if not message.get('more_body', False):
+            return b''.join(chunks)
+
+
+async def _score(func, data):
+    """
+    Internal function: Score inline, or in a worker thread if large.
+    """
+    if len(data) > THREAD_ROWS:
+        return await asyncio.to_thread(func, data)
+    return func(data)
+
+
+def _load_json(body):
+    """
+    Internal function: Parse a JSON object body.
+    """
+    try:
+        payload = json.loads(body)
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise HTTPError(400, f"Invalid JSON: {e}")
+    if not isinstance(payload, dict):
+        raise HTTPError(400, "Body must be a JSON object")
+    return payload
+
+
+def _row_values(row, feature_names):
+    """
+    Internal function: One row (list, or dict keyed by feature name) as
+    a list of floats in feature_names order.
+    """
+    if isinstance(row, dict):
+        missing = [name for name in feature_names if name not in row]
+        if missing:
+            raise HTTPError(400, f"Missing features: {missing}")
+        row = [row[name] for name in feature_names]
+    if not isinstance(row, list) or len(row) != len(feature_names):
+        raise HTTPError(
+            400, f"Each row needs {len(feature_names)} features in order "
+                 f"{feature_names}"
+        )
+    # bool is an int subclass: true/false must not pass as 1.0/0.0
+    if not all(isinstance(value, (int, float)) and not isinstance(value, bool)
+               for value in row):
+        raise HTTPError(400, "Feature values must be numbers")
+    try:
+        return [float(value) for value in row]
+    except OverflowError:
+        raise HTTPError(400, "Feature values must be finite")
+
+
+def _has_bools(rows):
+    """
+    Internal function: True if any value of the row lists is a JSON
+    true/false (NumPy would silently turn it into 1.0/0.0).
+    """
+    return any(value is True or value is False
+               for row in rows for value in row)
+
+
+def _json_floats(values):
+    """
+    Internal function: Floats for JSON, None for NaN.
+    """
+    return [None if math.isnan(value) else value for value in values.tolist()]
+
+
+def _dump_json(payload):
+    """
+    Internal function: Compact UTF-8 JSON.
+    """
+    return json.dumps(payload, separators=(',', ':')).encode()
@@ -0,0 +1,341 @@
+"""
+TradeCare Model Registry Module
+
+Lazy, per-artifact access to the saved models.
+
+Nothing is read at construction: the regression model, classifier,
+scaler and feature names are each loaded on first access, so a process
+(or Streamlit page) that needs none of them pays nothing, and one that
+needs only the feature names does not unpickle sklearn.
+
+Array-heavy artifacts are loaded with joblib.load(mmap_mode='r'): their
+NumPy arrays stay memory-mapped read-only views of the pickle file, so
+several worker processes share the same physical pages instead of each
+holding a private copy. Each artifact's load time is recorded.
+
+Models are versioned through manifest.json in the models directory:
+version, training data hash, feature order, target horizons of
+multi-output models, metrics and the artifact file of each model.
+publish_models() writes a new version's pickles to their own
+versions/<version>/ directory and only then atomically replaces the
+manifest, so files that a running process has loaded (or memory-mapped)
+are never overwritten, and a reader sees either the old manifest or the
+new one, never a partial write.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import datetime
+
+import joblib
+
+
+# Saved model artifacts (written by 4_ModelTraining.ipynb)
+MODELS_DIR = 'outputs/models'
+MODEL_FILES = {
+    'regression_model': 'regression_model.pkl',
+    'classification_model': 'classification_model.pkl',
+    'scaler': 'scaler.pkl',
+    'feature_names': 'feature_names.pkl',
+}
+
+# Artifacts whose arrays are memory-mapped (feature_names is a list)
+MMAP_ARTIFACTS = {'regression_model', 'classification_model', 'scaler'}
+
+# Version manifest, and where publish_models() puts each version's files
+MANIFEST_FILE = 'manifest.json'
+VERSIONS_DIR = 'versions'
+
+
+class ModelRegistry:
+    """
+    Loads each model artifact on first access and caches it.
+
+    Thread-safe: concurrent first accesses load an artifact once.
+
+    Attributes:
+        models_dir (str): Directory holding the artifacts
+        files (dict): Artifact name -> file path relative to models_dir
+        manifest (dict): Manifest the registry was built from, or None
+        load_times (dict): Artifact name -> seconds its load took
+        total_load_seconds (float): Class attribute: load time of every
+            artifact loaded by any registry in this process
+
+    Example:
+        >>> registry = ModelRegistry()
+        >>> registry.feature_names  # loads only feature_names.pkl
+        >>> registry.load_times
+        {'feature_names': 0.0002}
+    """
+
+    total_load_seconds = 0.0
+
+    def __init__(self, models_dir=MODELS_DIR, mmap=True, files=None,
+                 manifest=None):
+        """
+        Args:
+            models_dir (str): Directory holding the artifacts
+            mmap (bool): Memory-map the arrays of MMAP_ARTIFACTS
+            files (dict): Artifact name -> relative file path (default:
+                the manifest's files, else MODEL_FILES)
+            manifest (dict): Manifest describing this model version
+        """
+        self.models_dir = models_dir
+        self.mmap = mmap
+        self.manifest = manifest
+        self.files = dict(files or (manifest or {}).get('files') or MODEL_FILES)
+        self.load_times = {}
+        self._artifacts = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_manifest(cls, models_dir=MODELS_DIR, mmap=True):
+        """
+        Registry over the version named in models_dir's manifest.
+
+        Falls back to the unversioned MODEL_FILES layout if there is no
+        manifest.
+
+        Args:
+            models_dir (str): Directory holding MANIFEST_FILE
+            mmap (bool): Memory-map the arrays of MMAP_ARTIFACTS
+
+        Returns:
+            ModelRegistry: Registry pinned to that version's files
+        """
+        manifest = read_manifest(models_dir)
+        return cls(models_dir, mmap=mmap, manifest=manifest)
+
+    @property
+    def version(self):
+        """
+        Manifest version string (None without a manifest).
+        """
+        return (self.manifest or {}).get('version')
+
+    def get(self, name):
+        """
+        Return an artifact, loading it on first access.
+
+        Args:
+            name (str): One of MODEL_FILES
+
+        Returns:
+            object: The unpickled artifact
+
+        Raises:
+            KeyError: If name is not a known artifact
+            FileNotFoundError: If its file does not exist
+        """
+        if name in self._artifacts:
+            return self._artifacts[name]
+        if name not in self.files:
+            raise KeyError(
+                f"Unknown model artifact: {name}\n"
+                f"Expected one of: {list(self.files)}"
+            )
+        with self._lock:
+            if name not in self._artifacts:
+                self._artifacts[name] = self._load(name)
+        return self._artifacts[name]
+
+    @property
+    def regression_model(self):
+        """
+        Fitted LinearRegression (BR1).
+        """
+        return self.get('regression_model')
+
+    @property
+    def classification_model(self):
+        """
+        Fitted LogisticRegression (BR2).
+        """
+        return self.get('classification_model')
+
+    @property
+    def scaler(self):
+        """
+        Fitted StandardScaler.
+        """
+        return self.get('scaler')
+
+    @property
+    def feature_names(self):
+        """
+        Feature order the models expect.
+        """
+        return self.get('feature_names')
+
+    def path(self, name):
+        """
+        File path of an artifact.
+        """
+        return os.path.join(self.models_dir, self.files[name])
+
+    def missing(self):
+        """
+        Names of artifacts whose files do not exist.
+
+        Returns:
+            list: Missing artifact names (empty if all are present)
+        """
+        return [name for name in self.files
+                if not os.path.exists(self.path(name))]
+
+    def is_loaded(self, name):
+        """
+        True if the artifact has already been loaded.
+        """
+        return name in self._artifacts
+
+    def _load(self, name):
+        """
+        Internal function: Load one artifact and record its load time.
+        """
+        path = self.path(name)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Model file not found: {path}")
+        mmap_mode = 'r' if self.mmap and name in MMAP_ARTIFACTS else None
+        start = time.perf_counter()
+        artifact = joblib.load(path, mmap_mode=mmap_mode)
+        self.load_times[name] = time.perf_counter() - start
+        ModelRegistry.total_load_seconds += self.load_times[name]
+        return artifact
+
+
+def read_manifest(models_dir=MODELS_DIR):
+    """
+    Read a models directory's manifest.
+
+    Args:
+        models_dir (str): Directory holding MANIFEST_FILE
+
+    Returns:
+        dict: Manifest (version, created_at, training_data_sha256,
+        feature_names, horizons, metrics, files), or None if there is
+        none
+    """
+    path = os.path.join(models_dir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def write_manifest(manifest, models_dir=MODELS_DIR):
+    """
+    Atomically replace a models directory's manifest.
+
+    The manifest is written to a temporary file in the same directory
+    and renamed over MANIFEST_FILE, so readers never see it half
+    written.
+
+    Args:
+        manifest (dict): Manifest to write
+        models_dir (str): Directory holding MANIFEST_FILE
+
+    Returns:
+        str: Path of the manifest
+    """
+    path = os.path.join(models_dir, MANIFEST_FILE)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+        f.write('\n')
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return path
+
+
+def publish_models(regression_model, classification_model, scaler,
+                   feature_names, models_dir=MODELS_DIR, version=None,
+                   metrics=None, training_data=None, horizons=None):
+    """
+    Save a new model version and make it the current one.
+
+    The artifacts go to models_dir/versions/<version>/; the manifest is
+    replaced last, so processes polling it switch only once every file
+    of the new version is complete.
+
+    Args:
+        regression_model: Fitted LinearRegression
+        classification_model: Fitted LogisticRegression
+        scaler: Fitted StandardScaler
+        feature_names (list): Feature order the models expect
+        models_dir (str): Models directory
+        version (str): Version label (default: the current manifest's
+            version + 1, or '1')
+        metrics (dict): Evaluation metrics to record
+        training_data (str): Path of the training dataset, hashed into
+            training_data_sha256
+        horizons (list): Hours ahead of each output of multi-output
+            models (recorded so the models are served per horizon)
+
+    Returns:
+        dict: The new manifest
+
+    Raises:
+        FileExistsError: If the version has already been published
+    """
+    if version is None:
+        version = _next_version(read_manifest(models_dir))
+    version = str(version)
+    version_dir = os.path.join(VERSIONS_DIR, version)
+    if os.path.exists(os.path.join(models_dir, version_dir)):
+        raise FileExistsError(
+            f"Model version {version} already exists in {models_dir}"
+        )
+    os.makedirs(os.path.join(models_dir, version_dir))
+
+    artifacts = {
+        'regression_model': regression_model,
+        'classification_model': classification_model,
+        'scaler': scaler,
+        'feature_names': list(feature_names),
+    }
+    files = {}
+    for name, artifact in artifacts.items():
+        files[name] = f"{VERSIONS_DIR}/{version}/{MODEL_FILES[name]}"
+        joblib.dump(artifact, os.path.join(models_dir, files[name]))
+
+    manifest = {
+        'version': version,
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'training_data': training_data,
+        'training_data_sha256': (file_sha256(training_data)
+                                 if training_data else None),
+        'feature_names': list(feature_names),
+        'horizons': None if horizons is None else list(horizons),
+        'metrics': metrics or {},
+        'files': files,
+    }
+    write_manifest(manifest, models_dir)
+    return manifest
+
+
+def file_sha256(path, chunk_bytes=1 << 20):
+    """
+    SHA-256 hex digest of a file, read in chunks.
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_bytes), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _next_version(manifest):
+    """
+    Internal function: Version after the manifest's (integer versions).
+    """
+    if manifest is None:
+        return '1'
+    try:
+        return str(int(manifest['version']) + 1)
+    except (KeyError, TypeError, ValueError):
+        return datetime.now().strftime('%Y%m%d%H%M%S')
@@ -0,0 +1,232 @@
+"""
+TradeCare Model Store Module
+
+Hot reload of versioned models in a long-running process.
+
+ModelStore holds the current ModelVersion: a registry pinned to one
+manifest version plus its LinearBundle. current() costs a clock read;
+at most every POLL_SECONDS it also stats the manifest, and only if its
+mtime/size/inode changed is it re-read. A new version is loaded and
+checked completely before one reference assignment swaps it in, so
+callers never see a half-loaded version, and a bad publish leaves the
+old version serving (the error is kept in last_error).
+
+Callers take current() once per request and use that ModelVersion
+throughout: a request in flight during a swap finishes on the version
+it started with, which stays alive until its last reference is dropped.
+"""
+
+import os
+import threading
+import time
+
+from src.model_registry import (
+    MANIFEST_FILE, MODEL_FILES, MODELS_DIR, ModelRegistry, read_manifest
+)
+from src.prediction import PredictionService
+
+# Minimum seconds between two stats of the manifest
+POLL_SECONDS = 5.0
+
+
+class ModelVersion:
+    """
+    One fully loaded model version.
+
+    Attributes:
+        version (str): Manifest version (None without a manifest)
+        manifest (dict): The version's manifest (None without one)
+        registry (ModelRegistry): Registry over the version's files
+        service (PredictionService): Batch scoring with the version
+        bundle (LinearBundle): Folded scaler and models
+        loaded_at (float): time.time() when the version was loaded
+    """
+
+    def __init__(self, registry):
+        """
+        Load every artifact of the registry and fold the bundle.
+
+        Args:
+            registry (ModelRegistry): Registry pinned to one version
+
+        Raises:
+            FileNotFoundError: If an artifact is missing
+            ValueError: If the saved feature order does not match the
+                manifest, or the bundle does not reproduce the models
+        """
+        missing = registry.missing()
+        if missing:
+            raise FileNotFoundError(
+                f"Model files not found in {registry.models_dir}: {missing}"
+            )
+        feature_names = list(registry.feature_names)
+        manifest = registry.manifest or {}
+        expected = manifest.get('feature_names')
+        if expected is not None and list(expected) != feature_names:
+            raise ValueError(
+                f"Model version {registry.version}: feature_names.pkl does "
+                f"not match the manifest feature order"
+            )
+        self.registry = registry
+        self.manifest = registry.manifest
+        self.version = registry.version
+        self.service = PredictionService(
+            registry.regression_model, registry.classification_model,
+            registry.scaler, feature_names, horizons=manifest.get('horizons')
+        )
+        self.bundle = self.service.bundle
+        self.loaded_at = time.time()
+
+    @property
+    def feature_names(self):
+        """
+        Feature order the models expect.
+        """
+        return self.service.feature_names
+
+    @property
+    def horizons(self):
+        """
+        Hours ahead of each output (None for single-output models).
+        """
+        return self.service.horizons
+
+    @property
+    def metrics(self):
+        """
+        Metrics recorded in the manifest.
+        """
+        return (self.manifest or {}).get('metrics', {})
+
+    def models(self):
+        """
+        (regression_model, classification_model, scaler, feature_names)
+        """
+        return tuple(self.registry.get(name) for name in MODEL_FILES)
+
+
+class ModelStore:
+    """
+    Current model version of a models directory, reloaded on change.
+
+    Thread-safe: one thread reloads while the others keep being served
+    the current version.
+
+    Attributes:
+        models_dir (str): Directory holding MANIFEST_FILE
+        poll_seconds (float): Minimum seconds between manifest stats
+        last_error (Exception): Why the newest manifest could not be
+            loaded, or None
+        reloads (int): Versions swapped in after the first
+
+    Example:
+        >>> store = ModelStore('outputs/models')
+        >>> models = store.current()  # hold for the whole request
+        >>> models.version, models.bundle.predict(features_row)
+    """
+
+    def __init__(self, models_dir=MODELS_DIR, poll_seconds=POLL_SECONDS,
+                 mmap=True):
+        """
+        Args:
+            models_dir (str): Directory holding MANIFEST_FILE
+            poll_seconds (float): Minimum seconds between manifest stats
+            mmap (bool): Memory-map the model arrays
+        """
+        self.models_dir = models_dir
+        self.poll_seconds = poll_seconds
+        self.mmap = mmap
+        self.last_error = None
+        self.reloads = 0
+        self._current = None
+        self._signature = None
+        self._next_poll = 0.0
+        self._lock = threading.Lock()
+
+    def current(self):
+        """
+        The current ModelVersion, after a due manifest poll.
+
+        Returns:
+            ModelVersion: Fully loaded version; keep the reference for
+            the duration of a request
+
+        Raises:
+            FileNotFoundError, ValueError: If no version could ever be
+                loaded
+        """
+        if time.monotonic() >= self._next_poll or self._current is None:
+            self.refresh()
+        if self._current is None:
+            raise self.last_error
+        return self._current
+
+    @property
+    def loaded(self):
+        """
+        The current ModelVersion without polling (None if none loaded).
+        """
+        return self._current
+
+    def refresh(self, force=False):
+        """
+        Stat the manifest and swap in a new version if it changed.
+
+        If another thread is already refreshing, return immediately
+        (unless nothing is loaded yet) and let it finish the swap.
+
+        Args:
+            force (bool): Re-read the manifest even if its stat did not
+                change
+
+        Returns:
+            bool: True if a new version was swapped in
+        """
+        blocking = self._current is None
+        if not self._lock.acquire(blocking=blocking):
+            return False
+        try:
+            self._next_poll = time.monotonic() + self.poll_seconds
+            signature = self._manifest_signature()
+            if (not force and self._current is not None
+                    and signature == self._signature):
+                return False
+            self._signature = signature
+            return self._load()
+        finally:
+            self._lock.release()
+
+    def _load(self):
+        """
+        Internal function: Load the manifest's version and swap it in.
+        """
+        try:
+            manifest = read_manifest(self.models_dir)
+            current = self._current
+            if (current is not None and manifest is not None
+                    and current.manifest == manifest):
+                # Touched or rewritten, same version
+                return False
+            version = ModelVersion(ModelRegistry(
+                self.models_dir, mmap=self.mmap, manifest=manifest
+            ))
+        except (OSError, ValueError, KeyError) as e:
+            self.last_error = e
+            return False
+        self.last_error = None
+        if self._current is not None:
+            self.reloads += 1
+        # Single reference assignment: readers see the old or the new
+        # version, never a mix
+        self._current = version
+        return True
+
+    def _manifest_signature(self):
+        """
+        Internal function: (mtime_ns, size, inode) of the manifest.
+        """
+        try:
+            stat = os.stat(os.path.join(self.models_dir, MANIFEST_FILE))
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
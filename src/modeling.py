@@ -0,0 +1,273 @@
+"""
+TradeCare Modeling Module
+
+The model setup of 4_ModelTraining.ipynb in one place, shared by the
+training pipeline and the walk-forward backtest:
+- Targets of 3_FeatureEngineering.ipynb (4-hour ahead return and its
+  profitable/not flag), and the same targets at several horizons as one
+  2-D array for multi-output models
+- The 2020+ design matrix as contiguous float64 arrays
+- StandardScaler fitted on the training rows only
+- LinearRegression (BR1) and LogisticRegression(max_iter=1000,
+  random_state=42) (BR2); with 2-D targets, one multi-output
+  LinearRegression and one LogisticRegression per horizon
+- The notebook's metrics: RMSE, MAE, R², accuracy and ROC-AUC
+
+Scaling is applied as (X - mean_) / scale_ in NumPy, which is what
+StandardScaler.transform computes, without its per-call validation.
+"""
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+from sklearn.linear_model import LinearRegression, LogisticRegression
+from sklearn.metrics import (
+    accuracy_score, mean_absolute_error, mean_squared_error, r2_score,
+    roc_auc_score
+)
+from sklearn.multioutput import MultiOutputClassifier
+from sklearn.preprocessing import StandardScaler
+
+from src.data_schema import FEATURE_COLUMNS, read_features_csv
+
+
+# Engineered dataset written by 3_FeatureEngineering.ipynb
+FEATURES_FILE = 'inputs/datasets/processed/bitcoin_features.csv'
+
+# Training data starts here (gap-free, recent market regime)
+START_DATE = '2020-01-01'
+
+# Targets: return TARGET_HORIZON hours ahead, and whether it is > 0
+TARGET_HORIZON = 4
+REGRESSION_TARGET = 'target_return_simple'
+CLASSIFICATION_TARGET = 'target_profitable'
+
+# Horizons (hours ahead) of the multi-output targets
+TARGET_HORIZONS = [1, 4, 12, 24]
+
+# Chronological hold-out fraction (train_test_split(shuffle=False))
+TEST_SIZE = 0.2
+
+# BR2 model parameters
+LOGISTIC_PARAMS = {'max_iter': 1000, 'random_state': 42}
+
+# Metric names, in report order
+REGRESSION_METRICS = ['rmse', 'mae', 'r2']
+CLASSIFICATION_METRICS = ['accuracy', 'roc_auc']
+
+
+def target_matrix(close, horizons=TARGET_HORIZONS):
+    """
+    Forward returns at several horizons, in one pass over the prices.
+
+    Column j is close.shift(-horizons[j]) / close - 1, as the notebook's
+    target: each row reads its horizons from one sliding window over the
+    NaN-padded prices, so all columns come from a single gather.
+
+    Args:
+        close (array-like): CLOSE_PRICE, hourly and in time order
+        horizons (list): Hours ahead, one column each
+
+    Returns:
+        np.ndarray: (n, len(horizons)) float64 returns, NaN where the
+        horizon runs past the last row
+    """
+    close = np.asarray(close, dtype=np.float64)
+    horizons = np.asarray(horizons, dtype=np.intp)
+    padded = np.concatenate([close, np.full(horizons.max(), np.nan)])
+    windows = sliding_window_view(padded, horizons.max() + 1)
+    return windows[:, horizons] / close[:, None] - 1
+
+
+def add_targets(df, horizon=TARGET_HORIZON):
+    """
+    Return a copy of df with the notebook's target columns added.
+
+    target_return_simple is the CLOSE_PRICE return horizon hours ahead
+    (NaN for the last horizon rows); target_profitable is 1 where that
+    return is > 0.
+
+    Args:
+        df (pd.DataFrame): Data sorted by time with CLOSE_PRICE
+        horizon (int): Hours ahead
+
+    Returns:
+        pd.DataFrame: df plus REGRESSION_TARGET and CLASSIFICATION_TARGET
+    """
+    future_return = target_matrix(df['CLOSE_PRICE'], [horizon])[:, 0]
+    df = df.copy()
+    df[REGRESSION_TARGET] = future_return
+    df[CLASSIFICATION_TARGET] = (future_return > 0).astype(int)
+    return df
+
+
+def load_design_matrix(path=FEATURES_FILE, start=START_DATE, horizons=None):
+    """
+    Load the features dataset as model-ready arrays.
+
+    Args:
+        path (str): Features CSV (or a DataFrame already loaded)
+        start (str): First timestamp kept (None keeps every row)
+        horizons (list): Build (n, len(horizons)) targets from
+            CLOSE_PRICE with target_matrix instead of the file's 4-hour
+            target columns; rows missing any horizon are dropped
+
+    Returns:
+        dict: X (n, 14) C-ordered float64 in FEATURE_COLUMNS order,
+        y_return (n,) or (n, h) float64, y_class (n,) or (n, h) int8
+        and timestamp (n,) datetime64, in time order
+    """
+    df = path if isinstance(path, pd.DataFrame) \
+        else read_features_csv(path, float64=True)
+    if start is not None:
+        df = df[df['timestamp'] >= start]
+    if horizons is None:
+        df = df.dropna(subset=FEATURE_COLUMNS + [REGRESSION_TARGET])
+        y_return = df[REGRESSION_TARGET].to_numpy(dtype=np.float64)
+        y_class = df[CLASSIFICATION_TARGET].to_numpy(dtype=np.int8)
+    else:
+        y_return = target_matrix(df['CLOSE_PRICE'], horizons)
+        keep = (df[FEATURE_COLUMNS].notna().all(axis=1).to_numpy()
+                & np.isfinite(y_return).all(axis=1))
+        df = df[keep]
+        y_return = np.ascontiguousarray(y_return[keep])
+        y_class = (y_return > 0).astype(np.int8)
+    return {
+        'X': np.ascontiguousarray(df[FEATURE_COLUMNS].to_numpy(dtype=np.float64)),
+        'y_return': y_return,
+        'y_class': y_class,
+        'timestamp': df['timestamp'].to_numpy(),
+    }
+
+
+def split_index(n_rows, test_size=TEST_SIZE):
+    """
+    First test row of a chronological split, as
+    train_test_split(shuffle=False) places it.
+    """
+    return n_rows - int(np.ceil(n_rows * test_size))
+
+
+def fit_scaler(X_train):
+    """
+    StandardScaler fitted on the training rows.
+
+    Fitted through a DataFrame so feature_names_in_ records
+    FEATURE_COLUMNS, like the notebook's scaler.
+
+    Args:
+        X_train (np.ndarray): (n, 14) training features
+
+    Returns:
+        StandardScaler: Fitted scaler
+    """
+    scaler = StandardScaler()
+    scaler.fit(pd.DataFrame(X_train, columns=FEATURE_COLUMNS, copy=False))
+    return scaler
+
+
+def scale(scaler, X):
+    """
+    StandardScaler.transform as one NumPy expression.
+    """
+    return (X - scaler.mean_) / scaler.scale_
+
+
+def fit_regression(X_scaled, y_return):
+    """
+    Fit the BR1 LinearRegression (multi-output for (n, h) targets).
+    """
+    return LinearRegression().fit(X_scaled, y_return)
+
+
+def fit_classification(X_scaled, y_class):
+    """
+    Fit the BR2 LogisticRegression, or one per column of (n, h) targets
+    (MultiOutputClassifier).
+    """
+    model = LogisticRegression(**LOGISTIC_PARAMS)
+    if np.ndim(y_class) == 2:
+        model = MultiOutputClassifier(model)
+    return model.fit(X_scaled, y_class)
+
+
+def regression_metrics(y_true, y_pred):
+    """
+    RMSE, MAE and R² of return predictions.
+
+    Returns:
+        dict: rmse, mae, r2 (NaN if fewer than 2 rows)
+    """
+    if len(y_true) < 2:
+        return {name: np.nan for name in REGRESSION_METRICS}
+    return {
+        'rmse': float(np.sqrt(mean_squared_error(y_true, y_pred))),
+        'mae': float(mean_absolute_error(y_true, y_pred)),
+        'r2': float(r2_score(y_true, y_pred)),
+    }
+
+
+def classification_metrics(y_true, y_pred, probability):
+    """
+    Accuracy and ROC-AUC of profitability predictions.
+
+    Returns:
+        dict: accuracy, roc_auc (NaN if y_true has a single class)
+    """
+    if len(y_true) == 0:
+        return {name: np.nan for name in CLASSIFICATION_METRICS}
+    single_class = np.all(y_true == y_true[0])
+    return {
+        'accuracy': float(accuracy_score(y_true, y_pred)),
+        'roc_auc': np.nan if single_class
+        else float(roc_auc_score(y_true, probability)),
+    }
+
+
+def evaluate(regression_model, classification_model, X_scaled, y_return,
+             y_class):
+    """
+    All notebook metrics of both models on scaled features.
+
+    Returns:
+        dict: rmse, mae, r2, accuracy, roc_auc
+    """
+    probability = classification_model.predict_proba(X_scaled)[:, 1]
+    predicted_class = classification_model.classes_[
+        (probability > 0.5).astype(np.intp)
+    ]
+    return {
+        **regression_metrics(y_return, regression_model.predict(X_scaled)),
+        **classification_metrics(y_class, predicted_class, probability),
+    }
+
+
+def evaluate_horizons(regression_model, classification_model, X_scaled,
+                      y_return, y_class, horizons):
+    """
+    Notebook metrics of multi-output models, per horizon.
+
+    Args:
+        regression_model: Multi-output LinearRegression
+        classification_model: MultiOutputClassifier
+        X_scaled (np.ndarray): Scaled features
+        y_return (np.ndarray): (n, h) returns
+        y_class (np.ndarray): (n, h) profitable flags
+        horizons (list): Hours ahead of each column
+
+    Returns:
+        dict: {horizon: {rmse, mae, r2, accuracy, roc_auc}}
+    """
+    predicted_return = regression_model.predict(X_scaled)
+    probabilities = classification_model.predict_proba(X_scaled)
+    results = {}
+    for j, horizon in enumerate(horizons):
+        estimator = classification_model.estimators_[j]
+        probability = probabilities[j][:, 1]
+        predicted_class = estimator.classes_[(probability > 0.5).astype(np.intp)]
+        results[horizon] = {
+            **regression_metrics(y_return[:, j], predicted_return[:, j]),
+            **classification_metrics(y_class[:, j], predicted_class,
+                                     probability),
+        }
+    return results
@@ -0,0 +1,395 @@
+"""
+TradeCare Multi-Asset Pipeline Module
+
+validate -> clean -> features for a basket of assets instead of the one
+hard-coded BTC source (DATA_URL).
+
+Each symbol has its own raw hourly CSV in the source layout (URL,
+file:// URL or local path) and optionally its own validation limits
+(a coin listed in 2020 has fewer rows and a different price scale than
+BTC). Symbols are processed independently in a process pool: a worker
+reads, validates, cleans and featurizes one symbol and writes its
+partitions itself, and only a one-row summary travels back to the
+parent, so throughput grows with the number of cores until there are
+fewer symbols than workers. The largest files are submitted first so a
+long history does not start last and leave the other workers idle.
+
+The output is one Parquet dataset partitioned by symbol and year:
+
+    <output_dir>/symbol=BTC/year=2020/part-0.parquet
+
+Every file has the same schema (dataset_schema: the columns of
+bitcoin_features.csv), and symbol and year come from the hive-style
+directory names. A symbol's partitions are written to a hidden
+temporary directory and swapped in when complete, so rerunning one
+symbol never leaves a mix of old and new years.
+
+Example:
+    python -m src.pipeline --source BTC=inputs/datasets/raw/btc.csv --source ETH=inputs/datasets/raw/eth.csv
+    python -m src.pipeline --source-dir inputs/datasets/raw/symbols --min-rows 20000
+"""
+
+import argparse
+import glob
+import os
+import re
+import shutil
+import time
+import urllib.parse
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from src.data_cleaning import clean_data
+from src.data_schema import FEATURE_COLUMNS, table_to_frame
+from src.features import add_features
+from src.modeling import CLASSIFICATION_TARGET, REGRESSION_TARGET, add_targets
+from src.raw_data_validation import parse_raw_data, validate_data
+
+
+# Partitioned features dataset
+DATASET_DIR = 'inputs/datasets/processed/features_by_symbol'
+PART_FILE = 'part-0.parquet'
+
+# Columns of every Parquet file (same layout as bitcoin_features.csv)
+DATASET_COLUMNS = (['timestamp', 'CLOSE_PRICE'] + FEATURE_COLUMNS
+                   + [REGRESSION_TARGET, CLASSIFICATION_TARGET])
+
+# Hive partition keys, encoded in the directory names
+PARTITION_SCHEMA = pa.schema([('symbol', pa.string()), ('year', pa.int16())])
+
+# Symbols become directory names: letters, digits, '-' and '_' only
+SYMBOL_PATTERN = re.compile(r'^[A-Z0-9][A-Z0-9_-]*$')
+
+# Results table columns
+RESULT_COLUMNS = ['symbol', 'rows_raw', 'rows_removed', 'rows_out',
+                  'first', 'last', 'years', 'seconds', 'error']
+
+
+@dataclass
+class SymbolSource:
+    """
+    Raw data source of one asset.
+
+    Attributes:
+        symbol (str): Asset name used as the partition key (upper-cased)
+        source (str): URL, file:// URL or local path of the raw CSV
+        limits (dict): Overrides of the validation thresholds for this
+            asset (see src.raw_data_validation.VALIDATION_LIMITS)
+    """
+    symbol: str
+    source: str
+    limits: dict = None
+
+    def __post_init__(self):
+        self.symbol = self.symbol.strip().upper()
+        if not SYMBOL_PATTERN.match(self.symbol):
+            raise ValueError(
+                f"Invalid symbol: {self.symbol!r}\n"
+                f"Use letters, digits, '-' and '_' only"
+            )
+
+
+def parse_sources(items, limits=None):
+    """
+    Build SymbolSources from 'SYMBOL=source' strings.
+
+    An item without '=' is a path whose file name (without extension)
+    is the symbol, e.g. inputs/datasets/raw/eth.csv -> ETH.
+
+    Args:
+        items (list): 'SYMBOL=source' strings or plain paths
+        limits (dict): Validation limits applied to every symbol
+
+    Returns:
+        list: SymbolSource per item
+
+    Raises:
+        ValueError: If a symbol is invalid or appears twice
+    """
+    sources = []
+    for item in items:
+        if '=' in item:
+            symbol, source = item.split('=', 1)
+        else:
+            symbol, source = os.path.splitext(os.path.basename(item))[0], item
+        sources.append(SymbolSource(symbol, source, limits))
+    _check_unique(sources)
+    return sources
+
+
+def dataset_schema():
+    """
+    Arrow schema shared by every file of the partitioned dataset.
+
+    Returns:
+        pa.Schema: DATASET_COLUMNS with 64-bit types (the partition
+        columns are not stored in the files)
+    """
+    fields = [('timestamp', pa.timestamp('ns')), ('CLOSE_PRICE', pa.float64())]
+    fields += [(col, pa.float64()) for col in FEATURE_COLUMNS]
+    fields += [(REGRESSION_TARGET, pa.float64()),
+               (CLASSIFICATION_TARGET, pa.int64())]
+    return pa.schema(fields)
+
+
+def run_pipeline(sources, output_dir=DATASET_DIR, workers=None,
+                 verbose=True):
+    """
+    Validate, clean and featurize every symbol into the dataset.
+
+    A symbol that fails (unreadable source, failed validation check) is
+    reported in its result row and leaves its existing partitions
+    untouched; the other symbols are still processed.
+
+    Args:
+        sources (list): SymbolSource objects (or 'SYMBOL=source'
+            strings, see parse_sources)
+        output_dir (str): Root of the partitioned dataset
+        workers (int): Worker processes (default: CPU count; 1 runs the
+            symbols in this process)
+        verbose (bool): Print a summary
+
+    Returns:
+        pd.DataFrame: One row per symbol with RESULT_COLUMNS (error is
+        None for symbols that were written)
+    """
+    sources = [source if isinstance(source, SymbolSource)
+               else parse_sources([source])[0] for source in sources]
+    _check_unique(sources)
+    workers = min(workers or os.cpu_count() or 1, len(sources))
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Largest first: a long history should not be the last task started
+    ordered = sorted(sources, key=_source_size, reverse=True)
+    started = time.perf_counter()
+    if workers == 1:
+        results = [_process_symbol(source, output_dir) for source in ordered]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_process_symbol, ordered,
+                                    [output_dir] * len(ordered)))
+    elapsed = time.perf_counter() - started
+
+    by_symbol = {result['symbol']: result for result in results}
+    table = pd.DataFrame([by_symbol[source.symbol] for source in sources],
+                         columns=RESULT_COLUMNS)
+    counts = ['rows_raw', 'rows_removed', 'rows_out', 'years']
+    table[counts] = table[counts].astype('Int64')  # NA for failed symbols
+    if verbose:
+        _print_summary(table, output_dir, workers, elapsed)
+    return table
+
+
+def load_dataset(output_dir=DATASET_DIR, symbols=None, years=None,
+                 columns=None):
+    """
+    Read the partitioned dataset, or part of it, into one frame.
+
+    Only the partitions of the requested symbols and years are opened.
+
+    Args:
+        output_dir (str): Root of the partitioned dataset
+        symbols (list): Symbols to read (default: all)
+        years (list): Years to read (default: all)
+        columns (list): Columns to read (default: all, plus symbol and
+            year)
+
+    Returns:
+        pd.DataFrame: Rows sorted by symbol, then time
+    """
+    dataset = ds.dataset(
+        output_dir, format='parquet',
+        schema=pa.unify_schemas([dataset_schema(), PARTITION_SCHEMA]),
+        partitioning=ds.partitioning(PARTITION_SCHEMA, flavor='hive')
+    )
+    condition = None
+    if symbols is not None:
+        condition = ds.field('symbol').isin([s.upper() for s in symbols])
+    if years is not None:
+        by_year = ds.field('year').isin(list(years))
+        condition = by_year if condition is None else condition & by_year
+    table = dataset.to_table(columns=columns, filter=condition)
+    df = table_to_frame(table)
+    keys = [key for key in ['symbol', 'timestamp'] if key in df.columns]
+    return df.sort_values(keys, kind='stable').reset_index(drop=True)
+
+
+def _process_symbol(source, output_dir):
+    """
+    Internal function: validate -> clean -> features for one symbol,
+    written to its partitions. Runs in a worker process.
+
+    Errors are returned in the result row rather than raised, so one
+    bad source does not cancel the rest of the basket.
+    """
+    started = time.perf_counter()
+    result = dict.fromkeys(RESULT_COLUMNS)
+    result['symbol'] = source.symbol
+    try:
+        df = _read_source(source.source)
+        result['rows_raw'] = len(df)
+        validate_data(df, source=source.source, verbose=False,
+                      limits=source.limits)
+
+        df_clean, summary = clean_data(df, verbose=False)
+        result['rows_removed'] = summary['rows_removed']
+        df_features = add_targets(add_features(df_clean))
+        df_features = df_features[DATASET_COLUMNS].dropna()
+
+        result['years'] = _write_partitions(df_features, source.symbol,
+                                            output_dir)
+        result['rows_out'] = len(df_features)
+        if len(df_features):
+            result['first'] = df_features['timestamp'].iloc[0]
+            result['last'] = df_features['timestamp'].iloc[-1]
+    except Exception as e:
+        result['error'] = str(e).splitlines()[0] or type(e).__name__
+    result['seconds'] = time.perf_counter() - started
+    return result
+
+
+def _read_source(source):
+    """
+    Internal function: Read a raw CSV from a URL or local path.
+
+    Parsed with parse_raw_data, so text in a numeric column reaches the
+    numeric_types check. 64-bit types keep the features identical to
+    the notebook.
+    """
+    if urllib.parse.urlparse(source).scheme in ('http', 'https', 'file'):
+        with urllib.request.urlopen(source, timeout=60) as response:
+            raw = response.read()
+    else:
+        with open(source, 'rb') as f:
+            raw = f.read()
+    return parse_raw_data(raw, float64=True, verbose=False)
+
+
+def _write_partitions(df, symbol, output_dir):
+    """
+    Internal function: Write one symbol's rows as one file per year.
+
+    The files go to a hidden directory (ignored by dataset readers)
+    that then replaces symbol=<symbol>.
+
+    Returns:
+        int: Number of year partitions written
+    """
+    final_dir = os.path.join(output_dir, f"symbol={symbol}")
+    tmp_dir = os.path.join(output_dir, f".symbol={symbol}.{os.getpid()}.tmp")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    table = pa.Table.from_pandas(df, schema=dataset_schema(),
+                                 preserve_index=False)
+    # Rows are sorted by time, so each year is one contiguous slice
+    years = df['timestamp'].dt.year.to_numpy()
+    changes = np.flatnonzero(years[1:] != years[:-1]) + 1
+    bounds = np.unique(np.r_[0, changes, len(years)])
+    for lo, hi in zip(bounds[:-1], bounds[1:]):
+        year_dir = os.path.join(tmp_dir, f"year={years[lo]}")
+        os.makedirs(year_dir)
+        pq.write_table(table.slice(lo, hi - lo),
+                       os.path.join(year_dir, PART_FILE))
+    os.makedirs(tmp_dir, exist_ok=True)
+
+    shutil.rmtree(final_dir, ignore_errors=True)
+    os.replace(tmp_dir, final_dir)
+    return len(bounds) - 1
+
+
+def _source_size(source):
+    """
+    Internal function: Byte size of a local source (0 if remote).
+    """
+    path = source.source
+    if path.startswith('file://'):
+        path = urllib.request.url2pathname(urllib.parse.urlparse(path).path)
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def _check_unique(sources):
+    """
+    Internal function: Reject a basket listing a symbol twice.
+
+    Raises:
+        ValueError: If two sources share a symbol
+    """
+    symbols = [source.symbol for source in sources]
+    duplicates = sorted({s for s in symbols if symbols.count(s) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate symbols: {', '.join(duplicates)}")
+
+
+def _print_summary(table, output_dir, workers, elapsed):
+    """
+    Internal function: Print one line per symbol and the totals.
+    """
+    print("=" * 60)
+    print("MULTI-ASSET FEATURE PIPELINE")
+    print("=" * 60)
+    for row in table.itertuples(index=False):
+        if row.error is None:
+            print(f"✓ {row.symbol}: {row.rows_out:,} rows, {row.years} "
+                  f"years ({row.rows_removed:,} removed, {row.seconds:.2f}s)")
+        else:
+            print(f"✗ {row.symbol}: {row.error}")
+    failed = table['error'].notna().sum()
+    print("-" * 60)
+    print(f"✓ {len(table) - failed} of {len(table)} symbols in "
+          f"{elapsed:.2f}s ({workers} workers)")
+    print(f"  Dataset: {output_dir}")
+    if failed:
+        print(f"⚠ {failed} symbols failed; their partitions were not changed")
+    print("=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build the partitioned multi-asset features dataset"
+    )
+    parser.add_argument('--source', action='append', default=[],
+                        metavar='SYMBOL=PATH',
+                        help="Raw CSV of one symbol (URL or path; repeat "
+                             "for each symbol)")
+    parser.add_argument('--source-dir',
+                        help="Directory of raw CSVs, one <symbol>.csv each")
+    parser.add_argument('--output', default=DATASET_DIR,
+                        help="Dataset root (default: %(default)s)")
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--min-rows', type=int,
+                        help="Minimum rows per symbol (validation)")
+    parser.add_argument('--min-timestamp', type=int,
+                        help="Earliest TIME_UNIX allowed (validation)")
+    parser.add_argument('--max-price', type=float,
+                        help="Highest price allowed (validation)")
+    args = parser.parse_args()
+
+    items = list(args.source)
+    if args.source_dir:
+        items += sorted(glob.glob(os.path.join(args.source_dir, '*.csv')))
+    if not items:
+        parser.error("no sources: use --source and/or --source-dir")
+    limits = {name: value for name, value in [
+        ('min_rows', args.min_rows),
+        ('min_timestamp', args.min_timestamp),
+        ('max_price', args.max_price),
+    ] if value is not None}
+
+    table = run_pipeline(parse_sources(items, limits or None),
+                         output_dir=args.output, workers=args.workers)
+    if table['error'].notna().any():
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,465 @@
+"""
+TradeCare Prediction Module
+
+Batch scoring of feature matrices with the saved models, for historical
+backtests and bulk re-scoring outside the dashboard.
+
+Both saved models are linear behind a StandardScaler, so LinearBundle
+folds the scaler's mean/scale into their coefficients once at load:
+prediction is one x @ W + b with a (14 x 2) W, column 0 the regression
+return and column 1 the logistic decision value, from which class and
+probability (sigmoid) both follow. No sklearn call, validation or
+dispatch happens per prediction; single rows cost microseconds.
+PredictionService runs the bundle over large inputs in batches of
+BATCH_ROWS to bound memory.
+"""
+
+import math
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+from src.model_registry import MODELS_DIR, MODEL_FILES, ModelRegistry
+
+# Rows scored per vectorized batch
+BATCH_ROWS = 262_144
+
+# Output columns
+PREDICTION_COLUMNS = ['predicted_return', 'predicted_class', 'probability']
+
+# Max allowed difference between a LinearBundle and the sklearn models
+BUNDLE_TOLERANCE = 1e-9
+
+
+class LinearBundle:
+    """
+    Scaler plus both linear models folded into one weight matrix.
+
+    With scaled = (x - mean) / scale, both models are
+    scaled @ coef + intercept, i.e. x @ W + b with
+    W = coef / scale and b = intercept - (mean / scale) @ coef.
+
+    Multi-output models (a LinearRegression fitted on (n, h) targets and
+    a MultiOutputClassifier of h LogisticRegressions) fold the same way
+    into a (14, 2h) W: one matrix multiply scores every horizon.
+
+    Attributes:
+        weights (np.ndarray): (14, 2 * n_outputs) folded coefficients,
+            regression columns first, then logistic decision columns
+        bias (np.ndarray): (2 * n_outputs,) folded intercepts
+        classes (np.ndarray): Classifier labels [negative, positive]
+        feature_names (list): Expected feature order
+        horizons (list): Hours ahead of each output (None for the
+            single-output models)
+
+    Example:
+        >>> bundle = LinearBundle.from_models(reg, clf, scaler, names)
+        >>> predicted_return, predicted_class, probability = \
+        ...     bundle.predict(features_row)
+    """
+
+    def __init__(self, weights, bias, classes, feature_names, horizons=None):
+        self.weights = np.ascontiguousarray(weights, dtype=np.float64)
+        self.bias = np.asarray(bias, dtype=np.float64)
+        self.classes = np.asarray(classes)
+        self.feature_names = list(feature_names)
+        self.horizons = None if horizons is None else list(horizons)
+
+    @property
+    def n_outputs(self):
+        """
+        Number of horizons (1 for the single-output models).
+        """
+        return self.weights.shape[1] // 2
+
+    @classmethod
+    def from_models(cls, regression_model, classification_model, scaler,
+                    feature_names, horizons=None, check=True):
+        """
+        Fold a StandardScaler and two linear models into a bundle.
+
+        Args:
+            regression_model: Fitted LinearRegression (single or
+                multi-output)
+            classification_model: Fitted binary LogisticRegression, or
+                a MultiOutputClassifier of them (one per horizon)
+            scaler: Fitted StandardScaler
+            feature_names (list): Feature order the models expect
+            horizons (list): Hours ahead of each output (required for
+                multi-output models)
+            check (bool): Compare with sklearn on probe rows around the
+                scaler mean and raise if off by more than
+                BUNDLE_TOLERANCE
+
+        Returns:
+            LinearBundle: Folded models
+
+        Raises:
+            ValueError: If a classifier is not binary, the two models
+                (or horizons) disagree on the number of outputs, or the
+                bundle does not reproduce the sklearn models
+        """
+        classifiers = _classifiers(classification_model)
+        for classifier in classifiers:
+            if len(classifier.classes_) != 2:
+                raise ValueError(
+                    "LinearBundle needs binary classifiers, got classes "
+                    f"{list(classifier.classes_)}"
+                )
+        regression_coef = np.atleast_2d(regression_model.coef_)
+        n_outputs = len(regression_coef)
+        if len(classifiers) != n_outputs:
+            raise ValueError(
+                f"Regression model has {n_outputs} outputs, classification "
+                f"model {len(classifiers)}"
+            )
+        if n_outputs > 1 and (horizons is None or len(horizons) != n_outputs):
+            raise ValueError(
+                f"Multi-output models need {n_outputs} horizons, got "
+                f"{horizons}"
+            )
+
+        mean = np.asarray(scaler.mean_, dtype=np.float64)
+        scale = np.asarray(scaler.scale_, dtype=np.float64)
+        coef = np.column_stack(
+            [regression_coef.T]
+            + [np.ravel(classifier.coef_) for classifier in classifiers]
+        )
+        intercept = np.concatenate([
+            np.ravel(regression_model.intercept_) * np.ones(n_outputs),
+            [float(np.ravel(classifier.intercept_)[0])
+             for classifier in classifiers],
+        ])
+        bundle = cls(coef / scale[:, None], intercept - (mean / scale) @ coef,
+                     classifiers[0].classes_, feature_names,
+                     horizons if n_outputs > 1 else None)
+        if check:
+            bundle._check(regression_model, classification_model, scaler)
+        return bundle
+
+    def select(self, horizon):
+        """
+        Single-output bundle of one horizon of a multi-output bundle.
+
+        Args:
+            horizon (int): Hours ahead, one of horizons
+
+        Returns:
+            LinearBundle: Bundle predicting that horizon only (self for
+            a single-output bundle)
+
+        Raises:
+            ValueError: If the bundle has no such horizon
+        """
+        if self.horizons is None:
+            return self
+        if horizon not in self.horizons:
+            raise ValueError(
+                f"No {horizon}h output; horizons are {self.horizons}"
+            )
+        j, k = self.horizons.index(horizon), self.n_outputs
+        return LinearBundle(self.weights[:, [j, k + j]], self.bias[[j, k + j]],
+                            self.classes, self.feature_names)
+
+    def decision(self, features):
+        """
+        Raw model outputs: x @ W + b.
+
+        Args:
+            features (np.ndarray): One row (14,) or a batch (n, 14)
+
+        Returns:
+            np.ndarray: (2 * n_outputs,) or (n, 2 * n_outputs)
+            regression returns and logistic decision values
+        """
+        return np.asarray(features, dtype=np.float64) @ self.weights + self.bias
+
+    def predict(self, features):
+        """
+        Regression return, class and probability of one row or a batch.
+
+        Args:
+            features (array-like): One row (14,) or a batch (n, 14) in
+                feature_names order
+
+        Returns:
+            tuple: (predicted_return, predicted_class, probability) -
+            floats/int for one row, arrays for a batch; multi-output
+            bundles return (n_outputs,) arrays for one row and
+            (n, n_outputs) arrays for a batch, one column per horizon
+        """
+        scores = self.decision(features)
+        k = self.n_outputs
+        if scores.ndim == 1 and k == 1:
+            decision = float(scores[1])
+            return (float(scores[0]),
+                    self.classes[int(decision > 0)].item(),
+                    _sigmoid_scalar(decision))
+        if k == 1:
+            decision = scores[:, 1]
+            return (scores[:, 0],
+                    self.classes[(decision > 0).astype(np.intp)],
+                    _sigmoid(decision))
+        decision = scores[..., k:]
+        return (scores[..., :k],
+                self.classes[(decision > 0).astype(np.intp)],
+                _sigmoid(decision))
+
+    def _check(self, regression_model, classification_model, scaler):
+        """
+        Internal function: Compare with sklearn on probe rows.
+
+        Raises:
+            ValueError: If any output differs by more than
+                BUNDLE_TOLERANCE
+        """
+        mean = np.asarray(scaler.mean_, dtype=np.float64)
+        scale = np.asarray(scaler.scale_, dtype=np.float64)
+        steps = np.array([-3.0, -1.0, 0.0, 1.0, 3.0])
+        probes = mean + (steps[:, None, None]
+                         * np.eye(len(mean))[None] * scale).reshape(-1, len(mean))
+        names = getattr(scaler, 'feature_names_in_', None)
+        scaled = scaler.transform(
+            probes if names is None else pd.DataFrame(probes, columns=names)
+        )
+        expected = np.column_stack(
+            [np.reshape(regression_model.predict(scaled), (len(probes), -1))]
+            + [classifier.predict_proba(scaled)[:, 1]
+               for classifier in _classifiers(classification_model)]
+        )
+        predicted_return, _, probability = self.predict(probes)
+        deviation = np.max(np.abs(
+            np.column_stack([predicted_return, probability]) - expected
+        ))
+        if not deviation <= BUNDLE_TOLERANCE:
+            raise ValueError(
+                f"LinearBundle deviates from the sklearn models by "
+                f"{deviation:.3g} (tolerance {BUNDLE_TOLERANCE:g})"
+            )
+
+
+class PredictionService:
+    """
+    Vectorized batch scoring through a LinearBundle.
+
+    Rows with any non-finite feature (e.g. rolling-window warm-up) are
+    not scored: their predicted_return and probability are NaN and
+    their predicted_class is -1. Multi-output models give one column
+    per output and horizon (see prediction_columns).
+
+    Example:
+        >>> service = PredictionService.load()
+        >>> results = service.predict(feature_matrix(df))
+        >>> results = service.predict_parquet('features.parquet')
+    """
+
+    def __init__(self, regression_model, classification_model, scaler,
+                 feature_names, horizons=None, batch_rows=BATCH_ROWS):
+        """
+        Args:
+            regression_model: Fitted LinearRegression
+            classification_model: Fitted binary LogisticRegression (or
+                MultiOutputClassifier)
+            scaler: Fitted StandardScaler
+            feature_names (list): Feature order the models expect
+            horizons (list): Hours ahead of each output of multi-output
+                models
+            batch_rows (int): Rows scored per batch
+        """
+        self.regression_model = regression_model
+        self.classification_model = classification_model
+        self.scaler = scaler
+        self.feature_names = list(feature_names)
+        self.batch_rows = batch_rows
+        self.bundle = LinearBundle.from_models(
+            regression_model, classification_model, scaler, feature_names,
+            horizons=horizons
+        )
+        self.horizons = self.bundle.horizons
+
+    @classmethod
+    def load(cls, models_dir=MODELS_DIR, **kwargs):
+        """
+        Load the saved artifacts into a service.
+
+        Args:
+            models_dir (str or ModelRegistry): Directory with the
+                MODEL_FILES pickles, or a registry to take them from
+            **kwargs: Passed to PredictionService()
+
+        Returns:
+            PredictionService: Ready to score
+
+        Raises:
+            FileNotFoundError: If an artifact is missing
+        """
+        registry = models_dir if isinstance(models_dir, ModelRegistry) \
+            else ModelRegistry(models_dir)
+        kwargs.setdefault('horizons',
+                          (registry.manifest or {}).get('horizons'))
+        return cls(**{name: registry.get(name) for name in MODEL_FILES},
+                   **kwargs)
+
+    def predict(self, features):
+        """
+        Score a feature matrix.
+
+        Args:
+            features (np.ndarray or pd.DataFrame): (n, 14) matrix in
+                feature_names order, or a frame with those columns (any
+                order, extra columns ignored)
+
+        Returns:
+            pd.DataFrame: predicted_return (float64), predicted_class
+            (int8, -1 if not scored) and probability (float64, of the
+            profitable class), one row per input row; suffixed with
+            each horizon for multi-output models
+
+        Raises:
+            ValueError: If the matrix does not have one column per
+                feature
+        """
+        index = None
+        if isinstance(features, pd.DataFrame):
+            index = features.index
+            features = features[self.feature_names].to_numpy(dtype=np.float64)
+        features = np.asarray(features, dtype=np.float64)
+        if features.ndim != 2 or features.shape[1] != len(self.feature_names):
+            raise ValueError(
+                f"Expected an (n, {len(self.feature_names)}) feature matrix, "
+                f"got shape {features.shape}"
+            )
+
+        n = len(features)
+        k = self.bundle.n_outputs
+        predicted_return = np.empty((n, k))
+        decision = np.empty((n, k))
+        valid = np.isfinite(features).all(axis=1)
+        for start in range(0, n, self.batch_rows):
+            stop = min(start + self.batch_rows, n)
+            batch = features[start:stop]
+            # Non-finite rows are masked below; zero them so they cannot
+            # spread NaN/inf warnings through the product
+            if not valid[start:stop].all():
+                batch = np.where(np.isfinite(batch), batch, 0.0)
+            scores = self.bundle.decision(batch)
+            predicted_return[start:stop] = scores[:, :k]
+            decision[start:stop] = scores[:, k:]
+
+        probability = _sigmoid(decision)
+        classes = self.bundle.classes
+        predicted_class = classes[(decision > 0).astype(np.intp)].astype(np.int8)
+        predicted_return[~valid] = np.nan
+        probability[~valid] = np.nan
+        predicted_class[~valid] = -1
+
+        outputs = [predicted_return, predicted_class, probability]
+        columns = prediction_columns(self.horizons)
+        return pd.DataFrame({
+            name: outputs[i // k][:, i % k] for i, name in enumerate(columns)
+        }, index=index)
+
+    def predict_parquet(self, path, output_path=None, keep_columns=None):
+        """
+        Score a features Parquet file.
+
+        Only the feature columns (plus keep_columns) are read.
+
+        Args:
+            path (str): Parquet file or dataset directory with one
+                column per feature
+            output_path (str): Optional Parquet file to write the result
+                to
+            keep_columns (list): Columns copied into the result
+                (default: 'timestamp' if present)
+
+        Returns:
+            pd.DataFrame: keep_columns followed by the prediction
+            columns
+        """
+        schema_names = pq.read_schema(path).names if os.path.isfile(path) \
+            else pq.ParquetDataset(path).schema.names
+        if keep_columns is None:
+            keep_columns = [col for col in ['timestamp'] if col in schema_names]
+        table = pq.read_table(path, columns=keep_columns + self.feature_names)
+
+        results = self.predict_table(table, keep_columns)
+        if output_path is not None:
+            results.to_parquet(output_path, index=False)
+        return results
+
+    def predict_table(self, table, keep_columns=()):
+        """
+        Score an Arrow table with one column per feature.
+
+        Args:
+            table (pa.Table): Feature columns (any order, extra columns
+                ignored; nulls are not scored)
+            keep_columns (list): Columns copied into the result
+
+        Returns:
+            pd.DataFrame: keep_columns followed by the prediction
+            columns
+
+        Raises:
+            KeyError: If a feature column is missing
+        """
+        missing = [name for name in self.feature_names
+                   if name not in table.column_names]
+        if missing:
+            raise KeyError(f"Missing feature columns: {missing}")
+
+        features = np.empty((table.num_rows, len(self.feature_names)),
+                            order='F')
+        for i, name in enumerate(self.feature_names):
+            features[:, i] = table.column(name).to_numpy(zero_copy_only=False)
+
+        results = self.predict(features)
+        for col in reversed(list(keep_columns)):
+            results.insert(0, col, table.column(col).to_pandas())
+        return results
+
+
+def prediction_columns(horizons=None):
+    """
+    Output columns of PredictionService.predict: PREDICTION_COLUMNS, or
+    one column per column and horizon (e.g. 'probability_4h') for
+    multi-output models.
+    """
+    if horizons is None:
+        return list(PREDICTION_COLUMNS)
+    return [f"{name}_{horizon}h" for name in PREDICTION_COLUMNS
+            for horizon in horizons]
+
+
+def _classifiers(classification_model):
+    """
+    Internal function: The binary classifiers of a single or multi-output
+    classification model.
+    """
+    return list(getattr(classification_model, 'estimators_',
+                        [classification_model]))
+
+
+def _sigmoid(values):
+    """
+    Internal function: Logistic function, stable for large |values|.
+    """
+    result = np.empty_like(values)
+    positive = values >= 0
+    result[positive] = 1.0 / (1.0 + np.exp(-values[positive]))
+    exp_values = np.exp(values[~positive])
+    result[~positive] = exp_values / (1.0 + exp_values)
+    return result
+
+
+def _sigmoid_scalar(value):
+    """
+    Internal function: Logistic function of one float.
+    """
+    if value >= 0:
+        return 1.0 / (1.0 + math.exp(-value))
+    exp_value = math.exp(value)
+    return exp_value / (1.0 + exp_value)
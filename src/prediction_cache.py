@@ -0,0 +1,159 @@
+"""
+TradeCare Prediction Cache Module
+
+Bounded LRU cache of predictions keyed on quantized inputs.
+
+The dashboard's predictor inputs are discrete (sliders and number
+inputs with fixed steps), so many sessions submit the same feature
+vector. Inputs are quantized to integer multiples of their widget step
+before being used as a key, so float noise such as 0.1 + 0.2 cannot
+split one slider position into two entries. The cache is tied to a
+model version and cleared when the version changes, so a hot-reloaded
+model never serves predictions of the previous one.
+"""
+
+import threading
+from collections import OrderedDict
+
+# Default maximum number of cached predictions
+MAX_ENTRIES = 4096
+
+
+class PredictionCache:
+    """
+    Thread-safe LRU cache of prediction results for one model version.
+
+    Attributes:
+        max_entries (int): Entries kept before the least recently used
+            is evicted
+        version (str): Model version the cached entries belong to
+        hits (int): Lookups answered from the cache
+        misses (int): Lookups that had to compute
+        evictions (int): Entries dropped for max_entries
+        invalidations (int): Clears caused by a model version change
+
+    Example:
+        >>> cache = PredictionCache()
+        >>> key = quantize_inputs([0.1, 50.0, 49500], [0.1, 0.5, 100])
+        >>> result = cache.get_or_compute(
+        ...     key, model_version.version,
+        ...     lambda: model_version.bundle.predict(features))
+    """
+
+    def __init__(self, max_entries=MAX_ENTRIES):
+        """
+        Args:
+            max_entries (int): Entries kept before evicting
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+        self.max_entries = max_entries
+        self.version = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key, version, compute):
+        """
+        Cached result for key, computing and storing it on a miss.
+
+        compute() runs outside the lock; two sessions missing on the
+        same key at once both compute, and the result is stored once.
+
+        Args:
+            key (tuple): Hashable quantized inputs (see quantize_inputs)
+            version (str): Current model version; a different version
+                than the cached entries' clears the cache first
+            compute (callable): No-argument function returning the result
+
+        Returns:
+            object: The cached or newly computed result
+        """
+        with self._lock:
+            if version != self.version:
+                self._invalidate(version)
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        result = compute()
+
+        with self._lock:
+            # Drop results computed with a version that was replaced
+            # while computing
+            if version == self.version:
+                self._entries[key] = result
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return result
+
+    def clear(self):
+        """
+        Remove every entry (counters are kept).
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """
+        Counters and fill level.
+
+        Returns:
+            dict: entries, max_entries, hits, misses, hit_rate,
+            evictions, invalidations, version
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'version': self.version,
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _invalidate(self, version):
+        """
+        Internal function: Clear entries for a new model version (lock
+        held by the caller).
+        """
+        if self._entries or self.version is not None:
+            self.invalidations += 1
+        self._entries.clear()
+        self.version = version
+
+
+def quantize_inputs(values, steps):
+    """
+    Cache key of widget inputs: each value as an integer count of its
+    step.
+
+    Args:
+        values (sequence): Input values
+        steps (sequence): Widget step of each value
+
+    Returns:
+        tuple: round(value / step) per input
+
+    Example:
+        >>> quantize_inputs([0.1 + 0.2, 49500], [0.1, 100])
+        (3, 495)
+    """
+    if len(values) != len(steps):
+        raise ValueError(
+            f"Got {len(values)} values but {len(steps)} steps"
+        )
+    return tuple(round(value / step) for value, step in zip(values, steps))
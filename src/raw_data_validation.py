@@ -9,13 +9,38 @@ so it passes securely to the next processing stages
 (cleaning, transformations, etc).
 """
 
+import hashlib
+import glob
+import io
+import json
+import os
+import re
+import shutil
+import time
+import tracemalloc
+import urllib.error
+import urllib.parse
+import urllib.request
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from datetime import datetime
 
+from src.data_schema import raw_arrow_schema, read_raw_csv, table_to_frame
+from src.validation_report import (
+    CheckResult, DataValidationError, ValidationReport, MAX_SAMPLE_ROWS
+)
+
 
 # Data source URL
 DATA_URL = "https://raw.githubusercontent.com/mouadja02/bitcoin-hourly-ohclv-dataset/main/btc-hourly-price_2015_2025.csv"
 
+# Local columnar store of validated data (one Parquet part per ingest)
+CACHE_DIR = 'inputs/datasets/cache'
+CACHE_DATA_DIR = 'bitcoin_raw'
+CACHE_META_FILE = 'bitcoin_raw.meta.json'
+
 # Expected data structure
 EXPECTED_COLUMNS = [
     'TIME_UNIX', 'DATE_STR', 'HOUR_STR',
@@ -23,28 +48,88 @@ EXPECTED_COLUMNS = [
     'VOLUME_FROM', 'VOLUME_TO'
 ]
 
+# Columns the schema reads as numbers (see src.data_schema.raw_dtypes)
+NUMERIC_COLUMNS = [col for col in EXPECTED_COLUMNS if col != 'DATE_STR']
+
+# Rows per chunk in streaming validation
+STREAM_CHUNK_ROWS = 250_000
+
 # Validation thresholds
 MIN_EXPECTED_ROWS = 96000  # from ~ Nov 2014
 MIN_TIMESTAMP = 1416031200  # Unix timestamp for 2014-11-15
 MAX_PRICE = 500000  # BTC unlikely > $500k
 MIN_PRICE = 0  # Prices must be positive
 
-
-def fetch_and_validate_data():
+# Thresholds a caller may override per dataset (e.g. per asset: a coin
+# listed in 2020 has fewer rows and a different price scale than BTC)
+VALIDATION_LIMITS = {
+    'min_rows': MIN_EXPECTED_ROWS,
+    'min_timestamp': MIN_TIMESTAMP,
+    'max_price': MAX_PRICE,
+}
+
+# Character rules for string columns
+SAFE_COLUMN_PATTERN = re.compile(r'^[A-Z_]+$')
+DANGEROUS_CHARS = ['<', '>', ';', '&', '|', '$', '`', '\\', '"', "'", '(', ')']
+
+# Byte -> character class lookup table used by the string checks
+CHAR_OTHER, CHAR_DIGIT, CHAR_HYPHEN = 0, 1, 2
+CHAR_CLASS = np.full(256, CHAR_OTHER, dtype=np.uint8)
+CHAR_CLASS[ord('0'):ord('9') + 1] = CHAR_DIGIT
+CHAR_CLASS[ord('-')] = CHAR_HYPHEN
+DANGEROUS_BYTE = np.zeros(256, dtype=bool)
+DANGEROUS_BYTE[[ord(c) for c in DANGEROUS_CHARS]] = True
+
+# Expected class of each byte of a DATE_STR value (YYYY-MM-DD)
+DATE_TEMPLATE = np.array(
+    [CHAR_DIGIT] * 4 + [CHAR_HYPHEN] + [CHAR_DIGIT] * 2
+    + [CHAR_HYPHEN] + [CHAR_DIGIT] * 2, dtype=np.uint8
+)
+
+
+def fetch_and_validate_data(source=DATA_URL, use_cache=True,
+                            cache_dir=CACHE_DIR, incremental=False,
+                            collect_all=False, return_report=False,
+                            float64=False):
     """
     Fetch and validate Bitcoin hourly data in one call.
 
     This is the main entry point - it handles everything:
+    - Returns the cached copy if the source has not changed
     - Fetches data from GitHub
     - Validates structure, ranges, and integrity
+    - Stores validated data in the local Parquet cache
     - Returns validated data or raises descriptive error
 
+    Freshness is checked with a cheap marker first (HTTP ETag /
+    Last-Modified, or size + mtime for local files). If the marker
+    changed, the raw bytes are downloaded and compared by SHA-256, so
+    the CSV is only parsed and validated again when its content changed.
+
+    In incremental mode the source is treated as append-only: only the
+    bytes after the last ingested row are read, rows newer than the last
+    stored TIME_UNIX are validated and appended to the store as a new
+    Parquet part. Ingest cost then scales with new rows, not history.
+
+    Args:
+        source (str): URL, file:// URL or local path of the CSV
+        use_cache (bool): Read from / write to the local cache
+        cache_dir (str): Directory holding the Parquet cache
+        incremental (bool): Append only new rows to the cached dataset
+        collect_all (bool): Run every check before failing instead of
+            stopping at the first error
+        return_report (bool): Also return the ValidationReport
+        float64 (bool): Keep 64-bit dtypes instead of the compact
+            schema (see src.data_schema)
+
     Returns:
-        pd.DataFrame: Validated Bitcoin hourly OHLCV data
+        pd.DataFrame: Validated Bitcoin hourly OHLCV data, or a tuple
+        (DataFrame, ValidationReport) if return_report is True
 
     Raises:
         Exception: If data cannot be fetched
-        ValueError: If data fails any validation check
+        DataValidationError: If data fails any validation check (a
+            ValueError carrying the full report)
 
     Example:
         from src.raw_data_validation import fetch_and_validate_data
@@ -56,49 +141,833 @@ def fetch_and_validate_data():
     print("TradeCare Data Validation")
     print("-" * 60)
 
+    # Step 0: Serve from cache when the source is unchanged
+    marker = _source_marker(source) if use_cache else None
+    raw = None
+    df = None
+    if use_cache:
+        meta = _read_cache_meta(cache_dir)
+        if (meta is not None and meta['source'] == source
+                and meta.get('float64', False) == float64):
+            if marker is not None and marker == meta['marker']:
+                df = _load_cache(cache_dir, meta)
+                report = ValidationReport(source=source, rows=len(df),
+                                          cached=True)
+            elif incremental:
+                df, report = _ingest_increment(
+                    source, cache_dir, meta, marker, collect_all)
+            else:
+                raw = _fetch_source(source)
+                if _content_hash(raw) == meta['sha256']:
+                    # Content unchanged, only the marker moved on
+                    meta['marker'] = marker
+                    _write_cache_meta(cache_dir, meta)
+                    df = _load_cache(cache_dir, meta)
+                    report = ValidationReport(source=source, rows=len(df),
+                                              cached=True)
+            if df is not None:
+                return (df, report) if return_report else df
+
     # Step 1: Fetch
-    df = _fetch_data()
+    df, raw = _fetch_data(source, raw, float64)
 
     # Step 2: Validate (raises error if validation fails)
-    _validate_structure(df)
-    _validate_string_data(df)
-    _validate_price_ranges(df)
-    _validate_data_completeness(df)
-    _validate_timestamps(df)
+    report = validate_data(df, collect_all=collect_all, source=source)
+    _raise_on_failure(report)
 
     # Step 3: Success
     print("-" * 60)
+    print(report.summary())
+    print("-" * 60)
     print("All validation checks passed!")
     print(f"Data ready: {len(df):,} rows from {df['DATE_STR'].iloc[0]} to {
         df['DATE_STR'].iloc[-1]}"
         )
     print("-" * 60)
 
-    return df
+    # Step 4: Cache validated data for the next run
+    if use_cache:
+        _write_cache(cache_dir, df, source, marker, raw, float64)
+
+    return (df, report) if return_report else df
+
+
+def validate_data(df, collect_all=False, checks=None, source=None,
+                  verbose=True, limits=None):
+    """
+    Run the validation checks on a DataFrame and report the results.
+
+    The frame is parsed once into a shared view; each check then runs
+    on that view with its wall-clock time and peak memory recorded.
+
+    Args:
+        df (pd.DataFrame): Raw data to validate
+        collect_all (bool): Run every check even after a failure and
+            return the report instead of raising
+        checks (list): Names of the checks to run (default: all, see
+            VALIDATION_CHECKS)
+        source (str): Data source recorded in the report
+        verbose (bool): Print progress per check
+        limits (dict): Overrides of VALIDATION_LIMITS (min_rows,
+            min_timestamp, max_price)
+
+    Returns:
+        ValidationReport: Per-check results; check report.passed when
+        collect_all is True
+
+    Raises:
+        DataValidationError: On the first failed check, unless
+            collect_all is True
+
+    Example:
+        >>> report = validate_data(df, collect_all=True)
+        >>> print(report.summary())
+        >>> report.to_json()
+    """
+    report = ValidationReport(source=source, rows=len(df),
+                              collect_all=collect_all)
+
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        view = _parse_frame(df, limits)
+        report.parse_seconds = time.perf_counter() - start
+
+        for name, label, func in VALIDATION_CHECKS:
+            if checks is not None and name not in checks:
+                continue
+            if verbose:
+                print(f"Validating {label}...")
+            result = _run_check(name, func, view)
+            report.checks.append(result)
+            if verbose:
+                mark = "✓" if result.passed else "✗"
+                print(f"{mark} {result.message.splitlines()[0]}")
+            if not result.passed and not collect_all:
+                raise DataValidationError(result.message, report)
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    return report
+
+
+def stream_validate_to_parquet(source, sink_path, chunksize=STREAM_CHUNK_ROWS,
+                               collect_all=False, verbose=True, float64=False,
+                               limits=None):
+    """
+    Validate a CSV chunk by chunk and write it straight to Parquet.
+
+    For inputs larger than memory (minute bars, multi-asset files):
+    only one chunk is held at a time, so peak memory depends on
+    chunksize, not on the length of the history. Row-level checks run
+    per chunk; state that spans chunk boundaries (row count, first
+    timestamp, running price min/max) is carried along, and dataset-level
+    checks run once at the end on that state.
+
+    The Parquet file is written to a temporary path and only moved to
+    sink_path once every check passed.
+
+    Args:
+        source (str): URL, file:// URL or local path of the CSV
+        sink_path (str): Parquet file to write validated rows to
+        chunksize (int): Rows per chunk
+        collect_all (bool): Keep validating after a failure and report
+            every failed check at the end
+        verbose (bool): Print progress per chunk
+        float64 (bool): Write 64-bit dtypes instead of the compact schema
+        limits (dict): Overrides of VALIDATION_LIMITS
+
+    Returns:
+        ValidationReport: Merged per-check results over all chunks
+
+    Raises:
+        DataValidationError: If any check fails
+
+    Example:
+        >>> report = stream_validate_to_parquet(
+        ...     'inputs/datasets/raw/btc_minute.csv',
+        ...     'inputs/datasets/cache/btc_minute.parquet')
+        >>> print(report.summary())
+    """
+    path = _local_path(source)
+    report = ValidationReport(source=source, collect_all=collect_all)
+    merged = {}
+    state = {
+        'rows': 0,
+        'first_date': None,
+        'min_timestamp': None,
+        'price_min': {},
+        'price_max': {}
+    }
+
+    os.makedirs(os.path.dirname(sink_path) or '.', exist_ok=True)
+    tmp_path = sink_path + '.tmp'
+    schema = raw_arrow_schema(float64)
+    writer = None
+
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        reader = pd.read_csv(path if path is not None else source,
+                             chunksize=chunksize)
+        for number, chunk in enumerate(reader, start=1):
+            start = time.perf_counter()
+            view = _parse_frame(chunk, limits)
+            report.parse_seconds += time.perf_counter() - start
+
+            for name, _, func in VALIDATION_CHECKS:
+                if name == 'data_completeness':
+                    continue
+                if name == 'structure' and number > 1:
+                    continue  # Same header for every chunk
+                result = _run_check(name, func, view, state['rows'])
+                _merge_check(merged, result)
+                if not result.passed and not collect_all:
+                    report.checks = list(merged.values())
+                    raise DataValidationError(result.message, report)
+                if name == 'structure' and not result.passed:
+                    break  # Columns unusable, no row checks possible
+            if not merged['structure'].passed:
+                break
+
+            _update_stream_state(state, view)
+            if not _any_failed(merged):
+                table = pa.Table.from_pandas(
+                    _coerce_raw_chunk(chunk), schema=schema,
+                    preserve_index=False
+                )
+                if writer is None:
+                    writer = pq.ParquetWriter(tmp_path, schema)
+                writer.write_table(table)
+
+            if verbose:
+                print(f"✓ Chunk {number}: {len(chunk):,} rows checked "
+                      f"({state['rows']:,} total)")
+
+        # Dataset-level checks on the carried state
+        completeness = _run_check(
+            'data_completeness', _validate_data_completeness,
+            {'n_rows': state['rows'], 'frame': None,
+             'limits': {**VALIDATION_LIMITS, **(limits or {})}}
+        )
+        _merge_check(merged, completeness)
+        report.checks = list(merged.values())
+        report.rows = state['rows']
+        _finish_stream_messages(merged, state)
+    except BaseException:
+        if writer is not None:
+            writer.close()
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    if writer is not None:
+        writer.close()
+    if report.passed and writer is not None:
+        os.replace(tmp_path, sink_path)
+    elif os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    _raise_on_failure(report)
+    if verbose:
+        print(report.summary())
+    return report
+
+
+def parse_raw_data(raw, float64=False, verbose=True):
+    """
+    Parse raw CSV bytes for validation.
+
+    The compact schema is applied while parsing. If a value does not
+    fit it (e.g. text in a price column), the bytes are read again
+    untyped: the numeric_types check then reports the offending rows
+    instead of the read failing.
+
+    Args:
+        raw (bytes): CSV content in the source layout
+        float64 (bool): Keep 64-bit dtypes instead of the compact schema
+        verbose (bool): Print a warning when falling back
+
+    Returns:
+        pd.DataFrame: Raw data, typed if it fit the schema
+    """
+    try:
+        return read_raw_csv(io.BytesIO(raw), float64)
+    except ValueError:
+        if verbose:
+            print("⚠ Data does not match the expected dtypes")
+        return pd.read_csv(io.BytesIO(raw), low_memory=False)
+
+
+def _any_failed(merged):
+    """
+    Internal function: True if any merged check has failed so far.
+    """
+    return any(not check.passed for check in merged.values())
+
+
+def _merge_check(merged, result):
+    """
+    Internal function: Fold one chunk's CheckResult into the running one.
+
+    Times add up, peak memory is the maximum over chunks, failed rows
+    add up and samples are kept up to MAX_SAMPLE_ROWS. The first error
+    message wins.
+    """
+    current = merged.get(result.name)
+    if current is None:
+        merged[result.name] = result
+        return
+    current.seconds += result.seconds
+    current.peak_memory_mb = max(current.peak_memory_mb, result.peak_memory_mb)
+    if result.failed_rows is not None:
+        current.failed_rows = (current.failed_rows or 0) + result.failed_rows
+    room = MAX_SAMPLE_ROWS - len(current.sample_rows)
+    current.sample_rows.extend(result.sample_rows[:max(room, 0)])
+    if current.passed and not result.passed:
+        current.passed = False
+        current.message = result.message
+
+
+def _update_stream_state(state, view):
+    """
+    Internal function: Carry row count, first timestamp and price
+    min/max across a chunk boundary.
+    """
+    if view['n_rows'] == 0:
+        return
+    if state['first_date'] is None:
+        state['first_date'] = view['frame']['DATE_STR'].iloc[0]
+    state['rows'] += view['n_rows']
+
+    time_unix = view['numeric'].get('TIME_UNIX')
+    if time_unix is not None:
+        chunk_min = np.nanmin(time_unix)
+        if state['min_timestamp'] is None or chunk_min < state['min_timestamp']:
+            state['min_timestamp'] = chunk_min
+
+    for col in ['OPEN_PRICE', 'HIGH_PRICE', 'LOW_PRICE', 'CLOSE_PRICE']:
+        values = view['numeric'].get(col)
+        if values is None:
+            continue
+        low, high = np.nanmin(values), np.nanmax(values)
+        state['price_min'][col] = min(state['price_min'].get(col, low), low)
+        state['price_max'][col] = max(state['price_max'].get(col, high), high)
+
+
+def _finish_stream_messages(merged, state):
+    """
+    Internal function: Replace per-chunk success messages with ones
+    describing the whole stream.
+    """
+    timestamps = merged.get('timestamps')
+    if timestamps is not None and timestamps.passed:
+        timestamps.message = (
+            f"Timestamps valid: starts from {state['first_date']} "
+            f"(earliest TIME_UNIX {state['min_timestamp']})"
+        )
+    prices = merged.get('price_ranges')
+    if prices is not None and prices.passed and state['price_min']:
+        prices.message = (
+            f"Price ranges valid: ${min(state['price_min'].values()):,.2f} "
+            f"to ${max(state['price_max'].values()):,.2f}"
+        )
 
 
-def _fetch_data():
+def _coerce_raw_chunk(chunk):
+    """
+    Internal function: Prepare a validated chunk for the Arrow schema.
+
+    HOUR_STR may arrive as text; it was checked to be numeric 0-23.
+    """
+    if not pd.api.types.is_numeric_dtype(chunk['HOUR_STR']):
+        chunk = chunk.assign(HOUR_STR=pd.to_numeric(chunk['HOUR_STR']))
+    return chunk
+
+
+def _raise_on_failure(report):
+    """
+    Internal function: Raise if a collect-all report has failures.
+
+    Raises:
+        DataValidationError: Listing every failed check
+    """
+    if report.passed:
+        return
+    print(report.summary())
+    details = "\n\n".join(
+        f"[{check.name}] {check.message}" for check in report.failures
+    )
+    raise DataValidationError(
+        f"{len(report.failures)} of {len(report.checks)} validation "
+        f"checks failed:\n\n{details}",
+        report
+    )
+
+
+def _fetch_data(source=DATA_URL, raw=None, float64=False):
     """
     Internal function: Fetch data from GitHub.
 
+    Args:
+        source (str): URL, file:// URL or local path of the CSV
+        raw (bytes): Already downloaded content, parsed instead of
+            fetching again
+        float64 (bool): Keep 64-bit dtypes instead of the compact schema
+
     Returns:
-        pd.DataFrame: Raw data from URL
+        tuple: (raw DataFrame, raw CSV bytes)
 
     Raises:
         Exception: If fetch fails
     """
     print("Fetching data from GitHub...")
-    print(f"URL: {DATA_URL}")
+    print(f"URL: {source}")
 
     try:
-        df = pd.read_csv(DATA_URL)
+        if raw is None:
+            raw = _fetch_source(source)
+        df = parse_raw_data(raw, float64)
         print(f"✓ Data fetched: {len(df):,} rows & {df.shape[1]} columns")
-        return df
+        return df, raw
     except Exception as e:
         raise Exception(f"Failed to fetch data: {e}")
 
 
-def _validate_structure(df):
+def _local_path(source):
+    """
+    Internal function: Resolve a file:// URL or plain path.
+
+    Returns:
+        str: Local filesystem path, or None for remote sources
+    """
+    parsed = urllib.parse.urlparse(source)
+    if parsed.scheme == 'file':
+        return urllib.request.url2pathname(parsed.path)
+    if parsed.scheme in ('http', 'https'):
+        return None
+    return source
+
+
+def _fetch_source(source, offset=0):
+    """
+    Internal function: Read the raw CSV bytes from a URL or local file.
+
+    Args:
+        source (str): URL, file:// URL or local path of the CSV
+        offset (int): Byte position to start reading from (HTTP Range
+            request for remote sources)
+
+    Returns:
+        bytes: File content from offset to the end
+
+    Raises:
+        Exception: If the source cannot be read
+    """
+    path = _local_path(source)
+    if path is not None:
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            return f.read()
+    headers = {'Range': f'bytes={offset}-'} if offset else {}
+    request = urllib.request.Request(source, headers=headers)
+    try:
+        with urllib.request.urlopen(request, timeout=60) as response:
+            raw = response.read()
+            # Server ignored the Range header and sent the whole file
+            if offset and response.status == 200:
+                raw = raw[offset:]
+            return raw
+    except urllib.error.HTTPError as e:
+        if e.code == 416:  # Range not satisfiable: nothing past offset
+            return b''
+        raise
+
+
+def _source_marker(source):
+    """
+    Internal function: Cheap ETag-style freshness marker for a source.
+
+    Uses size and modification time for local files and the ETag or
+    Last-Modified header (HEAD request) for HTTP sources.
+
+    Returns:
+        str: Marker string, or None if the source does not provide one
+    """
+    path = _local_path(source)
+    try:
+        if path is not None:
+            stat = os.stat(path)
+            return f"stat:{stat.st_size}-{stat.st_mtime_ns}"
+        request = urllib.request.Request(source, method='HEAD')
+        with urllib.request.urlopen(request, timeout=10) as response:
+            etag = response.headers.get('ETag')
+            if etag:
+                return f"etag:{etag}"
+            modified = response.headers.get('Last-Modified')
+            if modified:
+                return f"last-modified:{modified}"
+    except OSError:
+        pass
+    return None
+
+
+def _content_hash(raw):
+    """
+    Internal function: SHA-256 hex digest of raw source bytes.
+    """
+    return hashlib.sha256(raw).hexdigest()
+
+
+def _source_size(source):
+    """
+    Internal function: Current size of a local source in bytes.
+
+    Returns:
+        int: File size, or None for remote sources
+    """
+    path = _local_path(source)
+    return os.path.getsize(path) if path is not None else None
+
+
+def _ingest_increment(source, cache_dir, meta, marker, collect_all=False):
+    """
+    Internal function: Append rows added to the source since last ingest.
+
+    Reads the source from the stored byte offset, keeps only complete
+    lines with TIME_UNIX after the last stored row (or not a number),
+    validates that delta and writes it as a new Parquet part.
+
+    Args:
+        source (str): URL, file:// URL or local path of the CSV
+        cache_dir (str): Directory holding the Parquet cache
+        meta (dict): Current cache metadata
+        marker (str): Freshness marker of the source
+        collect_all (bool): Run every check before failing
+
+    Returns:
+        tuple: (full stored dataset including the new rows, report of
+        the delta validation), or (None, None) if the source is no
+        longer an extension of the store and needs a full refresh
+
+    Raises:
+        DataValidationError: If the new rows fail any validation check
+    """
+    offset = meta['byte_offset']
+    size = _source_size(source)
+    if size is not None and size < offset:
+        print("Source shrank since last ingest - full refresh required")
+        return None, None
+
+    print("Fetching new rows since last ingest...")
+    print(f"URL: {source} (from byte {offset:,})")
+    tail = _fetch_source(source, offset)
+
+    # Only consume complete lines; a partly written row is picked up
+    # on the next run
+    tail = tail[:tail.rfind(b'\n') + 1]
+    if tail.strip():
+        delta = pd.read_csv(io.BytesIO(tail), header=None)
+    else:
+        delta = pd.DataFrame(columns=range(len(EXPECTED_COLUMNS)))
+
+    if delta.shape[1] != len(EXPECTED_COLUMNS):
+        raise ValueError(
+            f"Data structure compromised!\n"
+            f"Appended rows have {delta.shape[1]} fields, expected "
+            f"{len(EXPECTED_COLUMNS)}"
+        )
+    delta.columns = EXPECTED_COLUMNS
+    # The untyped read leaves a malformed TIME_UNIX as text: compare on
+    # the coerced values and keep the rows that do not parse, so the
+    # checks below report them
+    time_unix = pd.to_numeric(delta['TIME_UNIX'], errors='coerce')
+    delta = delta[(time_unix > meta['last_time_unix']) | time_unix.isna()]
+    delta = delta.reset_index(drop=True)
+    print(f"✓ New rows fetched: {len(delta):,}")
+
+    report = ValidationReport(source=source, collect_all=collect_all)
+    if len(delta) > 0:
+        # Completeness was checked on the full history and appends only
+        # grow it, so the delta runs the per-row checks only
+        report = validate_data(
+            delta, collect_all=collect_all, source=source,
+            checks=['structure', 'numeric_types', 'string_data',
+                    'price_ranges', 'timestamps']
+        )
+        _raise_on_failure(report)
+
+        parts = _cache_parts(cache_dir)
+        _write_cache_part(cache_dir, delta, len(parts),
+                          schema=pq.read_schema(parts[0]))
+        meta['rows'] += len(delta)
+        meta['last_date'] = str(delta['DATE_STR'].iloc[-1])
+        meta['last_time_unix'] = int(delta['TIME_UNIX'].max())
+        # Content hash of the whole file is unknown without reading it
+        meta['sha256'] = None
+
+    meta['byte_offset'] = offset + len(tail)
+    meta['marker'] = marker
+    meta['cached_at'] = datetime.now().isoformat()
+    _write_cache_meta(cache_dir, meta)
+    return _load_cache(cache_dir, meta), report
+
+
+def _cache_parts(cache_dir):
+    """
+    Internal function: Parquet part files of the store, in ingest order.
+    """
+    pattern = os.path.join(cache_dir, CACHE_DATA_DIR, 'part-*.parquet')
+    return sorted(glob.glob(pattern))
+
+
+def _write_cache_part(cache_dir, df, part, schema=None):
+    """
+    Internal function: Atomically write one Parquet part of the store.
+
+    Appended parts are cast to the schema of the first part so the store
+    always reads back as one table.
+    """
+    data_dir = os.path.join(cache_dir, CACHE_DATA_DIR)
+    os.makedirs(data_dir, exist_ok=True)
+    part_path = os.path.join(data_dir, f'part-{part:05d}.parquet')
+    tmp_path = part_path + '.tmp'
+    table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+    pq.write_table(table, tmp_path)
+    os.replace(tmp_path, part_path)
+    return part_path
+
+
+def _read_cache_meta(cache_dir):
+    """
+    Internal function: Load the cache marker file.
+
+    Returns:
+        dict: Cache metadata, or None if no usable cache exists
+    """
+    meta_path = os.path.join(cache_dir, CACHE_META_FILE)
+    if not (os.path.exists(meta_path) and _cache_parts(cache_dir)):
+        return None
+    try:
+        with open(meta_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache_meta(cache_dir, meta):
+    """
+    Internal function: Atomically write the cache marker file.
+    """
+    meta_path = os.path.join(cache_dir, CACHE_META_FILE)
+    tmp_path = meta_path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(meta, f, indent=2)
+    os.replace(tmp_path, meta_path)
+
+
+def _load_cache(cache_dir, meta):
+    """
+    Internal function: Read validated data back from the Parquet cache.
+
+    Returns:
+        pd.DataFrame: Cached validated data
+    """
+    table = pa.concat_tables(
+        [pq.read_table(path) for path in _cache_parts(cache_dir)]
+    )
+    df = table_to_frame(table)
+    print(f"✓ Using cached data: {cache_dir}")
+    print(f"  Cached at: {meta['cached_at']}")
+    print(f"Data ready: {len(df):,} rows from {meta['first_date']} to {
+        meta['last_date']}"
+        )
+    print("-" * 60)
+    return df
+
+
+def _write_cache(cache_dir, df, source, marker, raw, float64=False):
+    """
+    Internal function: Replace the store with a full validated dataset.
+
+    The old marker file is removed first and the new one written last,
+    so an interrupted write never leaves a marker pointing at stale data.
+    """
+    meta_path = os.path.join(cache_dir, CACHE_META_FILE)
+    if os.path.exists(meta_path):
+        os.remove(meta_path)
+    shutil.rmtree(os.path.join(cache_dir, CACHE_DATA_DIR),
+                  ignore_errors=True)
+    part_path = _write_cache_part(cache_dir, df, 0)
+
+    _write_cache_meta(cache_dir, {
+        'source': source,
+        'marker': marker,
+        'sha256': _content_hash(raw),
+        'byte_offset': len(raw),
+        'rows': len(df),
+        'first_date': str(df['DATE_STR'].iloc[0]),
+        'last_date': str(df['DATE_STR'].iloc[-1]),
+        'last_time_unix': int(df['TIME_UNIX'].max()),
+        'float64': float64,
+        'cached_at': datetime.now().isoformat()
+    })
+    print(f"✓ Validated data cached: {part_path}")
+
+
+def _parse_frame(df, limits=None):
+    """
+    Internal function: Build the shared parsed view used by all checks.
+
+    Every column is converted exactly once: numeric columns to NumPy
+    arrays, string columns to their Arrow byte buffer plus offsets. The
+    _validate_* checks then work on this view instead of re-converting
+    DataFrame columns themselves.
+
+    A NUMERIC_COLUMNS column that arrived as text (untyped read after
+    the schema rejected a value) is also coerced to float64, with the
+    values that do not parse as NaN; their rows are kept in
+    view['unparsable'] for _validate_numeric_types.
+
+    Args:
+        df (pd.DataFrame): Data to validate
+        limits (dict): Overrides of VALIDATION_LIMITS
+
+    Returns:
+        dict: Parsed view with the frame, its columns, NumPy arrays of
+        numeric columns, Arrow buffers of string columns, unparsable
+        rows per numeric column and the thresholds the checks apply
+    """
+    view = {
+        'frame': df,
+        'columns': list(df.columns),
+        'n_rows': len(df),
+        'numeric': {},
+        'strings': {},
+        'unparsable': {},
+        'limits': {**VALIDATION_LIMITS, **(limits or {})}
+    }
+    for col in df.columns:
+        if pd.api.types.is_numeric_dtype(df[col]):
+            values = df[col].to_numpy()
+            if values.dtype == object:
+                # Nullable extension dtype: missing values become NaN
+                values = df[col].to_numpy(dtype='float64', na_value=np.nan)
+            view['numeric'][col] = values
+        else:
+            view['strings'][col] = _string_buffer(df[col])
+            if col in NUMERIC_COLUMNS:
+                values = pd.to_numeric(df[col], errors='coerce')
+                values = values.to_numpy(dtype='float64', na_value=np.nan)
+                view['numeric'][col] = values
+                view['unparsable'][col] = np.flatnonzero(
+                    np.isnan(values) & df[col].notna().to_numpy()
+                )
+    return view
+
+
+def _string_buffer(series):
+    """
+    Internal function: Expose a string column as raw UTF-8 bytes.
+
+    Args:
+        series (pd.Series): String column
+
+    Returns:
+        tuple: (uint8 data buffer, row offsets into it, null mask)
+    """
+    try:
+        arr = pa.array(series, type=pa.large_string(), from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Mixed object column: fall back to its string representation
+        arr = pa.array(series.astype(str), type=pa.large_string())
+    if isinstance(arr, pa.ChunkedArray):
+        arr = arr.combine_chunks()
+
+    _, offsets_buf, data_buf = arr.buffers()
+    offsets = np.frombuffer(offsets_buf, dtype=np.int64)
+    offsets = offsets[arr.offset:arr.offset + len(arr) + 1]
+    data = (np.frombuffer(data_buf, dtype=np.uint8)
+            if data_buf is not None else np.zeros(0, dtype=np.uint8))
+    nulls = arr.is_null().to_numpy(zero_copy_only=False)
+    return data, offsets, nulls
+
+
+def _char_classes(data, offsets, width):
+    """
+    Internal function: Classify every byte of fixed-width strings at once.
+
+    One lookup-table pass maps each byte to a class (other, digit,
+    hyphen). Rows whose length differs from width are
+    reported separately and get no class row.
+
+    Args:
+        data (np.ndarray): uint8 string buffer
+        offsets (np.ndarray): Row offsets into data
+        width (int): Expected string length in bytes
+
+    Returns:
+        tuple: (class matrix of shape (rows with right length, width),
+        boolean mask of rows with the right length)
+    """
+    lengths = np.diff(offsets)
+    right_length = lengths == width
+    if right_length.all():
+        # Fast path: rows are contiguous, reshape without copying
+        block = data[offsets[0]:offsets[-1]].reshape(-1, width)
+    else:
+        starts = offsets[:-1][right_length]
+        block = data[starts[:, None] + np.arange(width)]
+    return CHAR_CLASS[block], right_length
+
+
+def _dangerous_chars(data, offsets):
+    """
+    Internal function: Locate dangerous characters in a string buffer.
+
+    Args:
+        data (np.ndarray): uint8 string buffer
+        offsets (np.ndarray): Row offsets into data
+
+    Returns:
+        tuple: (row positions containing any dangerous character,
+        characters found in DANGEROUS_CHARS order)
+    """
+    used = data[offsets[0]:offsets[-1]]
+    positions = np.flatnonzero(DANGEROUS_BYTE[used])
+    if len(positions) == 0:
+        return positions, []
+    rows = np.unique(
+        np.searchsorted(offsets, positions + offsets[0], side='right') - 1
+    )
+    present = set(used[positions].tolist())
+    return rows, [char for char in DANGEROUS_CHARS if ord(char) in present]
+
+
+def _outcome(summary='', error=None, failed_rows=None):
+    """
+    Internal function: Result of one _validate_* check.
+
+    Args:
+        summary (str): Success message
+        error (str): Descriptive error, None if the check passed
+        failed_rows (np.ndarray): Row positions that broke the check,
+            None for checks on the dataset as a whole
+
+    Returns:
+        dict: Check outcome
+    """
+    return {'summary': summary, 'error': error, 'failed_rows': failed_rows}
+
+
+def _validate_structure(view):
     """
     Internal function: Validate column structure.
 
@@ -107,106 +976,163 @@ def _validate_structure(df):
     Also validates column names contain only safe characters.
 
     Args:
-        df (pd.DataFrame): Data to validate
+        view (dict): Parsed view of the data (see _parse_frame)
 
-    Raises:
-        ValueError: If structure is invalid
+    Returns:
+        dict: Check outcome (see _outcome)
     """
-    print("\nValidating data structure...")
-
-    actual_columns = list(df.columns)
+    actual_columns = view['columns']
 
     # Check column structure matches expected
     if actual_columns != EXPECTED_COLUMNS:
-        raise ValueError(
+        return _outcome(error=(
             f"Data structure compromised!\n"
             f"Expected columns: {EXPECTED_COLUMNS}\n"
             f"Actual columns: {actual_columns}\n"
             f"Missing: {set(EXPECTED_COLUMNS) - set(actual_columns)}\n"
             f"Extra: {set(actual_columns) - set(EXPECTED_COLUMNS)}"
-        )
+        ))
 
     # Validate column names contain only safe characters
     # Only allow: uppercase letters, underscore
-    import re
-    safe_pattern = re.compile(r'^[A-Z_]+$')
-
     for col in actual_columns:
-        if not safe_pattern.match(col):
-            raise ValueError(
+        if not SAFE_COLUMN_PATTERN.match(col):
+            return _outcome(error=(
                 f"Invalid column name detected: '{col}'\n"
                 f"Column names must contain only uppercaseletters and underscores.\n"
                 f"Potential injection attack or data corruption."
-            )
+            ))
 
-    print(f"✓ Column structure valid: {len(EXPECTED_COLUMNS)} columns present")
-    print("✓ Column names safe: only alphanumeric and underscores")
+    return _outcome(
+        f"Column structure valid: {len(EXPECTED_COLUMNS)} columns present, "
+        f"names only uppercase letters and underscores"
+    )
 
 
-def _validate_string_data(df):
+def _validate_numeric_types(view):
+    """
+    Internal function: Validate that numeric columns hold numbers.
+
+    Text in a price, volume, TIME_UNIX or HOUR_STR column (e.g. an
+    error page or an injected value) is reported with its rows instead
+    of breaking the range checks.
+
+    Args:
+        view (dict): Parsed view of the data (see _parse_frame)
+
+    Returns:
+        dict: Check outcome (see _outcome)
+    """
+    missing = _missing_columns(view, NUMERIC_COLUMNS)
+    if missing:
+        return missing
+
+    bad = np.zeros(view['n_rows'], dtype=bool)
+    errors = []
+    for col, rows in view['unparsable'].items():
+        if len(rows) == 0:
+            continue
+        sample = view['frame'][col].iloc[int(rows[0])]
+        errors.append(
+            f"Non-numeric values in {col}: '{sample}'\n"
+            f"Found {len(rows):,} values that are not numbers.\n"
+            f"Potential injection attack or data corruption."
+        )
+        bad[rows] = True
+
+    return _outcome(
+        f"Numeric columns valid: {len(NUMERIC_COLUMNS)} columns hold "
+        f"numbers only",
+        errors[0] if errors else None,
+        np.flatnonzero(bad)
+    )
+
+
+def _validate_string_data(view):
     """
     Internal function: Validate string data values.
 
     Ensures string columns (DATE_STR, HOUR_STR) contain only safe characters.
     Protects against code injection, SQL injection, XSS attempts.
 
+    All rules for a column are checked in one vectorized pass over its
+    Arrow byte buffer: each byte is mapped to a character class once,
+    and the date format and dangerous-character rules are read off the
+    resulting class matrix.
+
     Args:
-        df (pd.DataFrame): Data to validate
+        view (dict): Parsed view of the data (see _parse_frame)
 
-    Raises:
-        ValueError: If suspicious characters detected
+    Returns:
+        dict: Check outcome (see _outcome)
     """
-    print("Validating string data safety...")
+    missing = _missing_columns(view, ['DATE_STR', 'HOUR_STR'])
+    if missing:
+        return missing
 
-    import re
+    df = view['frame']
+    errors = []
+    bad = np.zeros(view['n_rows'], dtype=bool)
 
     # Validate DATE_STR format: YYYY-MM-DD
-    date_pattern = re.compile(r'^\d{4}-\d{2}-\d{2}$')
-    invalid_dates = df[~df['DATE_STR'].astype(str).str.match(date_pattern)]
-
-    if len(invalid_dates) > 0:
-        sample = invalid_dates['DATE_STR'].iloc[0]
-        raise ValueError(
+    if 'DATE_STR' in view['numeric']:
+        invalid = np.ones(view['n_rows'], dtype=bool)
+    else:
+        data, offsets, nulls = view['strings']['DATE_STR']
+        classes, right_length = _char_classes(data, offsets, len(DATE_TEMPLATE))
+        invalid = ~right_length | nulls
+        invalid[right_length] |= (classes != DATE_TEMPLATE).any(axis=1)
+
+    if invalid.any():
+        sample = df['DATE_STR'].iloc[int(np.argmax(invalid))]
+        errors.append(
             f"Invalid DATE_STR format detected: '{sample}'\n"
             f"Expected format: YYYY-MM-DD (e.g., 2024-11-21)\n"
-            f"Found {len(invalid_dates)} invalid entries.\n"
+            f"Found {int(invalid.sum())} invalid entries.\n"
             f"Potential injection attack or data corruption."
         )
+        bad |= invalid
 
     # Validate HOUR_STR: should be 0-23
-    try:
-        hour_values = pd.to_numeric(df['HOUR_STR'], errors='coerce')
-        if hour_values.isna().any():
-            raise ValueError("Non-numeric values in HOUR_STR")
-        if (hour_values < 0).any() or (hour_values > 23).any():
-            raise ValueError("Hour values outside 0-23 range")
-    except Exception as e:
-        raise ValueError(
-            f"Invalid HOUR_STR values detected: {e}\n"
+    if 'HOUR_STR' in view['numeric']:
+        hour_values = view['numeric']['HOUR_STR']
+    else:
+        hour_values = pd.to_numeric(df['HOUR_STR'], errors='coerce').to_numpy()
+    non_numeric = np.isnan(hour_values)
+    out_of_range = (hour_values < 0) | (hour_values > 23)
+    if non_numeric.any() or out_of_range.any():
+        reason = ("Non-numeric values in HOUR_STR" if non_numeric.any()
+                  else "Hour values outside 0-23 range")
+        errors.append(
+            f"Invalid HOUR_STR values detected: {reason}\n"
             f"Expected: integers 0-23\n"
             f"Potential injection attack or data corruption."
         )
+        bad |= non_numeric | out_of_range
 
     # Check for dangerous characters in string columns
-    dangerous_chars = [
-        '<', '>', ';', '&', '|', '$', '`', '\\', '"', "'", '(', ')'
-        ]
-    string_cols = ['DATE_STR', 'HOUR_STR']
-
-    for col in string_cols:
-        col_str = df[col].astype(str)
-        for char in dangerous_chars:
-            if col_str.str.contains(re.escape(char), regex=True).any():
-                raise ValueError(
-                    f"Dangerous character '{char}' detected in {col}\n"
-                    f"This could indicate injection attack or data corruption.\n"
-                    f"Only safe alphanumeric characters and hyphens allowed."
-                )
+    # (numeric columns cannot contain any)
+    for col in ['DATE_STR', 'HOUR_STR']:
+        if col not in view['strings']:
+            continue
+        data, offsets, _ = view['strings'][col]
+        rows, found = _dangerous_chars(data, offsets)
+        if found:
+            errors.append(
+                f"Dangerous character '{found[0]}' detected in {col}\n"
+                f"This could indicate injection attack or data corruption.\n"
+                f"Only safe alphanumeric characters and hyphens allowed."
+            )
+            bad[rows] = True
 
-    print("✓ String data validated: safe formats, no injection patterns")
+    return _outcome(
+        "String data validated: safe formats, no injection patterns",
+        errors[0] if errors else None,
+        np.flatnonzero(bad)
+    )
 
 
-def _validate_price_ranges(df):
+def _validate_price_ranges(view):
     """
     Internal function: Validate price value ranges.
 
@@ -214,37 +1140,49 @@ def _validate_price_ranges(df):
     Protects against data corruption and malicious injection.
 
     Args:
-        df (pd.DataFrame): Data to validate
+        view (dict): Parsed view of the data (see _parse_frame)
 
-    Raises:
-        ValueError: If prices are invalid
+    Returns:
+        dict: Check outcome (see _outcome)
     """
-    print("Validating price ranges...")
-
     price_columns = ['OPEN_PRICE', 'HIGH_PRICE', 'LOW_PRICE', 'CLOSE_PRICE']
+    missing = _missing_columns(view, price_columns)
+    if missing:
+        return missing
+
+    max_price = view['limits']['max_price']
+    errors = []
+    bad = np.zeros(view['n_rows'], dtype=bool)
 
     for col in price_columns:
-        min_val = df[col].min()
-        max_val = df[col].max()
+        values = view['numeric'][col]
+        min_val = np.nanmin(values) if len(values) else MIN_PRICE
+        max_val = np.nanmax(values) if len(values) else max_price
 
         # Check for negative prices
         if min_val < MIN_PRICE:
-            raise ValueError(
+            errors.append(
                 f"Invalid data: {col} contains negative values (min: {
                     min_val})"
             )
+            bad |= values < MIN_PRICE
 
         # Check for suspiciously high prices
-        if max_val > MAX_PRICE:
-            raise ValueError(
+        if max_val > max_price:
+            errors.append(
                 f"Suspicious data: {col} contains values > ${
-                    MAX_PRICE:,} (max: ${max_val:,.2f})"
+                    max_price:,} (max: ${max_val:,.2f})"
             )
+            bad |= values > max_price
 
-    print(f"✓ Price ranges valid: all prices between $0 and ${MAX_PRICE:,}")
+    return _outcome(
+        f"Price ranges valid: all prices between $0 and ${max_price:,}",
+        errors[0] if errors else None,
+        np.flatnonzero(bad)
+    )
 
 
-def _validate_data_completeness(df):
+def _validate_data_completeness(view):
     """
     Internal function: Validate data completeness.
 
@@ -252,49 +1190,134 @@ def _validate_data_completeness(df):
     Protects against truncated or incomplete datasets.
 
     Args:
-        df (pd.DataFrame): Data to validate
+        view (dict): Parsed view of the data (see _parse_frame)
 
-    Raises:
-        ValueError: If dataset is incomplete
+    Returns:
+        dict: Check outcome (see _outcome)
     """
-    print("Validating data completeness...")
-
-    row_count = len(df)
+    row_count = view['n_rows']
+    min_rows = view['limits']['min_rows']
 
-    if row_count < MIN_EXPECTED_ROWS:
-        raise ValueError(
+    if row_count < min_rows:
+        return _outcome(error=(
             f"Dataset truncated: only {row_count:,} rows.\n"
-            f"Expected at least {
-                MIN_EXPECTED_ROWS:,} rows (Nov 2014 - present)"
-        )
+            f"Expected at least {min_rows:,} rows"
+            + (" (Nov 2014 - present)" if min_rows == MIN_EXPECTED_ROWS else "")
+        ))
 
-    print(f"✓ Row count valid: {row_count:,} rows (>= {MIN_EXPECTED_ROWS:,})")
+    return _outcome(
+        f"Row count valid: {row_count:,} rows (>= {min_rows:,})"
+    )
 
 
-def _validate_timestamps(df):
+def _validate_timestamps(view):
     """
     Internal function: Validate timestamp ranges.
 
-    Ensures timestamps start from expected date (Nov 2014).
+    Ensures timestamps start from the expected date (Nov 2014 unless
+    overridden in the limits).
     Protects against wrong dataset or corrupted timestamps.
 
     Args:
-        df (pd.DataFrame): Data to validate
+        view (dict): Parsed view of the data (see _parse_frame)
 
-    Raises:
-        ValueError: If timestamps are invalid
+    Returns:
+        dict: Check outcome (see _outcome)
     """
-    print("Validating timestamps...")
+    missing = _missing_columns(view, ['TIME_UNIX', 'DATE_STR'])
+    if missing:
+        return missing
+
+    time_unix = view['numeric']['TIME_UNIX']
+    limit = view['limits']['min_timestamp']
+    min_timestamp = np.nanmin(time_unix) if len(time_unix) else limit
+
+    if min_timestamp < limit:
+        return _outcome(
+            error=(
+                f"Invalid timestamps: earliest is {min_timestamp}\n"
+                f"Expected >= {limit}"
+                + (" (Nov 2014)" if limit == MIN_TIMESTAMP else "")
+            ),
+            failed_rows=np.flatnonzero(time_unix < limit)
+        )
 
-    min_timestamp = df['TIME_UNIX'].min()
+    first_date = (view['frame']['DATE_STR'].iloc[0]
+                  if view['n_rows'] else 'n/a')
+    return _outcome(
+        f"Timestamps valid: starts from {first_date}",
+        failed_rows=np.zeros(0, dtype=np.int64)
+    )
 
-    if min_timestamp < MIN_TIMESTAMP:
-        raise ValueError(
-            f"Invalid timestamps: earliest is {min_timestamp}\n"
-            f"Expected >= {MIN_TIMESTAMP} (Nov 2014)"
-        )
 
-    print(f"✓ Timestamps valid: starts from {df['DATE_STR'].iloc[0]}")
+def _missing_columns(view, columns):
+    """
+    Internal function: Failed outcome if the data lacks any of columns.
+
+    Returns:
+        dict: Check outcome naming the missing columns, or None if all
+        are present
+    """
+    missing = [col for col in columns if col not in view['columns']]
+    if not missing:
+        return None
+    return _outcome(error=(
+        f"Cannot run check: missing columns {missing}\n"
+        f"See the data structure check."
+    ))
+
+
+# Checks in run order: (name, console label, function)
+VALIDATION_CHECKS = [
+    ('structure', 'data structure', _validate_structure),
+    ('numeric_types', 'numeric columns', _validate_numeric_types),
+    ('string_data', 'string data safety', _validate_string_data),
+    ('price_ranges', 'price ranges', _validate_price_ranges),
+    ('data_completeness', 'data completeness', _validate_data_completeness),
+    ('timestamps', 'timestamps', _validate_timestamps),
+]
+
+
+def _run_check(name, func, view, row_offset=0):
+    """
+    Internal function: Run one check and measure its cost.
+
+    Wall-clock time comes from perf_counter, peak memory from
+    tracemalloc (which must already be tracing).
+
+    Args:
+        name (str): Check identifier
+        func (callable): _validate_* function
+        view (dict): Parsed view of the data (see _parse_frame)
+        row_offset (int): Position of the view's first row in the whole
+            dataset (streaming), added to sample row numbers
+
+    Returns:
+        CheckResult: Outcome, offending row count and samples, timings
+    """
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    outcome = func(view)
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+
+    rows = outcome['failed_rows']
+    sample = []
+    if rows is not None and len(rows) > 0:
+        sample_rows = view['frame'].iloc[rows[:MAX_SAMPLE_ROWS]]
+        sample = [{'row': int(pos) + row_offset, **record} for pos, record in
+                  zip(rows[:MAX_SAMPLE_ROWS], sample_rows.to_dict('records'))]
+
+    return CheckResult(
+        name=name,
+        passed=outcome['error'] is None,
+        failed_rows=None if rows is None else int(len(rows)),
+        sample_rows=sample,
+        message=outcome['error'] or outcome['summary'],
+        seconds=seconds,
+        peak_memory_mb=max(peak, 0) / 1024**2
+    )
 
 
 def get_data_info(df):
@@ -0,0 +1,222 @@
+"""
+TradeCare Resampling Module
+
+Higher-timeframe candles (N-hour, daily, weekly) from the hourly OHLCV
+data.
+
+Instead of pd.resample with per-group Python aggregators, bars are built
+from the integer TIME_UNIX values in one pass:
+- Each row's bucket is (TIME_UNIX + offset) // width, so bars are
+  aligned to UTC midnight (weekly bars to Monday 00:00 UTC; the Unix
+  epoch was a Thursday, hence the 3-day offset)
+- On the time-sorted rows, a bar starts wherever the bucket changes
+- OPEN/CLOSE are the first/last row of the bar, HIGH/LOW and the
+  volumes are segmented reductions (np.maximum.reduceat,
+  np.minimum.reduceat, np.add.reduceat) over the same start positions
+
+Missing hours are handled the way the data actually is: a bar is built
+from the hours present in its bucket (open of the first one, close of
+the last one), bar_rows counts them and complete is False when fewer
+(or, with duplicate timestamps, more) than width / interval rows fell
+in the bucket. Buckets with no rows at all produce no bar unless
+fill_gaps is set.
+
+The result keeps the raw column layout, so the cleaning, validation and
+feature code run on it unchanged. The feature windows (src.features)
+count bars: on 4h bars return_4h is the 4-bar (16-hour) return and
+volatility_24h spans 24 bars.
+
+Example:
+    >>> bars = resample(df_clean, '4h')
+    >>> df_4h = add_features(bars[bars['complete']])
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+from src.data_cleaning import HOURLY_INTERVAL
+from src.data_schema import PRICE_COLUMNS, VOLUME_COLUMNS
+from src.features import add_features
+
+
+# Seconds per timeframe unit
+UNIT_SECONDS = {'h': 3600, 'd': 86400, 'w': 7 * 86400}
+
+# Weekly buckets start on Monday: the epoch (1970-01-01) was a Thursday
+WEEK_OFFSET = 3 * 86400
+
+# Timeframe strings: a count and a unit, e.g. '4h', '1d', '1w'
+TIMEFRAME_PATTERN = re.compile(r'^(\d+)([hdw])$')
+
+# Columns added to every bar
+BAR_COLUMNS = ['bar_rows', 'complete']
+
+
+def timeframe_seconds(timeframe):
+    """
+    Width in seconds of a timeframe.
+
+    Args:
+        timeframe (str or int): '4h', '12h', '1d', '1w', ... or a number
+            of hours
+
+    Returns:
+        int: Bar width in seconds
+
+    Raises:
+        ValueError: If the timeframe cannot be parsed
+    """
+    if isinstance(timeframe, (int, np.integer)) and timeframe > 0:
+        return int(timeframe) * UNIT_SECONDS['h']
+    match = TIMEFRAME_PATTERN.match(str(timeframe).strip().lower())
+    if not match or int(match.group(1)) == 0:
+        raise ValueError(
+            f"Invalid timeframe: {timeframe!r}\n"
+            f"Expected a count and a unit, e.g. '4h', '1d' or '1w'"
+        )
+    return int(match.group(1)) * UNIT_SECONDS[match.group(2)]
+
+
+def bar_index(time_unix, timeframe):
+    """
+    Bucket number and bar open time of each timestamp.
+
+    Args:
+        time_unix (array-like): Unix seconds
+        timeframe (str or int): See timeframe_seconds
+
+    Returns:
+        tuple: (bucket, bar_start) int64 arrays; bar_start is the Unix
+        time the row's bar opens
+    """
+    width = timeframe_seconds(timeframe)
+    offset = _bucket_offset(width)
+    time_unix = np.asarray(time_unix, dtype=np.int64)
+    bucket = (time_unix + offset) // width
+    return bucket, bucket * width - offset
+
+
+def resample(df, timeframe='4h', interval=HOURLY_INTERVAL, fill_gaps=False):
+    """
+    Aggregate OHLCV rows into higher-timeframe bars.
+
+    Args:
+        df (pd.DataFrame): Cleaned data with TIME_UNIX, the four prices
+            and both volumes (DATE_STR/HOUR_STR are rebuilt if present)
+        timeframe (str or int): Bar width, e.g. '4h', '1d', '1w' (see
+            timeframe_seconds)
+        interval (int): Seconds between rows of the input
+        fill_gaps (bool): Also emit buckets without any rows (NaN
+            prices, zero volume, bar_rows 0)
+
+    Returns:
+        pd.DataFrame: One row per bar in time order: TIME_UNIX of the
+        bar open, OPEN/HIGH/CLOSE/LOW_PRICE, VOLUME_FROM/TO, timestamp,
+        bar_rows (input rows in the bar) and complete (bar_rows equals
+        the expected width / interval)
+
+    Raises:
+        ValueError: If the timeframe is invalid or not a multiple of
+            interval
+    """
+    width = timeframe_seconds(timeframe)
+    if width % interval:
+        raise ValueError(
+            f"Timeframe {timeframe!r} ({width}s) is not a multiple of the "
+            f"input interval ({interval}s)"
+        )
+    time_unix = df['TIME_UNIX'].to_numpy()
+    order = None
+    if len(time_unix) > 1 and np.any(time_unix[1:] < time_unix[:-1]):
+        order = np.argsort(time_unix, kind='stable')
+        time_unix = time_unix[order]
+    bucket, bar_start = bar_index(time_unix, timeframe)
+
+    # Bar boundaries: positions where the bucket changes
+    starts = np.flatnonzero(np.diff(bucket, prepend=bucket[:1] - 1))
+    lengths = np.diff(np.append(starts, len(bucket)))
+    ends = starts + lengths - 1
+
+    def column(name):
+        values = df[name].to_numpy()
+        return values if order is None else values[order]
+
+    bars = {
+        'TIME_UNIX': bar_start[starts].astype(df['TIME_UNIX'].dtype),
+        'OPEN_PRICE': column('OPEN_PRICE')[starts],
+        'HIGH_PRICE': np.maximum.reduceat(column('HIGH_PRICE'), starts),
+        'CLOSE_PRICE': column('CLOSE_PRICE')[ends],
+        'LOW_PRICE': np.minimum.reduceat(column('LOW_PRICE'), starts),
+    }
+    for col in VOLUME_COLUMNS:
+        bars[col] = np.add.reduceat(column(col), starts)
+    bars['bar_rows'] = lengths
+
+    if fill_gaps and len(starts):
+        bars = _fill_gaps(bars, bucket[starts], width)
+
+    out = pd.DataFrame(bars)
+    out['complete'] = out['bar_rows'].to_numpy() == width // interval
+    stamps = out['TIME_UNIX'].to_numpy().astype('datetime64[s]')
+    if 'DATE_STR' in df.columns:
+        out.insert(1, 'DATE_STR', pd.array(
+            np.datetime_as_string(stamps, unit='D'), dtype=df['DATE_STR'].dtype
+        ))
+    if 'HOUR_STR' in df.columns:
+        hours = out['TIME_UNIX'].to_numpy() // 3600 % 24
+        out.insert(2, 'HOUR_STR', hours.astype(df['HOUR_STR'].dtype))
+    out.insert(len(out.columns) - len(BAR_COLUMNS), 'timestamp',
+               stamps.astype('datetime64[ns]'))
+    return out
+
+
+def resample_features(df, timeframe='4h', interval=HOURLY_INTERVAL,
+                      complete_only=True):
+    """
+    Bars of a timeframe with the 14 features computed on them.
+
+    Args:
+        df (pd.DataFrame): Cleaned data (see resample)
+        timeframe (str or int): Bar width (see timeframe_seconds)
+        interval (int): Seconds between rows of the input
+        complete_only (bool): Drop bars missing hours before computing
+            the features (they would distort returns and ranges)
+
+    Returns:
+        pd.DataFrame: Bars plus one column per feature; windows count
+        bars of this timeframe
+    """
+    bars = resample(df, timeframe, interval)
+    if complete_only:
+        bars = bars[bars['complete'].to_numpy()].reset_index(drop=True)
+    return add_features(bars)
+
+
+def _bucket_offset(width):
+    """
+    Internal function: Seconds added before bucketing (Monday alignment
+    for weekly bars, none otherwise).
+    """
+    return WEEK_OFFSET if width % UNIT_SECONDS['w'] == 0 else 0
+
+
+def _fill_gaps(bars, buckets, width):
+    """
+    Internal function: Insert empty bars for buckets without rows.
+    """
+    offset = _bucket_offset(width)
+    every = np.arange(buckets[0], buckets[-1] + 1)
+    if len(every) == len(buckets):
+        return bars
+    present = np.searchsorted(every, buckets)
+    filled = {'TIME_UNIX': (every * width - offset).astype(bars['TIME_UNIX'].dtype)}
+    for name, values in bars.items():
+        if name == 'TIME_UNIX':
+            continue
+        empty = np.nan if name in PRICE_COLUMNS else 0
+        full = np.full(len(every), empty, dtype=values.dtype)
+        full[present] = values
+        filled[name] = full
+    return filled
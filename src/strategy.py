@@ -0,0 +1,376 @@
+"""
+TradeCare Strategy Simulation Module
+
+What the page 3 risk levels would have earned if traded. The
+classifier's probability is scored on the historical features and read
+on a grid of non-overlapping decision times, one every HOLD_HOURS
+hours. At each decision time the rule is:
+
+- probability > entry threshold ("Low Risk" at 0.65): hold a long
+  position for the next HOLD_HOURS hours
+- probability < exit threshold ("High Risk" at 0.40): be flat
+- in between ("Medium Risk"): keep the previous position
+
+Every entry and every exit pays the fee plus slippage. The "keep
+previous" state is forward-filled with a running maximum over the
+decision times, so a batch of threshold pairs is simulated as
+(pairs x periods) array operations, without a loop over trades.
+Large grids are evaluated in chunks of pairs that fit in CHUNK_BYTES.
+
+Example:
+    python -m src.strategy --step 0.01
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.data_schema import FEATURE_COLUMNS, read_features_csv
+from src.model_registry import MODELS_DIR
+from src.modeling import FEATURES_FILE, START_DATE, TARGET_HORIZON
+
+# Holding period of one decision (the models' target horizon)
+HOLD_HOURS = TARGET_HORIZON
+
+# Page 3 risk cutoffs
+ENTRY_THRESHOLD = 0.65
+EXIT_THRESHOLD = 0.40
+
+# Trading costs per side (entry or exit), as a fraction of the position
+FEE_RATE = 0.001
+SLIPPAGE_RATE = 0.0005
+
+# Working memory per batch of threshold pairs
+CHUNK_BYTES = 64 * 1024**2
+
+# Approximate bytes of intermediate arrays per (pair, period)
+_BYTES_PER_CELL = 40
+
+# Per-pair results
+RESULT_COLUMNS = ['entry', 'exit', 'total_return', 'max_drawdown', 'sharpe',
+                  'hit_rate', 'trades', 'exposure']
+
+
+def decision_grid(timestamp, close, probability, hold_hours=HOLD_HOURS):
+    """
+    Non-overlapping decision times and the return of each holding period.
+
+    Decision times are the rows whose hour is a multiple of hold_hours.
+    A period's return runs from its close to the close of the next
+    decision time; periods whose next decision time is not exactly
+    hold_hours later (data gap) or that lack a probability are dropped.
+
+    Args:
+        timestamp (array-like): Hourly datetime64 timestamps, ascending
+        close (array-like): CLOSE_PRICE per row
+        probability (array-like): Profitable-class probability per row
+        hold_hours (int): Hours per holding period
+
+    Returns:
+        dict: timestamp, probability and period_return arrays, one
+        entry per decision time
+
+    Raises:
+        ValueError: If no complete holding period remains
+    """
+    hours = np.asarray(timestamp, dtype='datetime64[h]').astype(np.int64)
+    close = np.asarray(close, dtype=np.float64)
+    probability = np.asarray(probability, dtype=np.float64)
+
+    rows = np.flatnonzero(hours % hold_hours == 0)
+    period_return = np.full(len(rows), np.nan)
+    complete = np.diff(hours[rows]) == hold_hours
+    period_return[:-1][complete] = close[rows[1:]][complete] / close[rows[:-1]][complete] - 1
+
+    keep = np.isfinite(period_return) & np.isfinite(probability[rows])
+    if not keep.any():
+        raise ValueError(
+            f"No complete {hold_hours}-hour holding period in {len(hours):,} "
+            f"rows\n"
+            f"Need two decision times (hour a multiple of {hold_hours}) "
+            f"{hold_hours} hours apart, with a probability at the first"
+        )
+    return {
+        'timestamp': np.asarray(timestamp)[rows[keep]],
+        'probability': probability[rows[keep]],
+        'period_return': period_return[keep],
+    }
+
+
+def load_strategy_inputs(data=FEATURES_FILE, models_dir=MODELS_DIR,
+                         start=START_DATE, hold_hours=HOLD_HOURS):
+    """
+    Score the features dataset and build its decision grid.
+
+    Args:
+        data (str or pd.DataFrame): Features CSV or frame (timestamp,
+            CLOSE_PRICE and FEATURE_COLUMNS)
+        models_dir (str): Models directory (current manifest version)
+        start (str): First timestamp used
+        hold_hours (int): Hours per holding period (multi-horizon
+            models must have this horizon)
+
+    Returns:
+        dict: See decision_grid
+
+    Raises:
+        ValueError: If no row is at or after start, or no complete
+            holding period remains (see decision_grid)
+    """
+    from src.model_registry import ModelRegistry
+    from src.prediction import PredictionService
+
+    df = data if isinstance(data, pd.DataFrame) \
+        else read_features_csv(data, float64=True)
+    if start is not None:
+        df = df[df['timestamp'] >= start]
+    if df.empty:
+        raise ValueError(f"No rows at or after start {start}")
+    service = PredictionService.load(ModelRegistry.from_manifest(models_dir))
+    predictions = service.predict(
+        df[FEATURE_COLUMNS].to_numpy(dtype=np.float64)
+    )
+    # Multi-horizon models: the output matching the holding period
+    column = 'probability' if service.horizons is None \
+        else f"probability_{hold_hours}h"
+    probability = predictions[column].to_numpy()
+    return decision_grid(df['timestamp'].to_numpy(), df['CLOSE_PRICE'],
+                         probability, hold_hours)
+
+
+def threshold_grid(entry_values, exit_values):
+    """
+    All (entry, exit) pairs with exit <= entry.
+
+    Args:
+        entry_values (array-like): Candidate entry thresholds
+        exit_values (array-like): Candidate exit thresholds
+
+    Returns:
+        tuple: (entry, exit) float64 arrays of equal length
+    """
+    entry, exit_ = np.meshgrid(np.asarray(entry_values, dtype=np.float64),
+                               np.asarray(exit_values, dtype=np.float64),
+                               indexing='ij')
+    valid = exit_ <= entry
+    return entry[valid], exit_[valid]
+
+
+def simulate(probability, period_return, entry=ENTRY_THRESHOLD,
+             exit=EXIT_THRESHOLD, fee=FEE_RATE, slippage=SLIPPAGE_RATE):
+    """
+    Position, returns, equity and drawdown of one threshold pair.
+
+    Args:
+        probability (np.ndarray): Probability per decision time
+        period_return (np.ndarray): Price return of each holding period
+        entry (float): Go long above this probability
+        exit (float): Go flat below this probability
+        fee (float): Fee per side
+        slippage (float): Slippage per side
+
+    Returns:
+        pd.DataFrame: position (0/1), net_return, equity (starting at 1)
+        and drawdown per decision time
+    """
+    position, _, _, log_growth = _simulate_batch(
+        np.asarray(probability, dtype=np.float64),
+        np.asarray(period_return, dtype=np.float64),
+        np.array([entry], dtype=np.float64),
+        np.array([exit], dtype=np.float64), fee + slippage
+    )
+    log_equity = np.cumsum(log_growth[0])
+    return pd.DataFrame({
+        'position': position[0].astype(np.int8),
+        'net_return': np.expm1(log_growth[0]),
+        'equity': np.exp(log_equity),
+        'drawdown': np.expm1(
+            log_equity - np.maximum.accumulate(np.maximum(log_equity, 0.0))
+        ),
+    })
+
+
+def evaluate_grid(probability, period_return, entry, exit, fee=FEE_RATE,
+                  slippage=SLIPPAGE_RATE, hold_hours=HOLD_HOURS,
+                  chunk_bytes=CHUNK_BYTES):
+    """
+    Summary metrics of many threshold pairs in batched array operations.
+
+    Args:
+        probability (np.ndarray): Probability per decision time
+        period_return (np.ndarray): Price return of each holding period
+        entry (array-like): Entry threshold per pair
+        exit (array-like): Exit threshold per pair (same length)
+        fee (float): Fee per side
+        slippage (float): Slippage per side
+        hold_hours (int): Hours per holding period (annualizes Sharpe)
+        chunk_bytes (int): Working memory per batch of pairs
+
+    Returns:
+        pd.DataFrame: One row per pair with RESULT_COLUMNS:
+        total_return and max_drawdown (fractions of starting equity),
+        annualized sharpe of the period returns, hit_rate (share of
+        trades with a positive net return, NaN without trades), trades
+        (entries) and exposure (share of periods in a position)
+    """
+    probability = np.asarray(probability, dtype=np.float64)
+    period_return = np.asarray(period_return, dtype=np.float64)
+    entry = np.atleast_1d(np.asarray(entry, dtype=np.float64))
+    exit = np.atleast_1d(np.asarray(exit, dtype=np.float64))
+    n_periods = len(probability)
+    chunk = max(1, chunk_bytes // max(n_periods * _BYTES_PER_CELL, 1))
+    annualize = np.sqrt(365 * 24 / hold_hours)
+
+    columns = {name: np.empty(len(entry)) for name in RESULT_COLUMNS[2:]}
+    for start in range(0, len(entry), chunk):
+        stop = min(start + chunk, len(entry))
+        position, entries, exits, log_growth = _simulate_batch(
+            probability, period_return, entry[start:stop], exit[start:stop],
+            fee + slippage
+        )
+        log_equity = np.cumsum(log_growth, axis=1)
+        running_peak = np.maximum.accumulate(log_equity, axis=1)
+        np.maximum(running_peak, 0.0, out=running_peak)
+
+        net_return = np.expm1(log_growth)
+        std = net_return.std(axis=1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            sharpe = net_return.mean(axis=1) / std * annualize
+        sharpe[std == 0] = np.nan
+
+        trades, wins = _trade_counts(entries, exits, log_growth, log_equity)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            hit_rate = wins / trades
+
+        part = slice(start, stop)
+        columns['total_return'][part] = np.expm1(log_equity[:, -1])
+        columns['max_drawdown'][part] = np.expm1((log_equity - running_peak).min(axis=1))
+        columns['sharpe'][part] = sharpe
+        columns['hit_rate'][part] = hit_rate
+        columns['trades'][part] = trades
+        columns['exposure'][part] = position.mean(axis=1)
+
+    results = pd.DataFrame({'entry': entry, 'exit': exit, **columns})
+    results['trades'] = results['trades'].astype(np.int64)
+    return results
+
+
+def _simulate_batch(probability, period_return, entry, exit, cost):
+    """
+    Internal function: Positions and log growth of a batch of pairs.
+
+    Returns:
+        tuple: position, entries and exits (pairs, periods) bool arrays
+        (entries/exits mark a trade's first/last period) and log_growth
+        (pairs, periods) float64, the log of each period's equity
+        multiple after costs
+    """
+    n_periods = len(probability)
+    enter = probability > entry[:, None]
+    decided = enter | (probability < exit[:, None])
+
+    # Forward-fill the last decision: encoded as 2 * period + enter, the
+    # running maximum is the latest decision and its parity the position
+    # (0 before the first decision: flat)
+    code_type = np.int32 if n_periods < 2**30 else np.int64
+    codes = np.where(decided, 2 * np.arange(n_periods, dtype=code_type) + enter,
+                     code_type(0))
+    np.maximum.accumulate(codes, axis=1, out=codes)
+    position = (codes & 1).astype(bool)
+
+    # Entry cost at a trade's first period, exit cost at its last
+    # (an open position is closed after the final period)
+    entries = position.copy()
+    entries[:, 1:] &= ~position[:, :-1]
+    exits = position.copy()
+    exits[:, :-1] &= ~position[:, 1:]
+
+    log_growth = position * np.log1p(period_return)
+    log_growth += (entries.view(np.int8) + exits.view(np.int8)) * np.log1p(-cost)
+    return position, entries, exits, log_growth
+
+
+def _trade_counts(entries, exits, log_growth, log_equity):
+    """
+    Internal function: Trades and winning trades per pair.
+
+    A trade's log return is the log equity at its last period minus the
+    log equity before its first. Boolean indexing visits the entries and
+    exits row by row in time order, so they pair up.
+    """
+    trades = entries.sum(axis=1)
+    before = log_equity[entries] - log_growth[entries]
+    won = log_equity[exits] - before > 0
+    rows = np.repeat(np.arange(len(entries)), trades)
+    wins = np.bincount(rows, weights=won, minlength=len(entries))
+    return trades, wins
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Simulate the classifier's risk thresholds as a strategy"
+    )
+    parser.add_argument('--data', default=FEATURES_FILE,
+                        help="Features CSV (default: %(default)s)")
+    parser.add_argument('--models-dir', default=MODELS_DIR,
+                        help="Models directory (default: %(default)s)")
+    parser.add_argument('--start', default=START_DATE,
+                        help="First timestamp used (default: %(default)s)")
+    parser.add_argument('--fee', type=float, default=FEE_RATE,
+                        help="Fee per side (default: %(default)s)")
+    parser.add_argument('--slippage', type=float, default=SLIPPAGE_RATE,
+                        help="Slippage per side (default: %(default)s)")
+    parser.add_argument('--step', type=float, default=0.01,
+                        help="Threshold grid step (default: %(default)s)")
+    parser.add_argument('--top', type=int, default=10,
+                        help="Pairs listed (default: %(default)s)")
+    parser.add_argument('--output', help="Write the grid results (.csv or "
+                                         ".parquet)")
+    args = parser.parse_args()
+
+    inputs = load_strategy_inputs(args.data, args.models_dir, args.start)
+    values = np.round(np.arange(0.0, 1.0 + args.step / 2, args.step), 6)
+    entry, exit_ = threshold_grid(values, values)
+
+    started = time.perf_counter()
+    results = evaluate_grid(inputs['probability'], inputs['period_return'],
+                            entry, exit_, fee=args.fee, slippage=args.slippage)
+    elapsed = time.perf_counter() - started
+
+    print("=" * 60)
+    print("THRESHOLD STRATEGY SIMULATION")
+    print("=" * 60)
+    print(f"✓ {len(results):,} threshold pairs x "
+          f"{len(inputs['probability']):,} periods in {elapsed:.2f}s")
+    print(f"  Period: {pd.Timestamp(inputs['timestamp'][0])} to "
+          f"{pd.Timestamp(inputs['timestamp'][-1])} ({HOLD_HOURS}h holds)")
+    print(f"  Costs per side: fee {args.fee:.2%}, slippage {args.slippage:.2%}")
+
+    page3 = evaluate_grid(inputs['probability'], inputs['period_return'],
+                          ENTRY_THRESHOLD, EXIT_THRESHOLD, fee=args.fee,
+                          slippage=args.slippage)
+    buy_and_hold = np.prod(1 + inputs['period_return']) - 1
+    print("-" * 60)
+    print(f"  Page 3 cutoffs ({ENTRY_THRESHOLD}/{EXIT_THRESHOLD}): "
+          f"return {page3['total_return'].iloc[0]:.2%}, "
+          f"max drawdown {page3['max_drawdown'].iloc[0]:.2%}, "
+          f"{page3['trades'].iloc[0]} trades")
+    print(f"  Buy and hold: return {buy_and_hold:.2%}")
+    print("-" * 60)
+    print(f"  Top {args.top} by Sharpe:")
+    print(results.sort_values('sharpe', ascending=False).head(args.top)
+          .to_string(index=False, float_format=lambda v: f"{v:.4f}"))
+    print("=" * 60)
+
+    if args.output:
+        if args.output.endswith('.parquet'):
+            results.to_parquet(args.output, index=False)
+        else:
+            results.to_csv(args.output, index=False)
+        print(f"✓ Grid results saved: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,315 @@
+"""
+TradeCare Training Module
+
+Headless version of 4_ModelTraining.ipynb: load bitcoin_features.csv,
+split chronologically, scale, fit BR1 (LinearRegression) and BR2
+(LogisticRegression), evaluate, and publish the four pickles plus the
+metrics manifest (src.model_registry.publish_models).
+
+With horizons (e.g. --horizons 1 4 12 24) the targets are every
+horizon's return from CLOSE_PRICE as one (n, h) array, and both models
+are multi-output: one LinearRegression and one LogisticRegression per
+horizon, served as a single folded matrix product (LinearBundle).
+
+The scaled train/test matrices are built once and cached as an .npz
+in inputs/datasets/cache/, keyed by the SHA-256 of the features file
+and the split settings. Retraining on unchanged data skips the CSV
+parse and the scaling. The two models are fitted at the same time in
+separate processes; each worker reads the cached arrays itself instead
+of receiving a pickled copy.
+
+Example:
+    python -m src.train
+    python -m src.train --data inputs/datasets/processed/bitcoin_features.csv --version 2
+    python -m src.train --horizons 1 4 12 24
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from sklearn.preprocessing import StandardScaler
+from threadpoolctl import threadpool_limits
+
+from src.data_schema import FEATURE_COLUMNS
+from src.model_registry import MODELS_DIR, file_sha256, publish_models
+from src.modeling import (
+    CLASSIFICATION_METRICS, FEATURES_FILE, LOGISTIC_PARAMS,
+    REGRESSION_METRICS, START_DATE, TEST_SIZE, evaluate, evaluate_horizons,
+    fit_classification, fit_regression, fit_scaler, load_design_matrix,
+    scale, split_index
+)
+
+# Cached design matrices
+DESIGN_CACHE_DIR = 'inputs/datasets/cache'
+DESIGN_CACHE_PREFIX = 'design_'
+
+# Arrays stored in a design cache file
+DESIGN_ARRAYS = ['X_train', 'X_test', 'y_return_train', 'y_return_test',
+                 'y_class_train', 'y_class_test', 'scaler_mean',
+                 'scaler_var', 'scaler_scale', 'scaler_n_samples']
+
+
+def build_design(data=FEATURES_FILE, start=START_DATE, test_size=TEST_SIZE,
+                 cache_dir=DESIGN_CACHE_DIR, use_cache=True, horizons=None):
+    """
+    Scaled train/test matrices of the notebook split, cached on disk.
+
+    Args:
+        data (str): Features CSV
+        start (str): First timestamp used
+        test_size (float): Chronological hold-out fraction
+        cache_dir (str): Directory of the .npz cache (None disables it)
+        use_cache (bool): Reuse an existing cache file
+        horizons (list): Multi-horizon targets (see load_design_matrix)
+
+    Returns:
+        tuple: (design, scaler, cache_path) - design is a dict of the
+        DESIGN_ARRAYS, scaler the fitted StandardScaler, cache_path the
+        .npz or None
+    """
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = os.path.join(
+            cache_dir,
+            f"{DESIGN_CACHE_PREFIX}{_design_key(data, start, test_size, horizons)}.npz"
+        )
+        if use_cache and os.path.exists(cache_path):
+            design = load_design(cache_path)
+            return design, _scaler_from_design(design), cache_path
+
+    matrix = load_design_matrix(data, start=start, horizons=horizons)
+    split = split_index(len(matrix['X']), test_size)
+    scaler = fit_scaler(matrix['X'][:split])
+    design = {
+        'X_train': scale(scaler, matrix['X'][:split]),
+        'X_test': scale(scaler, matrix['X'][split:]),
+        'y_return_train': matrix['y_return'][:split],
+        'y_return_test': matrix['y_return'][split:],
+        'y_class_train': matrix['y_class'][:split],
+        'y_class_test': matrix['y_class'][split:],
+        'scaler_mean': scaler.mean_,
+        'scaler_var': scaler.var_,
+        'scaler_scale': scaler.scale_,
+        'scaler_n_samples': np.asarray(scaler.n_samples_seen_),
+    }
+    if cache_path is not None:
+        _write_design(design, cache_path)
+    return design, scaler, cache_path
+
+
+def load_design(cache_path):
+    """
+    Read a design cache file.
+
+    Args:
+        cache_path (str): .npz written by build_design
+
+    Returns:
+        dict: DESIGN_ARRAYS
+    """
+    with np.load(cache_path) as archive:
+        return {name: archive[name] for name in DESIGN_ARRAYS}
+
+
+def train_models(data=FEATURES_FILE, start=START_DATE, test_size=TEST_SIZE,
+                 models_dir=MODELS_DIR, version=None, workers=2,
+                 cache_dir=DESIGN_CACHE_DIR, use_cache=True, publish=True,
+                 horizons=None, verbose=True):
+    """
+    Fit, evaluate and publish both models.
+
+    Args:
+        data (str): Features CSV
+        start (str): First timestamp used
+        test_size (float): Chronological hold-out fraction
+        models_dir (str): Models directory to publish into
+        version (str): Version label (default: next version)
+        workers (int): 2 fits the models in parallel processes, 1 in
+            this process
+        cache_dir (str): Design cache directory (None disables it)
+        use_cache (bool): Reuse an existing design cache
+        publish (bool): Write the pickles and the manifest
+        horizons (list): Train multi-output models for these horizons
+            (default: the notebook's single 4-hour target)
+        verbose (bool): Print progress
+
+    Returns:
+        dict: regression_model, classification_model, scaler, metrics,
+        manifest (None if not published) and seconds per stage
+    """
+    seconds = {}
+    started = time.perf_counter()
+    design, scaler, cache_path = build_design(data, start, test_size,
+                                              cache_dir, use_cache, horizons)
+    seconds['design'] = time.perf_counter() - started
+    if verbose:
+        print(f"✓ Design matrix ready ({seconds['design']:.2f}s)")
+        print(f"  Train: {design['X_train'].shape}, Test: {design['X_test'].shape}")
+        if cache_path:
+            print(f"  Cache: {cache_path}")
+
+    started = time.perf_counter()
+    if workers > 1 and cache_path is not None:
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            regression = pool.submit(_fit_cached, 'regression', cache_path)
+            classification = pool.submit(_fit_cached, 'classification',
+                                         cache_path)
+            regression_model = regression.result()
+            classification_model = classification.result()
+    else:
+        regression_model = fit_regression(design['X_train'],
+                                          design['y_return_train'])
+        classification_model = fit_classification(design['X_train'],
+                                                  design['y_class_train'])
+    seconds['fit'] = time.perf_counter() - started
+    if verbose:
+        print(f"✓ Models trained ({seconds['fit']:.2f}s)")
+        outputs = '' if horizons is None else \
+            f" x {len(horizons)} horizons ({', '.join(f'{h}h' for h in horizons)})"
+        print(f"  BR1: LinearRegression{outputs}")
+        print(f"  BR2: LogisticRegression"
+              f"(max_iter={LOGISTIC_PARAMS['max_iter']}, "
+              f"random_state={LOGISTIC_PARAMS['random_state']}){outputs}")
+
+    if horizons is None:
+        scores = {None: evaluate(
+            regression_model, classification_model, design['X_test'],
+            design['y_return_test'], design['y_class_test']
+        )}
+    else:
+        scores = evaluate_horizons(
+            regression_model, classification_model, design['X_test'],
+            design['y_return_test'], design['y_class_test'], horizons
+        )
+    metrics = {
+        group: {_metric_key(name, horizon): values[name]
+                for horizon, values in scores.items() for name in names}
+        for group, names in [('regression', REGRESSION_METRICS),
+                             ('classification', CLASSIFICATION_METRICS)]
+    }
+    if verbose:
+        print("✓ Test metrics")
+        for group in metrics.values():
+            for name, value in group.items():
+                print(f"  {name}: {value:.4f}")
+
+    manifest = None
+    if publish:
+        manifest = publish_models(
+            regression_model, classification_model, scaler, FEATURE_COLUMNS,
+            models_dir=models_dir, version=version, metrics=metrics,
+            training_data=data, horizons=horizons,
+        )
+        if verbose:
+            print(f"✓ Model version {manifest['version']} published: "
+                  f"{models_dir}/manifest.json")
+
+    return {
+        'regression_model': regression_model,
+        'classification_model': classification_model,
+        'scaler': scaler,
+        'metrics': metrics,
+        'manifest': manifest,
+        'seconds': seconds,
+    }
+
+
+def _fit_cached(kind, cache_path):
+    """
+    Internal function: Fit one model in a worker from the design cache.
+    """
+    design = load_design(cache_path)
+    # Two workers share the cores; keep BLAS to one thread each
+    with threadpool_limits(limits=1):
+        if kind == 'regression':
+            return fit_regression(design['X_train'], design['y_return_train'])
+        return fit_classification(design['X_train'], design['y_class_train'])
+
+
+def _metric_key(name, horizon):
+    """
+    Internal function: Manifest metric name, e.g. test_r2 or test_r2_4h.
+    """
+    return f"test_{name}" if horizon is None else f"test_{name}_{horizon}h"
+
+
+def _design_key(data, start, test_size, horizons=None):
+    """
+    Internal function: Cache key of a dataset and split settings.
+    """
+    settings = json.dumps({
+        'data_sha256': file_sha256(data),
+        'start': start,
+        'test_size': test_size,
+        'features': FEATURE_COLUMNS,
+        'horizons': horizons,
+    }, sort_keys=True)
+    return hashlib.sha256(settings.encode()).hexdigest()[:16]
+
+
+def _write_design(design, cache_path):
+    """
+    Internal function: Atomically write a design cache file.
+    """
+    os.makedirs(os.path.dirname(cache_path) or '.', exist_ok=True)
+    tmp_path = cache_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        np.savez(f, **{name: np.ascontiguousarray(design[name])
+                       for name in DESIGN_ARRAYS})
+    os.replace(tmp_path, cache_path)
+
+
+def _scaler_from_design(design):
+    """
+    Internal function: StandardScaler restored from cached statistics.
+    """
+    scaler = StandardScaler()
+    scaler.mean_ = np.array(design['scaler_mean'])
+    scaler.var_ = np.array(design['scaler_var'])
+    scaler.scale_ = np.array(design['scaler_scale'])
+    scaler.n_samples_seen_ = int(design['scaler_n_samples'])
+    scaler.n_features_in_ = len(FEATURE_COLUMNS)
+    scaler.feature_names_in_ = np.array(FEATURE_COLUMNS, dtype=object)
+    return scaler
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Train and publish the BR1/BR2 models"
+    )
+    parser.add_argument('--data', default=FEATURES_FILE,
+                        help="Features CSV (default: %(default)s)")
+    parser.add_argument('--start', default=START_DATE,
+                        help="First timestamp used (default: %(default)s)")
+    parser.add_argument('--models-dir', default=MODELS_DIR,
+                        help="Models directory (default: %(default)s)")
+    parser.add_argument('--version', help="Version label (default: next)")
+    parser.add_argument('--horizons', type=int, nargs='+',
+                        help="Train multi-output models for these horizons "
+                             "(hours ahead, e.g. 1 4 12 24)")
+    parser.add_argument('--workers', type=int, default=2, choices=[1, 2])
+    parser.add_argument('--rebuild', action='store_true',
+                        help="Ignore the cached design matrix")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="Train and evaluate without publishing")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("TRADECARE MODEL TRAINING")
+    print("=" * 60)
+    started = time.perf_counter()
+    train_models(args.data, start=args.start, models_dir=args.models_dir,
+                 version=args.version, workers=args.workers,
+                 use_cache=not args.rebuild, publish=not args.dry_run,
+                 horizons=args.horizons)
+    print(f"✓ Done in {time.perf_counter() - started:.2f}s")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+"""
+TradeCare Validation Report
+
+Structured results of the raw data validation checks.
+
+Each check records whether it passed, how many rows broke it, a few
+sample bad rows, and its wall-clock time and peak memory, so scheduled
+jobs can see which check failed or is slow without parsing console
+output. Reports serialize to plain JSON.
+"""
+
+import json
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+
+
+# Number of offending rows kept per failed check
+MAX_SAMPLE_ROWS = 5
+
+
+@dataclass
+class CheckResult:
+    """
+    Outcome of a single validation check.
+
+    Attributes:
+        name (str): Check identifier (e.g. 'price_ranges')
+        passed (bool): True if the check found no problems
+        failed_rows (int): Rows that broke the check (None for checks on
+            the whole dataset, such as structure or row count)
+        sample_rows (list): Up to MAX_SAMPLE_ROWS offending rows as dicts
+        message (str): Success summary or descriptive error
+        seconds (float): Wall-clock time of the check
+        peak_memory_mb (float): Peak Python/NumPy heap growth during the
+            check
+    """
+    name: str
+    passed: bool
+    failed_rows: int = None
+    sample_rows: list = field(default_factory=list)
+    message: str = ''
+    seconds: float = 0.0
+    peak_memory_mb: float = 0.0
+
+
+@dataclass
+class ValidationReport:
+    """
+    Results of one validation run over a dataset.
+
+    Attributes:
+        source (str): Where the validated data came from
+        rows (int): Number of rows validated
+        collect_all (bool): True if every check ran regardless of failures
+        cached (bool): True if data was served from the cache and no
+            check had to run
+        parse_seconds (float): Time to build the shared parsed view
+        checks (list): CheckResult per check, in run order
+        created_at (str): ISO timestamp of the run
+    """
+    source: str = None
+    rows: int = 0
+    collect_all: bool = False
+    cached: bool = False
+    parse_seconds: float = 0.0
+    checks: list = field(default_factory=list)
+    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+
+    @property
+    def passed(self):
+        """
+        True if every check that ran passed.
+        """
+        return all(check.passed for check in self.checks)
+
+    @property
+    def failures(self):
+        """
+        CheckResult of every failed check.
+        """
+        return [check for check in self.checks if not check.passed]
+
+    @property
+    def total_seconds(self):
+        """
+        Parse time plus the time of every check.
+        """
+        return self.parse_seconds + sum(c.seconds for c in self.checks)
+
+    def to_dict(self):
+        """
+        Convert to a JSON-serializable dict.
+        """
+        report = asdict(self)
+        report['passed'] = self.passed
+        report['total_seconds'] = self.total_seconds
+        return report
+
+    def to_json(self, **kwargs):
+        """
+        Serialize to a JSON string (kwargs go to json.dumps).
+        """
+        return json.dumps(self.to_dict(), default=str, **kwargs)
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Rebuild a report from to_dict() output.
+        """
+        data = dict(data)
+        data.pop('passed', None)
+        data.pop('total_seconds', None)
+        data['checks'] = [CheckResult(**c) for c in data.get('checks', [])]
+        return cls(**data)
+
+    def summary(self):
+        """
+        One line per check with status, failed rows and timings.
+
+        Returns:
+            str: Human-readable table
+        """
+        lines = [f"{'check':<20} {'status':<6} {'failed':>8} "
+                 f"{'ms':>9} {'peak MB':>8}"]
+        for check in self.checks:
+            failed = '-' if check.failed_rows is None else f"{check.failed_rows:,}"
+            lines.append(
+                f"{check.name:<20} {'PASS' if check.passed else 'FAIL':<6} "
+                f"{failed:>8} {check.seconds * 1000:>9.2f} "
+                f"{check.peak_memory_mb:>8.2f}"
+            )
+        return "\n".join(lines)
+
+
+class DataValidationError(ValueError):
+    """
+    Raised when data fails validation.
+
+    Subclasses ValueError so existing callers keep working; the full
+    ValidationReport is available as the report attribute.
+    """
+
+    def __init__(self, message, report):
+        super().__init__(message)
+        self.report = report
@@ -0,0 +1,56 @@
+"""
+Tests for the batch and streaming feature computations.
+
+Usage (from the project root):
+    python -m unittest discover tests
+"""
+
+import unittest
+
+import numpy as np
+
+from src.features import StreamingFeatures, compute_features
+
+
+def _random_bars(n, seed=0):
+    """
+    Internal function: Random-walk close/high/low/volume arrays.
+    """
+    rng = np.random.default_rng(seed)
+    close = 50000 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    high = close * (1 + rng.uniform(0, 0.01, n))
+    low = close * (1 - rng.uniform(0, 0.01, n))
+    volume = rng.lognormal(6, 1, n)
+    return close, high, low, volume
+
+
+class StreamingFeaturesTest(unittest.TestCase):
+
+    def assert_matches_batch(self, close, high, low, volume):
+        expected = compute_features(close, high, low, volume)
+        engine = StreamingFeatures()
+        streamed = np.array([engine.update_values(*bar)
+                             for bar in zip(close, high, low, volume)])
+        np.testing.assert_allclose(streamed, expected, rtol=1e-9,
+                                   atol=1e-12, equal_nan=True)
+
+    def test_matches_batch(self):
+        self.assert_matches_batch(*_random_bars(2000))
+
+    def test_zero_volume_run(self):
+        # A window of only zero volumes has volume_ratio 0/0 = NaN,
+        # not 0 from rounding residue in the running sum
+        close, high, low, volume = _random_bars(2000, seed=7)
+        volume[500:530] = 0
+        volume[1500:1510] = 0
+        self.assert_matches_batch(close, high, low, volume)
+
+    def test_flat_price_run(self):
+        # No gains and no losses over the RSI period: RSI is NaN
+        close, high, low, volume = _random_bars(2000, seed=3)
+        close[800:830] = close[800]
+        self.assert_matches_batch(close, high, low, volume)
+
+
+if __name__ == '__main__':
+    unittest.main()
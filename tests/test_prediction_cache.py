@@ -0,0 +1,41 @@
+"""
+Tests for the page 3 prediction cache key.
+
+Usage (from the project root):
+    python -m unittest discover tests
+"""
+
+import unittest
+
+from app_pages.page3_project_price_trade_predictor import INPUT_STEPS
+from src.prediction_cache import quantize_inputs
+
+
+# Default page inputs: returns, RSI, price and MAs, volume, volatility
+DEFAULT_INPUTS = [0.0, 0.0, 0.0, 0.0, 50.0,
+                  50000, 49500, 49000, 48000,
+                  0.0, 1.0, 0.02, 0.02]
+
+# Positions of the current price and the three moving averages
+PRICE_INPUTS = range(5, 9)
+
+
+class CacheKeyTest(unittest.TestCase):
+
+    def test_typed_prices_get_distinct_keys(self):
+        # number_input does not snap typed values to its step
+        for i in PRICE_INPUTS:
+            a, b = list(DEFAULT_INPUTS), list(DEFAULT_INPUTS)
+            a[i], b[i] = 49550, 49560
+            self.assertNotEqual(quantize_inputs(a, INPUT_STEPS),
+                                quantize_inputs(b, INPUT_STEPS))
+
+    def test_slider_float_noise_shares_key(self):
+        a, b = list(DEFAULT_INPUTS), list(DEFAULT_INPUTS)
+        a[0], b[0] = 0.3, 0.1 + 0.2
+        self.assertEqual(quantize_inputs(a, INPUT_STEPS),
+                         quantize_inputs(b, INPUT_STEPS))
+
+
+if __name__ == '__main__':
+    unittest.main()
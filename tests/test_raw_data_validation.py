@@ -0,0 +1,56 @@
+"""
+Tests for the incremental Parquet ingest.
+
+Usage (from the project root):
+    python -m unittest discover tests
+"""
+
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+from benchmarks.synthetic_data import make_raw_ohlcv
+from src.raw_data_validation import (DataValidationError,
+                                     VALIDATION_LIMITS,
+                                     fetch_and_validate_data)
+
+
+class IncrementalIngestTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.csv = os.path.join(tmp.name, 'raw.csv')
+        self.cache_dir = os.path.join(tmp.name, 'cache')
+        raw = make_raw_ohlcv(VALIDATION_LIMITS['min_rows'] + 2, seed=1)
+        # Hold back the last row to append later
+        raw.iloc[:-1].to_csv(self.csv, index=False)
+        self.next_line = raw.iloc[-1:].to_csv(index=False, header=False)
+        self.rows = len(self.ingest())
+
+    def ingest(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return fetch_and_validate_data(self.csv, cache_dir=self.cache_dir,
+                                           incremental=True)
+
+    def append(self, line):
+        with open(self.csv, 'a') as f:
+            f.write(line)
+
+    def test_appended_row(self):
+        self.append(self.next_line)
+        self.assertEqual(len(self.ingest()), self.rows + 1)
+
+    def test_malformed_time_unix(self):
+        # Text in TIME_UNIX fails the numeric check with a report
+        self.append('oops' + self.next_line[self.next_line.index(','):])
+        with self.assertRaises(DataValidationError) as caught:
+            self.ingest()
+        failed = [check.name for check in caught.exception.report.failures]
+        self.assertEqual(failed, ['numeric_types'])
+
+
+if __name__ == '__main__':
+    unittest.main()
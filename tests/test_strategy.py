@@ -0,0 +1,41 @@
+"""
+Tests for the strategy decision grid.
+
+Usage (from the project root):
+    python -m unittest discover tests
+"""
+
+import unittest
+
+import numpy as np
+
+from src.strategy import decision_grid
+
+
+def _hours(start, n):
+    """
+    Internal function: n consecutive hourly timestamps from start.
+    """
+    return np.datetime64(start, 'h') + np.arange(n)
+
+
+class DecisionGridTest(unittest.TestCase):
+
+    def test_period_returns(self):
+        grid = decision_grid(_hours('2020-01-01T00', 9), np.arange(1, 10.0),
+                             np.full(9, 0.5))
+        np.testing.assert_allclose(grid['period_return'], [4.0, 0.8])
+
+    def test_no_complete_period(self):
+        # 01:00-06:00 holds one decision time (04:00) and no next one
+        with self.assertRaises(ValueError):
+            decision_grid(_hours('2020-01-01T01', 6), np.arange(1, 7.0),
+                          np.full(6, 0.5))
+
+    def test_empty_input(self):
+        with self.assertRaises(ValueError):
+            decision_grid(_hours('2020-01-01T00', 0), [], [])
+
+
+if __name__ == '__main__':
+    unittest.main()